@@ -14,6 +14,8 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 
+from MicrobialScope_api.constant import MEDIA_DATA_DIR, NEW_MEDIA_DATA_DIR
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(os.path.join(BASE_DIR, '.env'))
@@ -156,7 +158,64 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',
-    }
+    },
+    # 表格接口的响应缓存，所有 worker 共享；存放在 PostgreSQL 中，部署时需先执行 python manage.py createcachetable
+    'table_responses': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'table_response_cache',
+        'TIMEOUT': 60 * 60,
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+TABLE_RESPONSE_CACHE_TIMEOUT = 60 * 60
+
+# 无过滤条件且估计行数超过该值的表使用 PostgreSQL 规划器估计值作为总数
+TABLE_COUNT_ESTIMATE_THRESHOLD = 1000000
+
+# 每个进程内解析后TSV文件的LRU缓存上限 (按解析结果估计的内存占用计)，超过单文件上限的结果不缓存
+PARSED_FILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PARSED_FILE_CACHE_MAX_ENTRY_BYTES = 16 * 1024 * 1024
+
+# 异步导出任务的产物目录与每个进程的后台线程数
+EXPORT_JOB_DIR = os.path.join(BASE_DIR, 'workspace', 'export_jobs')
+EXPORT_JOB_WORKERS = 2
+
+# 基因组详情聚合接口中并发读取 TSV 面板的线程数 (每个进程)
+GENOME_BUNDLE_WORKERS = 4
+
+# 基因组 FASTA 接口 region 模式一次最多返回的碱基数
+FASTA_REGION_MAX_LENGTH = 1000000
+
+# 基因组浏览器轨道文件目录 (build_GenomeTracks 生成)；窗口不超过 GENOME_TRACK_FEATURE_MAX_WINDOW 且
+# 要素不超过 GENOME_TRACK_MAX_FEATURES 时返回要素本身，否则返回不超过 GENOME_TRACK_MAX_BINS 个分箱的计数
+GENOME_TRACK_DIR = os.path.join(BASE_DIR, 'workspace', 'genome_tracks')
+GENOME_TRACK_FEATURE_MAX_WINDOW = 100000
+GENOME_TRACK_MAX_FEATURES = 1000
+GENOME_TRACK_MAX_BINS = 500
+# 每个进程在后台生成缺失或过期轨道文件的线程数
+GENOME_TRACK_BUILD_WORKERS = 1
+
+# 基因组区间重叠查询每类注释最多返回的条数，超出时标记 truncated
+GENOME_OVERLAP_MAX_RESULTS = 1000
+
+# 蛋白序列相似性搜索的 k-mer / minimizer 索引目录 (build_ProteinSearchIndex 生成)；
+# 每次查询取共享 minimizer 最多的 PROTEIN_SEARCH_CANDIDATES 个候选蛋白，其中同一对角线上
+# k-mer 匹配最多的 PROTEIN_SEARCH_ALIGNMENTS 个做比对打分；
+# 出现在超过 PROTEIN_SEARCH_MAX_POSTINGS 个蛋白中的 k-mer 不参与候选
+PROTEIN_SEARCH_INDEX_DIR = os.path.join(BASE_DIR, 'workspace', 'protein_search')
+PROTEIN_SEARCH_CANDIDATES = 200
+PROTEIN_SEARCH_ALIGNMENTS = 50
+PROTEIN_SEARCH_MAX_POSTINGS = 200000
+PROTEIN_SEARCH_MAX_QUERY_LENGTH = 10000
+
+# 基因组等大文件的发送方式: 'django' 由应用以 Range 请求 + sendfile 发送，
+# 'x-accel-redirect' (nginx) / 'x-sendfile' (Apache) 交给前端代理发送
+FILE_SERVING_BACKEND = 'django'
+# x-accel-redirect 时文件目录 -> nginx internal location 前缀
+FILE_SERVING_INTERNAL_LOCATIONS = {
+    MEDIA_DATA_DIR: '/protected/data/',
+    NEW_MEDIA_DATA_DIR: '/protected/new_data/',
 }
 
 CRONJOBS = [
@@ -0,0 +1,76 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("archaea_database", "0011_remove_magarchaeacrisprcas_consensus_prediction_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="ma_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="ma_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="uma_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="uma_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="ma_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="ma_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="ma_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="uma_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="uma_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="uma_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
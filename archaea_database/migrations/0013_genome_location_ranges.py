@@ -0,0 +1,226 @@
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("archaea_database", "0012_search_trigram_indexes"),
+    ]
+
+    operations = [
+        # GiST operator classes for the plain genome id and contig_id columns of the indexes
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="magarchaeaprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeatrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeacrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeacrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeaanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeasecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeasignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeavirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeaantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magarchaeatransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeaprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeatrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeacrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeacrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeaanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeasecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeasignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeavirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeaantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagarchaeatransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeatrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeacrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeasecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeasignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeavirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeatransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="ma_tmh_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeatrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeacrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeasecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeasignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeavirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeatransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["archaea_id", "contig_id", "location"], name="uma_tmh_location_gist_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("archaea_database", "0013_genome_location_ranges"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=models.Index(fields=["organism_name", "id"], name="ma_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=models.Index(fields=["species", "id"], name="ma_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=models.Index(fields=["total_sequence_length", "id"], name="ma_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaea",
+            index=models.Index(fields=["gc_content", "id"], name="ma_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=models.Index(fields=["archaea_id", "id"], name="ma_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magarchaeaprotein",
+            index=models.Index(fields=["protein_id", "id"], name="ma_protein_protein_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=models.Index(fields=["organism_name", "id"], name="uma_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=models.Index(fields=["species", "id"], name="uma_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=models.Index(fields=["total_sequence_length", "id"], name="uma_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaea",
+            index=models.Index(fields=["gc_content", "id"], name="uma_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=models.Index(fields=["archaea_id", "id"], name="uma_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeaprotein",
+            index=models.Index(fields=["protein_id", "id"], name="uma_protein_protein_keyset_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("archaea_database", "0014_keyset_sort_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magarchaeacrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="ma_crispr_location_gist_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagarchaeacrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="uma_crispr_location_gist_idx"),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 
-from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.fields import ArrayField, BigIntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
 
 
 # MAG Archaea Models
@@ -31,6 +31,12 @@ class MAGArchaea(models.Model):
         verbose_name_plural = "MAG Archaea Genomes"
         indexes = [
             GinIndex(fields=['archaea_id'], name='ma_archaea_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='ma_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='ma_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='ma_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='ma_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='ma_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='ma_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -81,6 +87,7 @@ class MAGArchaeaProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -115,6 +122,12 @@ class MAGArchaeaProtein(models.Model):
         verbose_name_plural = "MAG Archaea Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='ma_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='ma_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='ma_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='ma_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_protein_location_gist_idx'),
+            models.Index(fields=['archaea_id', 'id'], name='ma_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='ma_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -133,6 +146,7 @@ class MAGArchaeaTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -141,6 +155,9 @@ class MAGArchaeaTRNA(models.Model):
     class Meta:
         verbose_name = "MAG Archaea tRNA Annotation"
         verbose_name_plural = "MAG Archaea tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -152,6 +169,7 @@ class MAGArchaeaCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -165,6 +183,7 @@ class MAGArchaeaCRISPRCas(models.Model):
         verbose_name_plural = "MAG Archaea CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='ma_cas_subtype_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -176,6 +195,7 @@ class MAGArchaeaCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -183,6 +203,10 @@ class MAGArchaeaCRISPR(models.Model):
     class Meta:
         verbose_name = "MAG Archaea CRISPR Annotation"
         verbose_name_plural = "MAG Archaea CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='ma_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -200,6 +224,7 @@ class MAGArchaeaAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -216,6 +241,9 @@ class MAGArchaeaAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "MAG Archaea Anti-CRISPR Annotation"
         verbose_name_plural = "MAG Archaea Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.archaea_id})"
@@ -229,6 +257,7 @@ class MAGArchaeaSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -244,6 +273,7 @@ class MAGArchaeaSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "MAG Archaea Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='ma_sm_type_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -254,6 +284,7 @@ class MAGArchaeaSignalPeptidePrediction(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -270,6 +301,9 @@ class MAGArchaeaSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "MAG Archaea Signal Peptide Prediction"
         verbose_name_plural = "MAG Archaea Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -279,6 +313,7 @@ class MAGArchaeaVirulenceFactor(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -305,6 +340,9 @@ class MAGArchaeaVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "MAG Archaea Virulence Factor"
         verbose_name_plural = "MAG Archaea Virulence Factors"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -314,6 +352,7 @@ class MAGArchaeaAntibioticResistance(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -344,6 +383,7 @@ class MAGArchaeaAntibioticResistance(models.Model):
         verbose_name_plural = "MAG Archaea Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='ma_arg_type_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -354,6 +394,7 @@ class MAGArchaeaTransmembraneHelices(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -366,6 +407,9 @@ class MAGArchaeaTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "MAG Archaea Transmembrane Helix"
         verbose_name_plural = "MAG Archaea Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='ma_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
@@ -412,6 +456,12 @@ class UnMAGArchaea(models.Model):
         verbose_name_plural = "UnMAG Archaea Genomes"
         indexes = [
             GinIndex(fields=['archaea_id'], name='uma_archaea_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='uma_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='uma_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='uma_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='uma_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='uma_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='uma_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -462,6 +512,7 @@ class UnMAGArchaeaProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -496,6 +547,12 @@ class UnMAGArchaeaProtein(models.Model):
         verbose_name_plural = "UnMAG Archaea Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='uma_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='uma_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='uma_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='uma_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_protein_location_gist_idx'),
+            models.Index(fields=['archaea_id', 'id'], name='uma_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='uma_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -514,6 +571,7 @@ class UnMAGArchaeaTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -522,6 +580,9 @@ class UnMAGArchaeaTRNA(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea tRNA Annotation"
         verbose_name_plural = "UnMAG Archaea tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -533,6 +594,7 @@ class UnMAGArchaeaCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -546,6 +608,7 @@ class UnMAGArchaeaCRISPRCas(models.Model):
         verbose_name_plural = "UnMAG Archaea CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='uma_cas_subtype_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -557,6 +620,7 @@ class UnMAGArchaeaCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -564,6 +628,10 @@ class UnMAGArchaeaCRISPR(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea CRISPR Annotation"
         verbose_name_plural = "UnMAG Archaea CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='uma_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -581,6 +649,7 @@ class UnMAGArchaeaAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -597,6 +666,9 @@ class UnMAGArchaeaAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea Anti-CRISPR Annotation"
         verbose_name_plural = "UnMAG Archaea Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.archaea_id})"
@@ -610,6 +682,7 @@ class UnMAGArchaeaSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -625,6 +698,7 @@ class UnMAGArchaeaSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "UnMAG Archaea Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='uma_sm_type_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -635,6 +709,7 @@ class UnMAGArchaeaSignalPeptidePrediction(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -651,6 +726,9 @@ class UnMAGArchaeaSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea Signal Peptide Prediction"
         verbose_name_plural = "UnMAG Archaea Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -660,6 +738,7 @@ class UnMAGArchaeaVirulenceFactor(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -686,6 +765,9 @@ class UnMAGArchaeaVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea Virulence Factor"
         verbose_name_plural = "UnMAG Archaea Virulence Factors"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -695,6 +777,7 @@ class UnMAGArchaeaAntibioticResistance(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -725,6 +808,7 @@ class UnMAGArchaeaAntibioticResistance(models.Model):
         verbose_name_plural = "UnMAG Archaea Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='uma_arg_type_gin_idx'),
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -735,6 +819,7 @@ class UnMAGArchaeaTransmembraneHelices(models.Model):
     archaea_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -747,6 +832,9 @@ class UnMAGArchaeaTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "UnMAG Archaea Transmembrane Helix"
         verbose_name_plural = "UnMAG Archaea Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['archaea_id', 'contig_id', 'location'], name='uma_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
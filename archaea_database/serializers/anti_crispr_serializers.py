@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaAntiCRISPRAnnotation, UnMAGArchaea
 class MAGArchaeaAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
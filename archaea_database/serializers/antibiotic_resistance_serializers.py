@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaAntibioticResistance, UnMAGArchaea
 class MAGArchaeaAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
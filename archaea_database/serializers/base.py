@@ -7,6 +7,13 @@ class CommonTableRequestParamsSerializer(serializers.Serializer):
     searchContent = serializers.DictField(required=True)
     sortOrder = serializers.CharField(required=False)
     sortField = serializers.CharField(required=False)
+    fields = serializers.ListField(child=serializers.CharField(), required=False, allow_empty=False)
+    facets = serializers.BooleanField(required=False, default=False)
+
+
+class CommonTableFieldsRequestParamsSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), required=True, allow_empty=False, max_length=500)
+    fields = serializers.ListField(child=serializers.CharField(), required=False, allow_empty=False)
 
 
 class CommonSingleDownloadRequestParamsSerializer(serializers.Serializer):
@@ -21,7 +28,48 @@ class CommonBatchDownloadRequestParamsSerializer(serializers.Serializer):
     microbe = serializers.CharField(required=True)
     magStatus = serializers.CharField(required=True)
     dataType = serializers.CharField(required=True)
+    # async 时创建后台导出任务，返回任务状态而不是文件
+    mode = serializers.ChoiceField(choices=['sync', 'async'], required=False, default='sync')
 
 
 class GenomeDetailSerializer(serializers.Serializer):
     genomeId = serializers.CharField(required=True)
+
+
+class GenomeFASTARequestParamsSerializer(serializers.Serializer):
+    genomeId = serializers.CharField(required=True)
+    # full: 全部序列; contigs: 只返回 contig 名与长度; region: 返回 region 指定的片段
+    mode = serializers.ChoiceField(choices=['full', 'contigs', 'region'], required=False, default='full')
+    # contig:start-end (从 1 开始，包含两端) 或 contig
+    region = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        if attrs['mode'] == 'region' and not attrs.get('region'):
+            raise serializers.ValidationError("'region' is required when mode is 'region'.")
+        return attrs
+
+
+class GenomeTrackRequestParamsSerializer(serializers.Serializer):
+    genomeId = serializers.CharField(required=True)
+    # contig:start-end (从 1 开始，包含两端) 或 contig
+    region = serializers.CharField(required=True)
+    # 逗号分隔的轨道名，缺省时返回全部轨道
+    tracks = serializers.CharField(required=False, default='')
+    # auto: 窄窗口返回要素、宽窗口返回分箱计数; density: 总是返回分箱计数
+    mode = serializers.ChoiceField(choices=['auto', 'density'], required=False, default='auto')
+
+
+class GenomeBundleRequestParamsSerializer(serializers.Serializer):
+    genomeId = serializers.CharField(required=True)
+    # 逗号分隔的面板名，缺省时返回全部面板
+    panels = serializers.CharField(required=False, default='')
+
+
+class GenomeOverlapRequestParamsSerializer(serializers.Serializer):
+    genomeId = serializers.CharField(required=True)
+    # contig:start-end (从 1 开始，包含两端) 或 contig
+    region = serializers.CharField(required=True)
+    # 逗号分隔的注释类型，缺省时查询全部类型
+    types = serializers.CharField(required=False, default='')
+    # overlap: 与区间有重叠的注释; within: 完全位于区间内的注释
+    mode = serializers.ChoiceField(choices=['overlap', 'within'], required=False, default='overlap')
@@ -6,7 +6,7 @@ from archaea_database.models import MAGArchaeaCRISPRCas, MAGArchaeaCRISPR, UnMAG
 class MAGArchaeaCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class MAGArchaeaCRISPRSerializer(serializers.ModelSerializer):
@@ -14,13 +14,13 @@ class MAGArchaeaCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGArchaeaCRISPR
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaCRISPRSerializer(serializers.ModelSerializer):
@@ -28,4 +28,4 @@ class UnMAGArchaeaCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGArchaeaCRISPR
-        fields = '__all__'
+        exclude = ('location',)
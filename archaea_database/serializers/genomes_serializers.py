@@ -1,7 +1,8 @@
 from rest_framework import serializers
-import pandas as pd
 import os
 
+from utils.annotation_summary import AnnotationSummaryMixin
+from utils.read_files import count_tsv_proteins, count_tsv_rows
 from archaea_database.models import MAGArchaea, UnMAGArchaea, UnMAGArchaeaProtein, UnMAGArchaeaAntibioticResistance, \
     UnMAGArchaeaTRNA, UnMAGArchaeaCRISPR, UnMAGArchaeaAntiCRISPRAnnotation, UnMAGArchaeaSecondaryMetaboliteRegion, \
     UnMAGArchaeaSignalPeptidePrediction, UnMAGArchaeaVirulenceFactor, UnMAGArchaeaTransmembraneHelices, \
@@ -40,12 +41,12 @@ class MAGArchaeaSerializer(serializers.ModelSerializer):
         for archaea_id in obj.archaea_id:
             g = self._gtdb_map.get(archaea_id)
             if g:
-                return MAGArchaeaGTDBSerializer(g, context=self.context).data
+                return g
 
         return None
 
 
-class MAGArchaeaDetailSerializer(serializers.ModelSerializer):
+class MAGArchaeaDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -56,51 +57,50 @@ class MAGArchaeaDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Archaea'
+    summary_mag_status = 'MAG'
+
     class Meta:
         model = MAGArchaea
         fields = '__all__'
 
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Archaea/MAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGArchaeaProtein.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return MAGArchaeaTRNA.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return MAGArchaeaCRISPR.objects.filter(cas__archaea_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return MAGArchaeaAntiCRISPRAnnotation.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return MAGArchaeaSecondaryMetaboliteRegion.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return MAGArchaeaSignalPeptidePrediction.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return MAGArchaeaVirulenceFactor.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Archaea/MAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return MAGArchaeaAntibioticResistance.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Archaea/MAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
         # return MAGArchaeaTransmembraneHelices.objects.filter(archaea_id=obj.unique_id).count()
 
 
@@ -129,12 +129,12 @@ class UnMAGArchaeaSerializer(serializers.ModelSerializer):
         for archaea_id in obj.archaea_id:
             g = self._gtdb_map.get(archaea_id)
             if g:
-                return UnMAGArchaeaGTDBSerializer(g, context=self.context).data
+                return g
 
         return None
 
 
-class UnMAGArchaeaDetailSerializer(serializers.ModelSerializer):
+class UnMAGArchaeaDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -145,36 +145,38 @@ class UnMAGArchaeaDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Archaea'
+    summary_mag_status = 'unMAG'
+
     class Meta:
         model = UnMAGArchaea
         fields = '__all__'
 
     # def get_protein_count(self, obj):
     #     return UnMAGArchaeaProtein.objects.filter(archaea_id=obj.unique_id).count()
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Archaea/unMAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return UnMAGArchaeaProtein.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return UnMAGArchaeaTRNA.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return UnMAGArchaeaCRISPR.objects.filter(cas__archaea_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return UnMAGArchaeaAntiCRISPRAnnotation.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return UnMAGArchaeaSecondaryMetaboliteRegion.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return UnMAGArchaeaSignalPeptidePrediction.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return UnMAGArchaeaVirulenceFactor.objects.filter(archaea_id=obj.unique_id).count()
 
     # def get_arg_count(self, obj):
@@ -183,18 +185,15 @@ class UnMAGArchaeaDetailSerializer(serializers.ModelSerializer):
     # def get_tmh_count(self, obj):
     #     return UnMAGArchaeaTransmembraneHelices.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Archaea/unMAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return UnMAGArchaeaAntibioticResistance.objects.filter(archaea_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Archaea/unMAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaProtein, UnMAGArchaeaProtein
 class MAGArchaeaProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaProtein
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaProtein
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaSecondaryMetaboliteRegion, UnMAGAr
 class MAGArchaeaSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
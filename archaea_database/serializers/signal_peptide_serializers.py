@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaSignalPeptidePrediction, UnMAGArch
 class MAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaTRNA, UnMAGArchaeaTRNA
 class MAGArchaeaTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaTRNA
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaTRNA
-        fields = '__all__'
+        exclude = ('location',)
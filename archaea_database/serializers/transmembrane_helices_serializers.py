@@ -15,7 +15,7 @@ class MAGArchaeaTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGArchaeaTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaHelicesSerializer(serializers.ModelSerializer):
@@ -29,4 +29,4 @@ class UnMAGArchaeaTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGArchaeaTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
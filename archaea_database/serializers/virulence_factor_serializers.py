@@ -6,10 +6,10 @@ from archaea_database.models import MAGArchaeaVirulenceFactor, UnMAGArchaeaVirul
 class MAGArchaeaVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGArchaeaVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGArchaeaVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGArchaeaVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
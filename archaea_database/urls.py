@@ -14,7 +14,9 @@ urlpatterns = [
     path('genome_batch_download', genomes_views.ArchaeaGenomesBatchDownloadView.as_view()),
     path('genome_batch_download_unmag', genomes_views.UnMAGArchaeaGenomesBatchDownloadView.as_view()),
     path('proteins', proteins_views.ArchaeaProteinsView.as_view()),
+    path('proteins_fields', proteins_views.ArchaeaProteinsFieldsView.as_view()),
     path('proteins_unmag', proteins_views.UnMAGArchaeaProteinsView.as_view()),
+    path('proteins_fields_unmag', proteins_views.UnMAGArchaeaProteinsFieldsView.as_view()),
     path('proteins_filter_options', proteins_views.ArchaeaProteinsFilterOptionsView.as_view()),
     path('proteins_filter_options_unmag', proteins_views.UnMAGArchaeaProteinsFilterOptionsView.as_view()),
     path('protein_single_download', proteins_views.ArchaeaProteinsSingleDownloadView.as_view()),
@@ -22,7 +24,9 @@ urlpatterns = [
     path('protein_batch_download', proteins_views.ArchaeaProteinsBatchDownloadView.as_view()),
     path('protein_batch_download_unmag', proteins_views.UnMAGArchaeaProteinsBatchDownloadView.as_view()),
     path('tRNAs', tRNAs_views.ArchaeaTRNAsView.as_view()),
+    path('tRNAs_fields', tRNAs_views.ArchaeaTRNAsFieldsView.as_view()),
     path('tRNAs_unmag', tRNAs_views.UnMAGArchaeaTRNAsView.as_view()),
+    path('tRNAs_fields_unmag', tRNAs_views.UnMAGArchaeaTRNAsFieldsView.as_view()),
     path('tRNAs_filter_options', tRNAs_views.ArchaeaTRNAFilterOptionsView.as_view()),
     path('tRNAs_filter_options_unmag', tRNAs_views.UnMAGArchaeaTRNAFilterOptionsView.as_view()),
     path('tRNA_single_download', tRNAs_views.ArchaeaTRNASingleDownloadView.as_view()),
@@ -41,7 +45,10 @@ urlpatterns = [
     path('CRISPR_Cas_system_batch_download_unmag',
          crisprcas_views.UnMAGArchaeaCRISPRCasSystemsBatchDownloadView.as_view()),
     path('anti_crispr_annotations', anti_cripsr_views.ArchaeaAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields', anti_cripsr_views.ArchaeaAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_unmag', anti_cripsr_views.UnMAGArchaeaAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields_unmag',
+         anti_cripsr_views.UnMAGArchaeaAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_filter_options',
          anti_cripsr_views.ArchaeaAntiCRISPRAnnotationsFilterOptionsView.as_view()),
     path('anti_crispr_annotations_filter_options_unmag',
@@ -91,7 +98,10 @@ urlpatterns = [
     path('virulence_factor_batch_download_unmag',
          virulence_factor_views.UnMAGArchaeaVirulenceFactorsBatchDownloadView.as_view()),
     path('antibiotic_resistances', antibiotic_resistance_views.ArchaeaAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields', antibiotic_resistance_views.ArchaeaAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_unmag', antibiotic_resistance_views.UnMAGArchaeaAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields_unmag',
+         antibiotic_resistance_views.UnMAGArchaeaAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_filter_options',
          antibiotic_resistance_views.ArchaeaAntibioticResistancesFilterOptionsView.as_view()),
     path('antibiotic_resistances_filter_options_unmag',
@@ -142,6 +152,12 @@ urlpatterns = [
     path('genome_detail_transmembrane_helices_unmag',
          genomes_views.UnMAGArchaeaGenomeTransmembraneHelicesView.as_view()
          ),
+    path('genome_bundle', genomes_views.ArchaeaGenomeBundleView.as_view()),
+    path('genome_bundle_unmag', genomes_views.UnMAGArchaeaGenomeBundleView.as_view()),
     path('genome_fasta', genomes_views.ArchaeaGenomeFASTAView.as_view()),
     path('genome_fasta_unmag', genomes_views.UnMAGArchaeaGenomeFASTAView.as_view()),
+    path('genome_tracks', genomes_views.ArchaeaGenomeTrackView.as_view()),
+    path('genome_tracks_unmag', genomes_views.UnMAGArchaeaGenomeTrackView.as_view()),
+    path('genome_overlaps', genomes_views.ArchaeaGenomeOverlapView.as_view()),
+    path('genome_overlaps_unmag', genomes_views.UnMAGArchaeaGenomeOverlapView.as_view()),
 ]
@@ -10,13 +10,14 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from archaea_database.models import MAGArchaeaAntibioticResistance, UnMAGArchaeaAntibioticResistance
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from archaea_database.serializers.antibiotic_resistance_serializers import MAGArchaeaAntibioticResistanceSerializer, \
     UnMAGArchaeaAntibioticResistanceSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -71,6 +72,10 @@ class ArchaeaAntibioticResistancesView(GenericTableQueryView):
     queryset = MAGArchaeaAntibioticResistance.objects.all()
     serializer_class = MAGArchaeaAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -79,10 +84,14 @@ class ArchaeaAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class ArchaeaAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = ArchaeaAntibioticResistancesView
+
+
 class ArchaeaAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('MAGArchaeaAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('MAGArchaeaAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -121,18 +130,11 @@ class ArchaeaAntibioticResistancesBatchDownloadView(GenericBatchDownloadView):
     model = MAGArchaeaAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -145,6 +147,10 @@ class UnMAGArchaeaAntibioticResistancesView(GenericTableQueryView):
     queryset = UnMAGArchaeaAntibioticResistance.objects.all()
     serializer_class = UnMAGArchaeaAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -153,10 +159,14 @@ class UnMAGArchaeaAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class UnMAGArchaeaAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGArchaeaAntibioticResistancesView
+
+
 class UnMAGArchaeaAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('UnMAGArchaeaAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('UnMAGArchaeaAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -195,18 +205,11 @@ class UnMAGArchaeaAntibioticResistancesBatchDownloadView(GenericBatchDownloadVie
     model = UnMAGArchaeaAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
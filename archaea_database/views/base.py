@@ -1,21 +1,56 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework import serializers
 
+from django.conf import settings
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse
+from django.utils.module_loading import import_string
 
+from Bio import SeqIO
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from utils.download_files import compress_and_download_files
+from utils.download_files import stream_tar_response
+from utils.csv_stream import iter_value_objects, stream_csv_response
+from utils.export_jobs import export_job_to_dict, register_export_source, submit_export
+from utils.fasta_index import open_genome_fasta, parse_region
+from utils.genome_locations import get_location_types, query_overlaps
+from utils.genome_tracks import TRACKS, get_genome_tracks, query_track
+from utils.file_serving import get_genome_file_path, serve_file
+from utils.annotation_summary import get_genome_model
+from utils.response_cache import TableCacheEntry
+from utils.pagination import KeysetPostPagination
+from utils.count_strategy import TableCountStrategy
+from utils.facets import TableFacetCounter
+from utils.fast_serializer import FastListSerializer
+from utils.search import SEARCH_RANK_FIELD, apply_ranked_search, get_field_search_q, get_ranked_search_fields
+import gzip
 import os
+import traceback
 
+from MicrobialScope_api.constant import MEDIA_DATA_DIR
 from archaea_database.serializers.base import CommonSingleDownloadRequestParamsSerializer, \
-    CommonBatchDownloadRequestParamsSerializer
+    CommonBatchDownloadRequestParamsSerializer, CommonTableFieldsRequestParamsSerializer, \
+    GenomeBundleRequestParamsSerializer, GenomeFASTARequestParamsSerializer, GenomeTrackRequestParamsSerializer, \
+    GenomeOverlapRequestParamsSerializer
 
 
 class GenericTableQueryView(APIView):
     pagination_class = None
+    keyset_pagination_class = KeysetPostPagination
+    # 游标分页除 id 与相似度外可用的排序字段，每个字段在模型上有 (字段, id) 组合索引
+    keyset_sort_fields = ()
+    count_strategy_class = TableCountStrategy
+    # 为 True 时用 .values() 与 FastListSerializer 生成列表，输出与 serializer_class 一致
+    fast_list = False
+    # get_context 与 SerializerMethodField 需要读取的列，请求 fields 未包含时也总是查询
+    fast_list_extra_fields = ()
+    # 列表页默认不展示的大字段 (序列、长注释)，前端展开时通过 GenericTableFieldsView 按 id 批量获取
+    deferred_fields = ()
+    # 请求 facets 为 true 时返回这些筛选字段各取值的行数
+    facet_fields = ()
+    facet_counter_class = TableFacetCounter
     queryset = None
     serializer_class = None
     request_serializer_class = None
@@ -46,11 +81,94 @@ class GenericTableQueryView(APIView):
         if not search_content['value']:
             return Q()
 
-        return Q(**{f"{search_content['field']}__startswith": search_content['value'].strip()})
+        model = self.get_queryset().model
+        return get_field_search_q(model, search_content['field'], search_content['value'])
+
+    def is_ranked_search(self, search_content):
+        return bool(search_content) and search_content.get('mode') == 'ranked' and bool(search_content.get('value'))
+
+    def get_ranked_search_queryset(self, queryset, search_content):
+        fields = get_ranked_search_fields(queryset.model, self.search_fields)
+        return apply_ranked_search(queryset, fields, search_content['value'])
+
+    def get_search_queryset(self, queryset, search_content):
+        if self.is_ranked_search(search_content):
+            return self.get_ranked_search_queryset(queryset, search_content)
+        return queryset.filter(self.get_search_q(search_content))
+
+    def get_facets(self, filters, search_content):
+        """
+        当前搜索与筛选条件下 facet_fields 各取值的行数；统计某个字段时不应用该字段自身的筛选，
+        使同一字段的其它选项仍有数量
+        """
+        facets = {}
+        for lookup in self.facet_fields:
+            other_filters = {key: value for key, value in (filters or {}).items() if key != lookup}
+            queryset = self.get_queryset().filter(self.get_filter_params(other_filters))
+            queryset = self.get_search_queryset(queryset, search_content)
+            facets[lookup] = self.facet_counter_class().get_counts(queryset, lookup, self.get_cache_dataset())
+        return facets
 
     def get_context(self, page, request):
         return {}
 
+    def get_selected_fields(self, fields):
+        """
+        请求 fields 中指定的返回字段 (总是包含 id)，未指定时返回 None 表示全部字段；
+        包含 serializer_class 中不存在的字段时抛出 ValueError
+        """
+        if not fields:
+            return None
+
+        serializer_fields = self.get_serializer_class()().fields
+        unknown = [field_name for field_name in fields if field_name not in serializer_fields]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        return list(dict.fromkeys(['id', *fields] if 'id' in serializer_fields else fields))
+
+    def get_list_queryset(self, queryset, selected_fields=None):
+        """
+        只取序列化所需的列：fast_list 模式下以 .values() 字典代替模型实例，
+        否则在指定了 fields 时用 .only() 跳过未选中的列
+        """
+        if self.fast_list:
+            value_fields = FastListSerializer(self.get_serializer_class(), field_names=selected_fields).get_value_fields()
+            return queryset.values(*dict.fromkeys(['id', *value_fields, *self.fast_list_extra_fields]))
+
+        if selected_fields is None:
+            return queryset
+
+        serializer_fields = self.get_serializer_class()().fields
+        sources = []
+        for field_name in selected_fields:
+            field = serializer_fields[field_name]
+            # SerializerMethodField 等读取的列无法确定，此时不做列裁剪
+            if isinstance(field, serializers.SerializerMethodField) or '.' in field.source or field.source == '*':
+                return queryset
+            sources.append(field.source)
+        return queryset.only(*dict.fromkeys([*sources, *self.fast_list_extra_fields]))
+
+    def serialize_page(self, page, request, selected_fields=None):
+        if not self.fast_list:
+            context = self.get_context(page, request)
+            serializer = self.get_serializer_class()(page, many=True, context=context)
+            if selected_fields is not None:
+                for field_name in list(serializer.child.fields):
+                    if field_name not in selected_fields:
+                        serializer.child.fields.pop(field_name)
+            return serializer.data
+
+        objs = FastListSerializer.as_objects(page)
+        context = self.get_context(objs, request)
+        return FastListSerializer(self.get_serializer_class(), context, field_names=selected_fields).serialize(objs)
+
+    def get_cache_namespace(self):
+        return f'{type(self).__module__}.{type(self).__name__}'
+
+    def get_cache_dataset(self):
+        return self.get_queryset().model._meta.label_lower
+
     def post(self, request):
         if self.request_serializer_class is None:
             raise RuntimeError("You must define 'request_serializer_class'.")
@@ -60,23 +178,70 @@ class GenericTableQueryView(APIView):
         if request_serializer.is_valid():
             validated_data = request_serializer.validated_data
 
+            # 相同请求体在数据版本不变时直接返回共享缓存中的结果
+            cache_entry = TableCacheEntry(self.get_cache_namespace(), self.get_cache_dataset(), request.data)
+            if cache_entry.is_not_modified(request):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': cache_entry.etag})
+            if cache_entry.payload is not None:
+                return Response(cache_entry.payload, headers={'ETag': cache_entry.etag})
+
             sort_item = 'id'
             sort_field = validated_data.get('sortField', '')
             sort_order = validated_data.get('sortOrder', '')
             if sort_field and sort_order:
                 sort_item = sort_field if sort_order == 'ascend' else f'-{sort_field}'
 
-            search_content = validated_data.get('searchContent', '')
-            search_params = self.get_search_q(search_content)
-
             filters = validated_data.get('filterOptions', {})
             filter_params = self.get_filter_params(filters)
-            final_queryset = self.get_queryset().filter(filter_params).filter(search_params).order_by(sort_item)
+            queryset = self.get_queryset().filter(filter_params)
+
+            # mode 为 ranked 时在 search_fields 的文本字段上做多字段检索，未指定排序时按相似度排序
+            search_content = validated_data.get('searchContent', '')
+            queryset = self.get_search_queryset(queryset, search_content)
+            if self.is_ranked_search(search_content) and not (sort_field and sort_order):
+                sort_item = f'-{SEARCH_RANK_FIELD}'
+
+            # 请求中带有 fields 时只查询并返回这些字段
+            try:
+                selected_fields = self.get_selected_fields(validated_data.get('fields'))
+            except ValueError:
+                return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
+
+            final_queryset = self.get_list_queryset(queryset.order_by(sort_item), selected_fields)
+
+            # 请求中带有 pagination.cursor 时使用游标分页，避免深分页的 OFFSET 扫描
+            if self.keyset_pagination_class is not None and self.keyset_pagination_class.is_requested(request):
+                if sort_item.lstrip('-') not in ('id', SEARCH_RANK_FIELD, *self.keyset_sort_fields):
+                    return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
+
+                paginator = self.keyset_pagination_class()
+                try:
+                    page = paginator.paginate_queryset(
+                        final_queryset, request, sort_item.lstrip('-'), sort_item.startswith('-')
+                    )
+                except ValueError:
+                    return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
+
+                payload = {
+                    "page_size": paginator.page_size,
+                    "next_cursor": paginator.next_cursor,
+                    "results": self.serialize_page(page, request, selected_fields)
+                }
+                if validated_data.get('facets'):
+                    payload["facets"] = self.get_facets(filters, search_content)
+                cache_entry.store(payload)
+                return Response(payload, headers={'ETag': cache_entry.etag})
 
             if self.pagination_class is None:
                 raise RuntimeError("You must define 'pagination_class'.")
 
             paginator = self.pagination_class()
+            # 总数由计数策略给出：无过滤的大表使用规划器估计值 (仅用于展示，不限制可访问的页码)，
+            # 其余为按查询签名缓存的精确值
+            if self.count_strategy_class is not None:
+                paginator.count, paginator.count_is_estimate = self.count_strategy_class().get_count(
+                    final_queryset, self.get_cache_dataset()
+                )
             page = paginator.paginate_queryset(final_queryset, request)
 
             if page is None:
@@ -85,18 +250,50 @@ class GenericTableQueryView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            context = self.get_context(page, request)
-            serializer = self.get_serializer_class()(page, many=True, context=context)
-            return Response({
+            payload = {
                 "count": paginator.page.paginator.count,
                 "page": paginator.page.number,
                 "page_size": paginator.page.paginator.per_page,
-                "results": serializer.data
-            })
+                "count_is_estimate": paginator.page.paginator.count_is_estimate,
+                "results": self.serialize_page(page, request, selected_fields)
+            }
+            if validated_data.get('facets'):
+                payload["facets"] = self.get_facets(filters, search_content)
+            cache_entry.store(payload)
+            return Response(payload, headers={'ETag': cache_entry.etag})
         else:
             return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
 
 
+class GenericTableFieldsView(APIView):
+    """
+    按 id 批量返回列表页未加载的大字段，可查询的字段为 table_view_class.deferred_fields
+    """
+    table_view_class = None
+
+    def post(self, request):
+        if self.table_view_class is None:
+            raise RuntimeError("You must define 'table_view_class'.")
+
+        request_serializer = CommonTableFieldsRequestParamsSerializer(data=request.data)
+        if not request_serializer.is_valid():
+            return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = request_serializer.validated_data
+        table_view = self.table_view_class()
+        fields = validated_data.get('fields') or list(table_view.deferred_fields)
+        if not fields or not set(fields) <= set(table_view.deferred_fields):
+            return Response('Invalid Params.', status=status.HTTP_400_BAD_REQUEST)
+
+        fast_serializer = FastListSerializer(table_view.get_serializer_class(), field_names=['id', *fields])
+        rows = table_view.get_queryset().filter(id__in=validated_data['ids']).order_by('id') \
+            .values(*dict.fromkeys(['id', *fast_serializer.get_value_fields()]))
+
+        return Response({
+            "results": fast_serializer.serialize(FastListSerializer.as_objects(rows))
+        })
+
+
 class GenericSingleDownloadView(APIView):
     model = None
 
@@ -106,6 +303,16 @@ class GenericSingleDownloadView(APIView):
     def get_object(self, pk):
         return get_object_or_404(self.model, pk=pk)
 
+    def get_genome_file_response(self, unique_id, file_type, microbe_dir, mag_dir):
+        """
+        基因组的 fasta / gbk / gff3 文件，交给 serve_file 发送 (支持 Range 断点续传或由前端代理发送)
+        """
+        file_path, file_name = get_genome_file_path(microbe_dir, mag_dir, unique_id, file_type)
+        response = serve_file(self.request, file_path, file_name)
+        if response is None:
+            return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+        return response
+
     def get(self, request):
         request_serializer = CommonSingleDownloadRequestParamsSerializer(data=request.query_params)
 
@@ -126,14 +333,31 @@ class GenericSingleDownloadView(APIView):
 class GenericBatchDownloadView(APIView):
     model = None
     entity_name = None
+    # CSV 导出时随主表一起取出的外键关系，to_csv_row 中以嵌套对象访问
+    csv_related = ()
+    csv_chunk_size = 2000
 
     def get_queryset(self):
         if self.model is None:
             raise NotImplementedError("You must define 'model' or override 'get_queryset()'")
         return self.model.objects.all()
 
-    def build_csv(self, queryset):
-        raise NotImplementedError("Subclass must implement build_csv()")
+    def get_csv_header(self):
+        raise NotImplementedError("Subclass must implement get_csv_header()")
+
+    def to_csv_row(self, obj):
+        raise NotImplementedError("Subclass must implement to_csv_row()")
+
+    def iter_csv_rows(self, queryset):
+        for obj in iter_value_objects(queryset, self.csv_related, self.csv_chunk_size):
+            yield self.to_csv_row(obj)
+
+    def build_csv_response(self, queryset):
+        """
+        以服务端游标分块读取并流式输出 CSV，内存占用与结果行数无关
+        """
+        filename = f"{self.entity_name}_meta_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.csv"
+        return stream_csv_response(self.get_csv_header(), self.iter_csv_rows(queryset), filename)
 
     def get_filter_q(self, payload):
         q_obj = Q()
@@ -145,52 +369,33 @@ class GenericBatchDownloadView(APIView):
         return q_obj
 
     def get_file_response(self, queryset, download_type, file_type, payload, microbe, mag_status):
-        # base_dir = f'/delta_microbia/data/{microbe}/{mag_status}'
-        base_dir = f'E:\\WebProject\\MicrobialScope\\Data\\media\\data\\{microbe}\\{mag_status}'
+        base_dir = os.path.join(MEDIA_DATA_DIR, microbe, mag_status)
         if download_type == 'selected':
             queryset = queryset.filter(id__in=payload).order_by('id')
             if file_type == 'meta':
-                buffer = self.build_csv(queryset)
-                filename = f"{self.entity_name}_meta_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.csv"
-
-                return HttpResponse(
-                    buffer,
-                    content_type='text/csv',
-                    headers={
-                        'Content-Disposition': f'attachment; filename="{filename}"'
-                    }
-                )
+                return self.build_csv_response(queryset)
             elif file_type == 'fasta':
                 download_files = []
                 for obj in queryset:
                     download_files.append(os.path.join(base_dir, 'fna', f"{obj.unique_id}.fna.gz"))
-                return compress_and_download_files(download_files, f"fasta_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
+                return stream_tar_response(download_files, f"fasta_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
             elif file_type == 'gbk':
                 download_files = []
                 for obj in queryset:
                     download_files.append(os.path.join(base_dir, 'gbk', f"{obj.unique_id}.gbk.gz"))
-                return compress_and_download_files(download_files, f"gbk_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
+                return stream_tar_response(download_files, f"gbk_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
             elif file_type == 'gff3':
                 download_files = []
                 for obj in queryset:
                     download_files.append(os.path.join(base_dir, 'gff', f"{obj.unique_id}.gff.gz"))
-                return compress_and_download_files(download_files, f"gff_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
+                return stream_tar_response(download_files, f"gff_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}")
             
         elif download_type == 'filtered':
             filter_q = self.get_filter_q(payload)
             queryset = queryset.filter(filter_q).order_by('id')
 
             if file_type == 'meta':
-                buffer = self.build_csv(queryset)
-                filename = f"{self.entity_name}_meta_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.csv"
-
-                return HttpResponse(
-                    buffer,
-                    content_type='text/csv',
-                    headers={
-                        'Content-Disposition': f'attachment; filename="{filename}"'
-                    }
-                )
+                return self.build_csv_response(queryset)
 
         return Response('Bad Request.', status=status.HTTP_400_BAD_REQUEST)
 
@@ -209,9 +414,332 @@ class GenericBatchDownloadView(APIView):
         mag_status = validated_data.get('magStatus')
         queryset = self.get_queryset()
 
+        # 结果过大无法在一次请求内完成时，改为提交后台导出任务，相同参数与数据版本复用已有产物
+        if validated_data.get('mode') == 'async':
+            job = submit_export('batch_download', {
+                'view': f'{type(self).__module__}.{type(self).__name__}',
+                'downloadType': download_type,
+                'fileType': file_type,
+                'payload': payload,
+                'microbe': microbe,
+                'magStatus': mag_status,
+            })
+            return Response(export_job_to_dict(job), status=status.HTTP_202_ACCEPTED)
+
         try:
             return self.get_file_response(queryset, download_type, file_type, payload, microbe, mag_status)
         except NotImplementedError:
             return Response('Not Implemented', status=status.HTTP_501_NOT_IMPLEMENTED)
         except ValueError as e:
             return Response('Bad Request.', status=status.HTTP_400_BAD_REQUEST)
+
+
+class GenericGenomeBundleView(APIView):
+    """
+    一次返回基因组详情页的多个面板，面板名 -> 原有的单面板视图 (genome_detail_*)，
+    可以用 panels 参数只取部分面板，以便页面按需懒加载
+
+    读取 TSV 文件的面板在线程池中并发读取，查询数据库的面板在请求线程中依次执行，
+    单个面板返回错误时其余面板照常返回，错误写入 errors
+    """
+    panel_views = {}
+    # 由 TSV 文件提供数据、不访问数据库的面板
+    file_panels = ('proteins', 'antibiotic_resistance', 'transmembrane_helices')
+    executor = ThreadPoolExecutor(
+        max_workers=getattr(settings, 'GENOME_BUNDLE_WORKERS', 4), thread_name_prefix='genome-bundle'
+    )
+
+    def get_panels(self, panels_param):
+        if not panels_param:
+            return list(self.panel_views)
+
+        panels = list(dict.fromkeys(panel.strip() for panel in panels_param.split(',') if panel.strip()))
+        unknown = [panel for panel in panels if panel not in self.panel_views]
+        if unknown:
+            raise ValueError(f"Unknown panels: {', '.join(unknown)}")
+        return panels
+
+    def get_error_response(self, exc):
+        traceback.print_exc()
+        return Response({'error': 'Internal server error.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def get_panel_response(self, panel, request):
+        """
+        以本次请求调用单个面板视图；异常经该视图的 handle_exception 转为响应 (如 Http404 -> 404)，
+        其余异常转为 500，不影响其它面板
+        """
+        view = self.panel_views[panel]()
+        view.args, view.kwargs, view.request, view.format_kwarg, view.headers = (), {}, request, None, {}
+        try:
+            return view.get(request)
+        except Exception as exc:
+            try:
+                return view.handle_exception(exc)
+            except Exception as exc:
+                return self.get_error_response(exc)
+
+    def get(self, request):
+        request_serializer = GenomeBundleRequestParamsSerializer(data=request.query_params)
+
+        if not request_serializer.is_valid():
+            return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            panels = self.get_panels(request_serializer.validated_data['panels'])
+        except ValueError as e:
+            return Response({'error': str(e), 'panels': list(self.panel_views)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 文件面板先提交到线程池，与数据库面板同时进行
+        futures = {
+            panel: self.executor.submit(self.get_panel_response, panel, request)
+            for panel in panels if panel in self.file_panels
+        }
+        responses = {
+            panel: self.get_panel_response(panel, request)
+            for panel in panels if panel not in self.file_panels
+        }
+        for panel, future in futures.items():
+            try:
+                responses[panel] = future.result()
+            except Exception as exc:
+                responses[panel] = self.get_error_response(exc)
+
+        payload = {'genomeId': request_serializer.validated_data['genomeId'], 'panels': {}, 'errors': {}}
+        for panel in panels:
+            response = responses[panel]
+            if response.status_code >= 400:
+                payload['errors'][panel] = response.data
+            else:
+                payload['panels'][panel] = response.data
+
+        return Response(payload, status=status.HTTP_200_OK)
+
+
+class GenericGenomeFASTAView(APIView):
+    """
+    基因组序列接口，mode 为
+    full: 全部 contig 的完整序列 (原有行为);
+    contigs: 只返回 contig 名与长度;
+    region: 返回 region (contig:start-end) 指定的片段
+
+    contigs / region 模式优先读取 build_IndexedFASTA 生成的 BGZF 副本与 .fai/.gzi 索引，
+    只解压片段所在的块；尚未建索引的基因组回退到逐条解析 .fna.gz
+    """
+    microbe_dir = None
+    mag_dir = None
+
+    def get_fasta_path(self, genome_id):
+        return os.path.join(MEDIA_DATA_DIR, self.microbe_dir, self.mag_dir, 'fna', f'{genome_id}.fna.gz')
+
+    def get_full_response(self, fasta_path):
+        results = []
+
+        try:
+            with gzip.open(fasta_path, 'rt') as handle:
+                for record in SeqIO.parse(handle, 'fasta'):
+                    results.append({
+                        'contig': record.id,
+                        'sequence': str(record.seq),
+                        'length': len(record.seq)
+                    })
+
+            return Response(results, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def get_region_response(self, fasta, region):
+        try:
+            contig, start, end = parse_region(region)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            length = fasta.get_length(contig)
+        except KeyError:
+            return Response({'error': f"Contig '{contig}' not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if start is not None and start >= length:
+            return Response({'error': f"Region starts after the end of contig '{contig}' ({length} bases)."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        start = 0 if start is None else start
+        end = length if end is None else min(end, length)
+        max_length = getattr(settings, 'FASTA_REGION_MAX_LENGTH', 1000000)
+        if end - start > max_length:
+            return Response({'error': f'Region is longer than {max_length} bases.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        sequence = fasta.fetch(contig, start, end)
+        return Response({
+            'contig': contig,
+            'start': start + 1,
+            'end': start + len(sequence),
+            'contig_length': length,
+            'sequence': sequence,
+        }, status=status.HTTP_200_OK)
+
+    def get(self, request):
+        serializer = GenomeFASTARequestParamsSerializer(data=request.query_params)
+
+        if not serializer.is_valid():
+            return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        fasta_path = self.get_fasta_path(validated_data['genomeId'])
+        if validated_data['mode'] == 'full':
+            return self.get_full_response(fasta_path)
+
+        if not os.path.exists(fasta_path):
+            return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        fasta = open_genome_fasta(fasta_path)
+        if validated_data['mode'] == 'contigs':
+            return Response(fasta.contigs(), status=status.HTTP_200_OK)
+        return self.get_region_response(fasta, validated_data['region'])
+
+
+class GenericGenomeTrackView(APIView):
+    """
+    基因组浏览器轨道接口，返回 region (contig:start-end) 窗口内各轨道的数据：
+    窄窗口返回要素本身，宽窗口或要素过多时返回预先计算的分箱计数，响应大小与基因组大小无关
+
+    轨道文件由 build_GenomeTracks 按基因组生成；尚未生成的基因组返回 503 并在后台生成，
+    源文件或数据版本更新后的旧轨道文件在后台重建完成前继续使用
+    """
+    microbe_dir = None
+    mag_dir = None
+
+    def get_tracks(self, tracks_param):
+        if not tracks_param:
+            return list(TRACKS)
+
+        tracks = list(dict.fromkeys(track.strip() for track in tracks_param.split(',') if track.strip()))
+        unknown = [track for track in tracks if track not in TRACKS]
+        if unknown:
+            raise ValueError(f"Unknown tracks: {', '.join(unknown)}")
+        return tracks
+
+    def get(self, request):
+        serializer = GenomeTrackRequestParamsSerializer(data=request.query_params)
+
+        if not serializer.is_valid():
+            return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        try:
+            tracks = self.get_tracks(validated_data['tracks'])
+            contig, start, end = parse_region(validated_data['region'])
+        except ValueError as e:
+            return Response({'error': str(e), 'tracks': list(TRACKS)}, status=status.HTTP_400_BAD_REQUEST)
+
+        genome_id = validated_data['genomeId']
+        if not get_genome_model(self.microbe_dir, self.mag_dir).objects.filter(unique_id=genome_id).exists():
+            return Response({"error": "Genome not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        data = get_genome_tracks(self.microbe_dir, self.mag_dir, genome_id)
+        if data is None:
+            return Response({'error': 'Genome tracks are being built, please retry later.'},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '30'})
+        if contig not in data['contigs']:
+            return Response({'error': f"Contig '{contig}' not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # 轨道坐标从 1 开始并包含两端
+        length = data['contigs'][contig]
+        start = 1 if start is None else start + 1
+        end = length if end is None else min(end, length)
+        if start > end:
+            return Response({'error': f"Region starts after the end of contig '{contig}' ({length} bases)."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        density = validated_data['mode'] == 'density'
+        return Response({
+            'genomeId': genome_id,
+            'contig': contig,
+            'start': start,
+            'end': end,
+            'contig_length': length,
+            'tracks': {track: query_track(data, track, contig, start, end, density) for track in tracks},
+        }, status=status.HTTP_200_OK)
+
+
+class GenericGenomeOverlapView(APIView):
+    """
+    基因组区间重叠查询接口，返回 region (contig:start-end) 内各类注释，
+    例如一个次级代谢产物 (BGC) 区域内的抗性基因与 Anti-CRISPR 蛋白
+
+    查询走各注释表 (基因组 ID, contig_id, location) 上的 GiST 索引，location 区间列由
+    build_GenomeLocations 填充；没有坐标的注释 (抗性基因、毒力因子等) 使用对应蛋白的坐标
+    """
+    microbe_dir = None
+    mag_dir = None
+
+    def get_types(self, types_param):
+        available = get_location_types(self.microbe_dir, self.mag_dir)
+        if not types_param:
+            return available
+
+        types = list(dict.fromkeys(name.strip() for name in types_param.split(',') if name.strip()))
+        unknown = [name for name in types if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown types: {', '.join(unknown)}")
+        return types
+
+    def get(self, request):
+        serializer = GenomeOverlapRequestParamsSerializer(data=request.query_params)
+
+        if not serializer.is_valid():
+            return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        try:
+            types = self.get_types(validated_data['types'])
+            contig, start, end = parse_region(validated_data['region'])
+        except ValueError as e:
+            return Response({'error': str(e), 'types': get_location_types(self.microbe_dir, self.mag_dir)},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        genome_id = validated_data['genomeId']
+        if not get_genome_model(self.microbe_dir, self.mag_dir).objects.filter(unique_id=genome_id).exists():
+            return Response({"error": "Genome not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # 坐标从 1 开始并包含两端，只给 contig 时查询整条 contig (end 为 None)
+        start = 1 if start is None else start + 1
+        within = validated_data['mode'] == 'within'
+        limit = getattr(settings, 'GENOME_OVERLAP_MAX_RESULTS', 1000)
+
+        results = {}
+        for name in types:
+            rows, truncated = query_overlaps(
+                self.microbe_dir, self.mag_dir, name, genome_id, contig, start, end, within, limit
+            )
+            results[name] = {'results': rows, 'truncated': truncated}
+
+        return Response({
+            'genomeId': genome_id,
+            'contig': contig,
+            'start': start,
+            'end': end,
+            'mode': validated_data['mode'],
+            'types': results,
+        }, status=status.HTTP_200_OK)
+
+
+def get_batch_download_view(params):
+    view_class = import_string(params['view'])
+    if not issubclass(view_class, GenericBatchDownloadView):
+        raise ValueError(f"{params['view']} is not a batch download view")
+    return view_class()
+
+
+def build_batch_download_export(params):
+    view = get_batch_download_view(params)
+    return view.get_file_response(
+        view.get_queryset(), params['downloadType'], params['fileType'], params['payload'],
+        params['microbe'], params['magStatus']
+    )
+
+
+def get_batch_download_dataset(params):
+    return get_batch_download_view(params).get_queryset().model._meta.label_lower
+
+
+register_export_source('batch_download', build_batch_download_export, get_batch_download_dataset)
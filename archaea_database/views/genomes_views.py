@@ -3,17 +3,17 @@ from rest_framework.views import APIView
 from rest_framework import status
 
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse, FileResponse
+from django.http import HttpResponse
 from django.db.models import Q
 
 from io import StringIO
 import csv
 import os
-import gzip
-from Bio import SeqIO
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView, \
+    GenericGenomeBundleView, GenericGenomeFASTAView, GenericGenomeTrackView, \
+    GenericGenomeOverlapView
 from archaea_database.models import MAGArchaea, UnMAGArchaea, MAGArchaeaProtein, UnMAGArchaeaProtein, \
     MAGArchaeaTRNA, UnMAGArchaeaTRNA, MAGArchaeaCRISPR, UnMAGArchaeaCRISPR, MAGArchaeaSecondaryMetaboliteRegion, \
     UnMAGArchaeaSecondaryMetaboliteRegion, MAGArchaeaAntiCRISPRAnnotation, UnMAGArchaeaAntiCRISPRAnnotation, \
@@ -21,7 +21,7 @@ from archaea_database.models import MAGArchaea, UnMAGArchaea, MAGArchaeaProtein,
     UnMAGArchaeaVirulenceFactor, MAGArchaeaTransmembraneHelices, UnMAGArchaeaTransmembraneHelices, \
     MAGArchaeaAntibioticResistance, UnMAGArchaeaAntibioticResistance, MAGArchaeaGTDB, UnMAGArchaeaGTDB
 from archaea_database.serializers.genomes_serializers import MAGArchaeaSerializer, UnMAGArchaeaSerializer, \
-    MAGArchaeaDetailSerializer, UnMAGArchaeaDetailSerializer
+    MAGArchaeaDetailSerializer, UnMAGArchaeaDetailSerializer, MAGArchaeaGTDBSerializer, UnMAGArchaeaGTDBSerializer
 from archaea_database.serializers.proteins_serializers import MAGArchaeaProteinSerializer, UnMAGArchaeaProteinSerializer
 from archaea_database.serializers.tRNAs_serializers import MAGArchaeaTRNASerializer, UnMAGArchaeaTRNASerializer
 from archaea_database.serializers.crisprcas_serializers import MAGArchaeaCRISPRSerializer, UnMAGArchaeaCRISPRSerializer
@@ -39,12 +39,15 @@ from archaea_database.serializers.transmembrane_helices_serializers import MAGAr
     UnMAGArchaeaTransmembraneHelicesSerializer
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer, GenomeDetailSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
+from utils.fast_serializer import FastListSerializer
 from utils.read_files import *
+from utils.file_cache import parsed_file_cache
 
 from MicrobialScope_api.constant import MEDIA_DATA_DIR
+from utils.file_serving import GENOME_FILE_TYPES
 
 
 def get_csv_header():
@@ -77,7 +80,7 @@ def get_genome_search_q(search_content):
     if search_content['field'] == 'archaea_id':
         return Q(**{f"{search_content['field']}__contains": [search_content['value'].strip()]})
 
-    return Q(**{f"{search_content['field']}__icontains": search_content['value']})
+    return Q(**{f"{search_content['field']}__ilike_contains": search_content['value']})
 
 
 def get_unmag_archaea_filter_q(filters):
@@ -102,7 +105,11 @@ class ArchaeaGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGArchaea.objects.all()
     serializer_class = MAGArchaeaSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'archaea_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'archaea_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -113,8 +120,11 @@ class ArchaeaGenomesView(GenericTableQueryView):
 
     def get_context(self, page, request):
         unique_ids = [id for obj in page if obj.archaea_id for id in obj.archaea_id]
-        gtdb_qs = MAGArchaeaGTDB.objects.filter(unique_id__in=unique_ids)
-        gtdb_map = {x.unique_id: x for x in gtdb_qs}
+        # 每页一次查询并序列化为字典，get_gtdb 直接返回
+        gtdb_rows = FastListSerializer(MAGArchaeaGTDBSerializer).serialize_queryset(
+            MAGArchaeaGTDB.objects.filter(unique_id__in=unique_ids)
+        )
+        gtdb_map = {row['unique_id']: row for row in gtdb_rows}
         return {
             "gtdb_map": gtdb_map,
         }
@@ -158,7 +168,7 @@ class ArchaeaGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_archaea_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_archaea_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -274,7 +284,7 @@ class ArchaeaGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_archaea_arg_file(arg_file)
+                args = parsed_file_cache.get(read_archaea_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -307,46 +317,20 @@ class ArchaeaGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_archaea_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_archaea_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class ArchaeaGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Archaea',
-                'MAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class ArchaeaGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'MAG'
 
 
 class ArchaeaGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaAssemblyLevel').value
+        assembly_level_values = get_filter_option('MAGArchaeaAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -376,38 +360,8 @@ class ArchaeaGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'MAG', 'fna', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'MAG', 'gbk', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'MAG', 'gff', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Archaea', 'MAG')
 
         return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
@@ -416,18 +370,11 @@ class ArchaeaGenomesBatchDownloadView(GenericBatchDownloadView):
     model = MAGArchaea
     entity_name = 'genome'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
 
 # unMAG Genome Views
@@ -436,7 +383,11 @@ class UnMAGArchaeaGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGArchaea.objects.all()
     serializer_class = UnMAGArchaeaSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'archaea_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'archaea_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -452,8 +403,11 @@ class UnMAGArchaeaGenomesView(GenericTableQueryView):
         unique_ids = [id for obj in page if obj.archaea_id for id in obj.archaea_id]
         if not unique_ids:
             return {"gtdb_map": {}}
-        gtdb_qs = UnMAGArchaeaGTDB.objects.filter(unique_id__in=unique_ids)
-        gtdb_map = {x.unique_id: x for x in gtdb_qs}
+        # 每页一次查询并序列化为字典，get_gtdb 直接返回
+        gtdb_rows = FastListSerializer(UnMAGArchaeaGTDBSerializer).serialize_queryset(
+            UnMAGArchaeaGTDB.objects.filter(unique_id__in=unique_ids)
+        )
+        gtdb_map = {row['unique_id']: row for row in gtdb_rows}
         return {"gtdb_map": gtdb_map}
 
 
@@ -494,7 +448,7 @@ class UnArchaeaGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:   
-                proteins = read_archaea_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_archaea_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -611,7 +565,7 @@ class UnMAGArchaeaGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_archaea_arg_file(arg_file)
+                args = parsed_file_cache.get(read_archaea_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -645,46 +599,20 @@ class UnMAGArchaeaGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_archaea_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_archaea_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class UnMAGArchaeaGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Archaea',
-                'unMAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGArchaeaGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'unMAG'
 
 
 class UnMAGArchaeaGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaAssemblyLevel').value
+        assembly_level_values = get_filter_option('UnMAGArchaeaAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -714,55 +642,68 @@ class UnMAGArchaeaGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'unMAG', 'fna', file_name)
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Archaea', 'unMAG')
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'unMAG', 'gbk', file_name)
+class UnMAGArchaeaGenomesBatchDownloadView(GenericBatchDownloadView):
+    model = UnMAGArchaea
+    entity_name = 'genome'
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+    def get_csv_header(self):
+        return get_csv_header()
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Archaea', 'unMAG', 'gff', file_name)
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+class ArchaeaGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': ArchaeaGenomeDetailView,
+        'proteins': ArchaeaGenomeProteinsView,
+        'tRNAs': ArchaeaGenomeTRNAsView,
+        'crispr': ArchaeaGenomeCRISPRCasView,
+        'anti_crispr': ArchaeaGenomeAntiCRISPRView,
+        'secondary_metabolites': ArchaeaGenomeSecondaryMetabolitesView,
+        'signal_peptides': ArchaeaGenomeSignalPeptidesView,
+        'virulence_factors': ArchaeaGenomeVirulenceFactorsView,
+        'antibiotic_resistance': ArchaeaGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': ArchaeaGenomeTransmembraneHelicesView,
+    }
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGArchaeaGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': UnArchaeaGenomeDetailView,
+        'proteins': UnArchaeaGenomeProteinsView,
+        'tRNAs': UnMAGArchaeaGenomeTRNAsView,
+        'crispr': UnMAGArchaeaGenomeCRISPRCasView,
+        'anti_crispr': UnMAGArchaeaGenomeAntiCRISPRView,
+        'secondary_metabolites': UnMAGArchaeaGenomeSecondaryMetabolitesView,
+        'signal_peptides': UnMAGArchaeaGenomeSignalPeptidesView,
+        'virulence_factors': UnMAGArchaeaGenomeVirulenceFactorsView,
+        'antibiotic_resistance': UnMAGArchaeaGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': UnMAGArchaeaGenomeTransmembraneHelicesView,
+    }
 
 
-class UnMAGArchaeaGenomesBatchDownloadView(GenericBatchDownloadView):
-    model = UnMAGArchaea
-    entity_name = 'genome'
+class ArchaeaGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'MAG'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
 
-        writer.writerow(get_csv_header())
+class UnMAGArchaeaGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'unMAG'
 
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
 
-        buffer.seek(0)
+class ArchaeaGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'MAG'
+
 
-        return buffer
+class UnMAGArchaeaGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Archaea'
+    mag_dir = 'unMAG'
@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from archaea_database.models import MAGArchaeaProtein, UnMAGArchaeaProtein
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from archaea_database.serializers.proteins_serializers import MAGArchaeaProteinSerializer, UnMAGArchaeaProteinSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -79,7 +80,14 @@ class ArchaeaProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGArchaeaProtein.objects.all()
     serializer_class = MAGArchaeaProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('archaea_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -91,11 +99,15 @@ class ArchaeaProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class ArchaeaProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = ArchaeaProteinsView
+
+
 class ArchaeaProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaProteinStrand').value
+        strand_values = get_filter_option('MAGArchaeaProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaProteinCOGCategory').value
+        cog_category_values = get_filter_option('MAGArchaeaProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -133,18 +145,11 @@ class ArchaeaProteinsBatchDownloadView(GenericBatchDownloadView):
     model = MAGArchaeaProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
@@ -156,7 +161,14 @@ class UnMAGArchaeaProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGArchaeaProtein.objects.all()
     serializer_class = UnMAGArchaeaProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('archaea_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -168,11 +180,15 @@ class UnMAGArchaeaProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class UnMAGArchaeaProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGArchaeaProteinsView
+
+
 class UnMAGArchaeaProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaProteinStrand').value
+        strand_values = get_filter_option('UnMAGArchaeaProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaProteinCOGCategory').value
+        cog_category_values = get_filter_option('UnMAGArchaeaProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -210,18 +226,11 @@ class UnMAGArchaeaProteinsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGArchaeaProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
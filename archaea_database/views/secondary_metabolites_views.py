@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from archaea_database.serializers.secondary_metabolites_serializers import MAGArchaeaSecondaryMetaboliteSerializer, \
     UnMAGArchaeaSecondaryMetaboliteSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -62,6 +62,7 @@ class ArchaeaSecondaryMetabolitesView(GenericTableQueryView):
     queryset = MAGArchaeaSecondaryMetaboliteRegion.objects.all()
     serializer_class = MAGArchaeaSecondaryMetaboliteSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('type',)
     search_fields = [
         'archaea_id', 'contig_id', 'source', 'region', 'start', 'end', 'similarity'
     ]
@@ -72,7 +73,7 @@ class ArchaeaSecondaryMetabolitesView(GenericTableQueryView):
 
 class ArchaeaSecondaryMetabolitesFilterOptionsView(APIView):
     def get(self, request):
-        type_values = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaSecondaryMetabolitesTypes').value
+        type_values = get_filter_option('MAGArchaeaSecondaryMetabolitesTypes')
 
         return Response({
             'type': type_values
@@ -111,18 +112,11 @@ class ArchaeaSecondaryMetabolitesBatchDownloadView(GenericBatchDownloadView):
     model = MAGArchaeaSecondaryMetaboliteRegion
     entity_name = 'secondary_metabolite'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for secondary_metabolite in queryset:
-            writer.writerow(to_csv_row(secondary_metabolite))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, secondary_metabolite):
+        return to_csv_row(secondary_metabolite)
 
     def get_filter_q(self, payload):
         return get_secondary_metabolites_filter_q(payload)
@@ -135,6 +129,7 @@ class UnMAGArchaeaSecondaryMetabolitesView(GenericTableQueryView):
     queryset = UnMAGArchaeaSecondaryMetaboliteRegion.objects.all()
     serializer_class = UnMAGArchaeaSecondaryMetaboliteSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('type',)
     search_fields = [
         'archaea_id', 'contig_id', 'source', 'region', 'start', 'end', 'similarity'
     ]
@@ -145,7 +140,7 @@ class UnMAGArchaeaSecondaryMetabolitesView(GenericTableQueryView):
 
 class UnMAGArchaeaSecondaryMetabolitesFilterOptionsView(APIView):
     def get(self, request):
-        type_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaSecondaryMetabolitesTypes').value
+        type_values = get_filter_option('UnMAGArchaeaSecondaryMetabolitesTypes')
 
         return Response({
             'type': type_values
@@ -184,18 +179,11 @@ class UnMAGArchaeaSecondaryMetabolitesBatchDownloadView(GenericBatchDownloadView
     model = UnMAGArchaeaSecondaryMetaboliteRegion
     entity_name = 'secondary_metabolite'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for secondary_metabolite in queryset:
-            writer.writerow(to_csv_row(secondary_metabolite))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, secondary_metabolite):
+        return to_csv_row(secondary_metabolite)
 
     def get_filter_q(self, payload):
         return get_secondary_metabolites_filter_q(payload)
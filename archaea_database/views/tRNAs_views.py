@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 import re
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from archaea_database.models import MAGArchaeaTRNA, UnMAGArchaeaTRNA
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from archaea_database.serializers.tRNAs_serializers import MAGArchaeaTRNASerializer, UnMAGArchaeaTRNASerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -63,6 +64,8 @@ class ArchaeaTRNAsView(GenericTableQueryView):
     queryset = MAGArchaeaTRNA.objects.all()
     serializer_class = MAGArchaeaTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'archaea_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -71,9 +74,13 @@ class ArchaeaTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class ArchaeaTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = ArchaeaTRNAsView
+
+
 class ArchaeaTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaTRNATypes').value
+        trna_types = get_filter_option('MAGArchaeaTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -110,18 +117,11 @@ class ArchaeaTRNABatchDownloadView(GenericBatchDownloadView):
     model = MAGArchaeaTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -134,6 +134,8 @@ class UnMAGArchaeaTRNAsView(GenericTableQueryView):
     queryset = UnMAGArchaeaTRNA.objects.all()
     serializer_class = UnMAGArchaeaTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'archaea_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -142,9 +144,13 @@ class UnMAGArchaeaTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class UnMAGArchaeaTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGArchaeaTRNAsView
+
+
 class UnMAGArchaeaTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaTRNATypes').value
+        trna_types = get_filter_option('UnMAGArchaeaTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -181,18 +187,11 @@ class UnMAGArchaeaTRNABatchDownloadView(GenericBatchDownloadView):
     model = UnMAGArchaeaTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from archaea_database.serializers.transmembrane_helices_serializers import MAGArchaeaTransmembraneHelicesSerializer, \
     UnMAGArchaeaTransmembraneHelicesSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -50,6 +50,7 @@ class ArchaeaTransmembraneHelicesView(GenericTableQueryView):
     queryset = MAGArchaeaTransmembraneHelices.objects.all()
     serializer_class = MAGArchaeaTransmembraneHelicesSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('predicted_tmh_count',)
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'source'
     ]
@@ -61,7 +62,7 @@ class ArchaeaTransmembraneHelicesView(GenericTableQueryView):
 class ArchaeaTransmembraneHelicesFilterOptionsView(APIView):
     def get(self, request):
         predicted_tmh_count_values = (
-            MicrobeFilterOptionsNew.objects.get(key='MAGArchaeaTransmembraneHelicesTMHCount').value)
+            get_filter_option('MAGArchaeaTransmembraneHelicesTMHCount'))
 
         return Response({
             'predicted_tmh_count': predicted_tmh_count_values
@@ -110,20 +111,14 @@ class ArchaeaTransmembraneHelicesBatchDownloadView(GenericBatchDownloadView):
     def get_queryset(self):
         return super().get_queryset().prefetch_related('helices')
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for transmembrane_helices in queryset:
-            helices = transmembrane_helices.helices.all()
-            for helix in helices:
-                writer.writerow(to_csv_row(transmembrane_helices, helix))
-
-        buffer.seek(0)
-
-        return buffer
+    def iter_csv_rows(self, queryset):
+        # 螺旋按块预取，避免一次载入全部结果
+        for transmembrane_helices in queryset.iterator(chunk_size=self.csv_chunk_size):
+            for helix in transmembrane_helices.helices.all():
+                yield to_csv_row(transmembrane_helices, helix)
 
 
 # UnMAG Transmembrane Helices Views
@@ -133,6 +128,7 @@ class UnMAGArchaeaTransmembraneHelicesView(GenericTableQueryView):
     queryset = UnMAGArchaeaTransmembraneHelices.objects.all()
     serializer_class = UnMAGArchaeaTransmembraneHelicesSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('predicted_tmh_count',)
     search_fields = [
         'archaea_id', 'contig_id', 'protein_id', 'source'
     ]
@@ -144,7 +140,7 @@ class UnMAGArchaeaTransmembraneHelicesView(GenericTableQueryView):
 class UnMAGArchaeaTransmembraneHelicesFilterOptionsView(APIView):
     def get(self, request):
         predicted_tmh_count_values = (
-            MicrobeFilterOptionsNew.objects.get(key='UnMAGArchaeaTransmembraneHelicesTMHCount').value)
+            get_filter_option('UnMAGArchaeaTransmembraneHelicesTMHCount'))
 
         return Response({
             'predicted_tmh_count': predicted_tmh_count_values
@@ -193,17 +189,11 @@ class UnMAGArchaeaTransmembraneHelicesBatchDownloadView(GenericBatchDownloadView
     def get_queryset(self):
         return super().get_queryset().prefetch_related('helices')
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for transmembrane_helices in queryset:
-            helices = transmembrane_helices.helices.all()
-            for helix in helices:
-                writer.writerow(to_csv_row(transmembrane_helices, helix))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def iter_csv_rows(self, queryset):
+        # 螺旋按块预取，避免一次载入全部结果
+        for transmembrane_helices in queryset.iterator(chunk_size=self.csv_chunk_size):
+            for helix in transmembrane_helices.helices.all():
+                yield to_csv_row(transmembrane_helices, helix)
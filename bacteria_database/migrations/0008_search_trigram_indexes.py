@@ -0,0 +1,76 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bacteria_database", "0007_remove_magbacteriacrisprcas_consensus_prediction_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="mb_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="mb_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="umb_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="umb_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="mb_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="mb_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="mb_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="umb_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="umb_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="umb_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,226 @@
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bacteria_database", "0008_search_trigram_indexes"),
+    ]
+
+    operations = [
+        # GiST operator classes for the plain genome id and contig_id columns of the indexes
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="magbacteriaprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriatrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriacrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriacrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriaanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriasecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriasignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriavirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriaantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magbacteriatransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriaprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriatrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriacrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriacrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriaanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriasecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriasignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriavirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriaantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagbacteriatransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriatrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriacrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriasecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriasignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriavirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriatransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="mb_tmh_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriatrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriacrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriasecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriasignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriavirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriatransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["bacteria_id", "contig_id", "location"], name="umb_tmh_location_gist_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bacteria_database", "0009_genome_location_ranges"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=models.Index(fields=["organism_name", "id"], name="mb_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=models.Index(fields=["species", "id"], name="mb_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=models.Index(fields=["total_sequence_length", "id"], name="mb_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteria",
+            index=models.Index(fields=["gc_content", "id"], name="mb_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=models.Index(fields=["bacteria_id", "id"], name="mb_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magbacteriaprotein",
+            index=models.Index(fields=["protein_id", "id"], name="mb_protein_protein_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=models.Index(fields=["organism_name", "id"], name="umb_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=models.Index(fields=["species", "id"], name="umb_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=models.Index(fields=["total_sequence_length", "id"], name="umb_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteria",
+            index=models.Index(fields=["gc_content", "id"], name="umb_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=models.Index(fields=["bacteria_id", "id"], name="umb_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriaprotein",
+            index=models.Index(fields=["protein_id", "id"], name="umb_protein_protein_keyset_idx"),
+        ),
+    ]
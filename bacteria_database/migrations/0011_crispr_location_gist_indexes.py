@@ -0,0 +1,23 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("bacteria_database", "0010_keyset_sort_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magbacteriacrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="mb_crispr_location_gist_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagbacteriacrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="umb_crispr_location_gist_idx"),
+        ),
+    ]
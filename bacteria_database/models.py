@@ -1,7 +1,7 @@
 from django.db import models
 
-from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.fields import ArrayField, BigIntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
 
 
 # MAG Bacteria Models
@@ -31,6 +31,12 @@ class MAGBacteria(models.Model):
         verbose_name_plural = "MAG Bacteria Genomes"
         indexes = [
             GinIndex(fields=['bacteria_id'], name='mb_bacteria_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='mb_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='mb_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='mb_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='mb_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='mb_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='mb_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -81,6 +87,7 @@ class MAGBacteriaProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -115,6 +122,12 @@ class MAGBacteriaProtein(models.Model):
         verbose_name_plural = "MAG Bacteria Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='mb_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='mb_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='mb_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='mb_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_protein_location_gist_idx'),
+            models.Index(fields=['bacteria_id', 'id'], name='mb_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='mb_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -133,6 +146,7 @@ class MAGBacteriaTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -141,6 +155,9 @@ class MAGBacteriaTRNA(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria tRNA Annotation"
         verbose_name_plural = "MAG Bacteria tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -152,6 +169,7 @@ class MAGBacteriaCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -165,6 +183,7 @@ class MAGBacteriaCRISPRCas(models.Model):
         verbose_name_plural = "MAG Bacteria CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='mb_cas_subtype_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -176,6 +195,7 @@ class MAGBacteriaCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -183,6 +203,10 @@ class MAGBacteriaCRISPR(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria CRISPR Annotation"
         verbose_name_plural = "MAG Bacteria CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='mb_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -200,6 +224,7 @@ class MAGBacteriaAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -216,6 +241,9 @@ class MAGBacteriaAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria Anti-CRISPR Annotation"
         verbose_name_plural = "MAG Bacteria Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.bacteria_id})"
@@ -229,6 +257,7 @@ class MAGBacteriaSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -244,6 +273,7 @@ class MAGBacteriaSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "MAG Bacteria Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='mb_sm_type_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -254,6 +284,7 @@ class MAGBacteriaSignalPeptidePrediction(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -270,6 +301,9 @@ class MAGBacteriaSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria Signal Peptide Prediction"
         verbose_name_plural = "MAG Bacteria Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -279,6 +313,7 @@ class MAGBacteriaVirulenceFactor(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -305,6 +340,9 @@ class MAGBacteriaVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria Virulence Factor"
         verbose_name_plural = "MAG Bacteria Virulence Factors"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -314,6 +352,7 @@ class MAGBacteriaAntibioticResistance(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -344,6 +383,7 @@ class MAGBacteriaAntibioticResistance(models.Model):
         verbose_name_plural = "MAG Bacteria Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='mb_arg_type_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -354,6 +394,7 @@ class MAGBacteriaTransmembraneHelices(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -366,6 +407,9 @@ class MAGBacteriaTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "MAG Bacteria Transmembrane Helix"
         verbose_name_plural = "MAG Bacteria Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='mb_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
@@ -412,6 +456,12 @@ class UnMAGBacteria(models.Model):
         verbose_name_plural = "UnMAG Bacteria Genomes"
         indexes = [
             GinIndex(fields=['bacteria_id'], name='umb_bacteria_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='umb_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='umb_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='umb_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='umb_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='umb_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='umb_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -462,6 +512,7 @@ class UnMAGBacteriaProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -496,6 +547,12 @@ class UnMAGBacteriaProtein(models.Model):
         verbose_name_plural = "UnMAG Bacteria Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='umb_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='umb_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='umb_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='umb_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_protein_location_gist_idx'),
+            models.Index(fields=['bacteria_id', 'id'], name='umb_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='umb_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -514,6 +571,7 @@ class UnMAGBacteriaTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -522,6 +580,9 @@ class UnMAGBacteriaTRNA(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria tRNA Annotation"
         verbose_name_plural = "UnMAG Bacteria tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -533,6 +594,7 @@ class UnMAGBacteriaCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -546,6 +608,7 @@ class UnMAGBacteriaCRISPRCas(models.Model):
         verbose_name_plural = "UnMAG Bacteria CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='umb_cas_subtype_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -557,6 +620,7 @@ class UnMAGBacteriaCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -564,6 +628,10 @@ class UnMAGBacteriaCRISPR(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria CRISPR Annotation"
         verbose_name_plural = "UnMAG Bacteria CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='umb_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -581,6 +649,7 @@ class UnMAGBacteriaAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -597,6 +666,9 @@ class UnMAGBacteriaAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria Anti-CRISPR Annotation"
         verbose_name_plural = "UnMAG Bacteria Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.bacteria_id})"
@@ -610,6 +682,7 @@ class UnMAGBacteriaSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -625,6 +698,7 @@ class UnMAGBacteriaSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "UnMAG Bacteria Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='umb_sm_type_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -635,6 +709,7 @@ class UnMAGBacteriaSignalPeptidePrediction(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -651,6 +726,9 @@ class UnMAGBacteriaSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria Signal Peptide Prediction"
         verbose_name_plural = "UnMAG Bacteria Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -660,6 +738,7 @@ class UnMAGBacteriaVirulenceFactor(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -686,6 +765,9 @@ class UnMAGBacteriaVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria Virulence Factor"
         verbose_name_plural = "UnMAG Bacteria Virulence Factors"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -695,6 +777,7 @@ class UnMAGBacteriaAntibioticResistance(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -725,6 +808,7 @@ class UnMAGBacteriaAntibioticResistance(models.Model):
         verbose_name_plural = "UnMAG Bacteria Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='umb_arg_type_gin_idx'),
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -735,6 +819,7 @@ class UnMAGBacteriaTransmembraneHelices(models.Model):
     bacteria_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -747,6 +832,9 @@ class UnMAGBacteriaTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "UnMAG Bacteria Transmembrane Helix"
         verbose_name_plural = "UnMAG Bacteria Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['bacteria_id', 'contig_id', 'location'], name='umb_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
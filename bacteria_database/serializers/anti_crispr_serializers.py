@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaAntiCRISPRAnnotation, UnMAGBacte
 class MAGBacteriaAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
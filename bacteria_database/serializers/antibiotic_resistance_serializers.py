@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaAntibioticResistance, UnMAGBacte
 class MAGBacteriaAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,7 +6,7 @@ from bacteria_database.models import MAGBacteriaCRISPRCas, MAGBacteriaCRISPR, Un
 class MAGBacteriaCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class MAGBacteriaCRISPRSerializer(serializers.ModelSerializer):
@@ -14,13 +14,13 @@ class MAGBacteriaCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGBacteriaCRISPR
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaCRISPRSerializer(serializers.ModelSerializer):
@@ -28,4 +28,4 @@ class UnMAGBacteriaCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGBacteriaCRISPR
-        fields = '__all__'
+        exclude = ('location',)
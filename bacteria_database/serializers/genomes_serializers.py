@@ -1,7 +1,8 @@
 from rest_framework import serializers
-import pandas as pd
 import os
 
+from utils.annotation_summary import AnnotationSummaryMixin
+from utils.read_files import count_tsv_proteins, count_tsv_rows
 from bacteria_database.models import MAGBacteria, UnMAGBacteria, UnMAGBacteriaProtein, \
     UnMAGBacteriaAntibioticResistance, UnMAGBacteriaTRNA, UnMAGBacteriaCRISPR, UnMAGBacteriaAntiCRISPRAnnotation, \
     UnMAGBacteriaSecondaryMetaboliteRegion, UnMAGBacteriaSignalPeptidePrediction, UnMAGBacteriaVirulenceFactor, \
@@ -35,12 +36,12 @@ class MAGBacteriaSerializer(serializers.ModelSerializer):
         for bacteria_id in obj.bacteria_id:
             g = self._gtdb_map.get(bacteria_id)
             if g:
-                return MAGBacteriaGTDBSerializer(g, context=self.context).data
+                return g
 
         return None
 
 
-class MAGBacteriaDetailSerializer(serializers.ModelSerializer):
+class MAGBacteriaDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -51,51 +52,50 @@ class MAGBacteriaDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Bacteria'
+    summary_mag_status = 'MAG'
+
     class Meta:
         model = MAGBacteria
         fields = '__all__'
 
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Bacteria/MAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGBacteriaProtein.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return MAGBacteriaTRNA.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return MAGBacteriaCRISPR.objects.filter(cas__bacteria_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return MAGBacteriaAntiCRISPRAnnotation.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return MAGBacteriaSecondaryMetaboliteRegion.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return MAGBacteriaSignalPeptidePrediction.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return MAGBacteriaVirulenceFactor.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Bacteria/MAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return MAGBacteriaAntibioticResistance.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Bacteria/MAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
         # return MAGBacteriaTransmembraneHelices.objects.filter(bacteria_id=obj.unique_id).count()
 
 
@@ -123,12 +123,12 @@ class UnMAGBacteriaSerializer(serializers.ModelSerializer):
         for bacteria_id in obj.bacteria_id:
             g = self._gtdb_map.get(bacteria_id)
             if g:
-                return UnMAGBacteriaGTDBSerializer(g, context=self.context).data
+                return g
 
         return None
 
 
-class UnMAGBacteriaDetailSerializer(serializers.ModelSerializer):
+class UnMAGBacteriaDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -139,49 +139,48 @@ class UnMAGBacteriaDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Bacteria'
+    summary_mag_status = 'unMAG'
+
     class Meta:
         model = UnMAGBacteria
         fields = '__all__'
 
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Bacteria/unMAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return UnMAGBacteriaProtein.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return UnMAGBacteriaTRNA.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return UnMAGBacteriaCRISPR.objects.filter(cas__bacteria_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return UnMAGBacteriaAntiCRISPRAnnotation.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return UnMAGBacteriaSecondaryMetaboliteRegion.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return UnMAGBacteriaSignalPeptidePrediction.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return UnMAGBacteriaVirulenceFactor.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Bacteria/unMAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return UnMAGBacteriaAntibioticResistance.objects.filter(bacteria_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Bacteria/unMAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
         # return UnMAGBacteriaTransmembraneHelices.objects.filter(bacteria_id=obj.unique_id).count()
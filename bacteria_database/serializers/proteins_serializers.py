@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaProtein, UnMAGBacteriaProtein
 class MAGBacteriaProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaProtein
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaProtein
-        fields = '__all__'
+        exclude = ('location',)
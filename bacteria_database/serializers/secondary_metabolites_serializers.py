@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaSecondaryMetaboliteRegion, UnMAG
 class MAGBacteriaSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
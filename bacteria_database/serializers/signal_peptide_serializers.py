@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaSignalPeptidePrediction, UnMAGBa
 class MAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaTRNA, UnMAGBacteriaTRNA
 class MAGBacteriaTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaTRNA
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaTRNA
-        fields = '__all__'
+        exclude = ('location',)
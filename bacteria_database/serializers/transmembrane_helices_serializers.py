@@ -15,7 +15,7 @@ class MAGBacteriaTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGBacteriaTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaHelicesSerializer(serializers.ModelSerializer):
@@ -29,4 +29,4 @@ class UnMAGBacteriaTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGBacteriaTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
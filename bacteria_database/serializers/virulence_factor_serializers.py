@@ -6,10 +6,10 @@ from bacteria_database.models import MAGBacteriaVirulenceFactor, UnMAGBacteriaVi
 class MAGBacteriaVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGBacteriaVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGBacteriaVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGBacteriaVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
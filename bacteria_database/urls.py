@@ -14,7 +14,9 @@ urlpatterns = [
     path('genome_batch_download', genomes_views.BacteriaGenomesBatchDownloadView.as_view()),
     path('genome_batch_download_unmag', genomes_views.UnMAGBacteriaGenomesBatchDownloadView.as_view()),
     path('proteins', proteins_views.BacteriaProteinsView.as_view()),
+    path('proteins_fields', proteins_views.BacteriaProteinsFieldsView.as_view()),
     path('proteins_unmag', proteins_views.UnMAGBacteriaProteinsView.as_view()),
+    path('proteins_fields_unmag', proteins_views.UnMAGBacteriaProteinsFieldsView.as_view()),
     path('proteins_filter_options', proteins_views.BacteriaProteinsFilterOptionsView.as_view()),
     path('proteins_filter_options_unmag', proteins_views.UnMAGBacteriaProteinsFilterOptionsView.as_view()),
     path('protein_single_download', proteins_views.BacteriaProteinsSingleDownloadView.as_view()),
@@ -22,7 +24,9 @@ urlpatterns = [
     path('protein_batch_download', proteins_views.BacteriaProteinsBatchDownloadView.as_view()),
     path('protein_batch_download_unmag', proteins_views.UnMAGBacteriaProteinsBatchDownloadView.as_view()),
     path('tRNAs', tRNAs_views.BacteriaTRNAsView.as_view()),
+    path('tRNAs_fields', tRNAs_views.BacteriaTRNAsFieldsView.as_view()),
     path('tRNAs_unmag', tRNAs_views.UnMAGBacteriaTRNAsView.as_view()),
+    path('tRNAs_fields_unmag', tRNAs_views.UnMAGBacteriaTRNAsFieldsView.as_view()),
     path('tRNAs_filter_options', tRNAs_views.BacteriaTRNAFilterOptionsView.as_view()),
     path('tRNAs_filter_options_unmag', tRNAs_views.UnMAGBacteriaTRNAFilterOptionsView.as_view()),
     path('tRNA_single_download', tRNAs_views.BacteriaTRNASingleDownloadView.as_view()),
@@ -41,7 +45,10 @@ urlpatterns = [
     path('CRISPR_Cas_system_batch_download_unmag',
          crisprcas_views.UnMAGBacteriaCRISPRCasSystemsBatchDownloadView.as_view()),
     path('anti_crispr_annotations', anti_cripsr_views.BacteriaAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields', anti_cripsr_views.BacteriaAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_unmag', anti_cripsr_views.UnMAGBacteriaAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields_unmag',
+         anti_cripsr_views.UnMAGBacteriaAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_filter_options',
          anti_cripsr_views.BacteriaAntiCRISPRAnnotationsFilterOptionsView.as_view()),
     path('anti_crispr_annotations_filter_options_unmag',
@@ -93,7 +100,11 @@ urlpatterns = [
     path('virulence_factor_batch_download_unmag',
          virulence_factor_views.UnMAGBacteriaVirulenceFactorsBatchDownloadView.as_view()),
     path('antibiotic_resistances', antibiotic_resistance_views.BacteriaAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields',
+         antibiotic_resistance_views.BacteriaAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_unmag', antibiotic_resistance_views.UnMAGBacteriaAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields_unmag',
+         antibiotic_resistance_views.UnMAGBacteriaAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_filter_options',
          antibiotic_resistance_views.BacteriaAntibioticResistancesFilterOptionsView.as_view()),
     path('antibiotic_resistances_filter_options_unmag',
@@ -144,6 +155,12 @@ urlpatterns = [
     path('genome_detail_transmembrane_helices_unmag',
          genomes_views.UnMAGBacteriaGenomeTransmembraneHelicesView.as_view()
          ),
+    path('genome_bundle', genomes_views.BacteriaGenomeBundleView.as_view()),
+    path('genome_bundle_unmag', genomes_views.UnMAGBacteriaGenomeBundleView.as_view()),
     path('genome_fasta', genomes_views.BacteriaGenomeFASTAView.as_view()),
     path('genome_fasta_unmag', genomes_views.UnMAGBacteriaGenomeFASTAView.as_view()),
+    path('genome_tracks', genomes_views.BacteriaGenomeTrackView.as_view()),
+    path('genome_tracks_unmag', genomes_views.UnMAGBacteriaGenomeTrackView.as_view()),
+    path('genome_overlaps', genomes_views.BacteriaGenomeOverlapView.as_view()),
+    path('genome_overlaps_unmag', genomes_views.UnMAGBacteriaGenomeOverlapView.as_view()),
 ]
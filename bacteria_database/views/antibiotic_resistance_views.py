@@ -10,13 +10,14 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from bacteria_database.models import MAGBacteriaAntibioticResistance, UnMAGBacteriaAntibioticResistance
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from bacteria_database.serializers.antibiotic_resistance_serializers import MAGBacteriaAntibioticResistanceSerializer, \
     UnMAGBacteriaAntibioticResistanceSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -71,6 +72,10 @@ class BacteriaAntibioticResistancesView(GenericTableQueryView):
     queryset = MAGBacteriaAntibioticResistance.objects.all()
     serializer_class = MAGBacteriaAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -79,10 +84,14 @@ class BacteriaAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class BacteriaAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = BacteriaAntibioticResistancesView
+
+
 class BacteriaAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('MAGBacteriaAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('MAGBacteriaAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -121,18 +130,11 @@ class BacteriaAntibioticResistancesBatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteriaAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -145,6 +147,10 @@ class UnMAGBacteriaAntibioticResistancesView(GenericTableQueryView):
     queryset = UnMAGBacteriaAntibioticResistance.objects.all()
     serializer_class = UnMAGBacteriaAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -153,10 +159,14 @@ class UnMAGBacteriaAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class UnMAGBacteriaAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGBacteriaAntibioticResistancesView
+
+
 class UnMAGBacteriaAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('UnMAGBacteriaAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('UnMAGBacteriaAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -195,18 +205,11 @@ class UnMAGBacteriaAntibioticResistancesBatchDownloadView(GenericBatchDownloadVi
     model = UnMAGBacteriaAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -15,7 +15,7 @@ from bacteria_database.models import MAGBacteriaCRISPRCas, MAGBacteriaCRISPR, Un
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from bacteria_database.serializers.crisprcas_serializers import MAGBacteriaCRISPRSerializer, UnMAGBacteriaCRISPRSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -76,6 +76,7 @@ class BacteriaCRISPRCasSystemsView(GenericTableQueryView):
     queryset = MAGBacteriaCRISPR.objects.all()
     serializer_class = MAGBacteriaCRISPRSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('crispr_subtype', 'cas__cas_subtype')
     search_fields = [
         'crispr_id', 'crispr_start', 'crispr_end', 'repeat_sequence', 'cas__bacteria_id',
         'cas__contig_id', 'cas__consensus_prediction', 'cas__cas_id'
@@ -93,9 +94,9 @@ class BacteriaCRISPRCasSystemsView(GenericTableQueryView):
 
 class BacteriaCRISPRCasSystemsFilterOptionsView(APIView):
     def get(self, request):
-        cas_subtype_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaCRISPRCasTypes').value
+        cas_subtype_values = get_filter_option('MAGBacteriaCRISPRCasTypes')
 
-        crispr_subtype_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaCRISPRTypes').value
+        crispr_subtype_values = get_filter_option('MAGBacteriaCRISPRTypes')
 
         return Response({
             'crispr_subtype': crispr_subtype_values,
@@ -139,23 +140,16 @@ class BacteriaCRISPRCasSystemsSingleDownloadView(GenericSingleDownloadView):
 class BacteriaCRISPRCasSystemsBatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteriaCRISPR
     entity_name = 'CRISPR/Cas_Systems'
+    csv_related = ('cas',)
 
     def get_queryset(self):
         return super().get_queryset().select_related('cas')
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for crispr in queryset:
-            cas = crispr.cas
-            writer.writerow(to_csv_row(crispr, cas))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, crispr):
+        return to_csv_row(crispr, crispr.cas)
 
     def get_filter_q(self, payload):
         return get_CRISPR_Cas_systems_filter_q(payload)
@@ -168,6 +162,7 @@ class UnMAGBacteriaCRISPRCasSystemsView(GenericTableQueryView):
     queryset = UnMAGBacteriaCRISPR.objects.all()
     serializer_class = UnMAGBacteriaCRISPRSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('crispr_subtype', 'cas__cas_subtype')
     search_fields = [
         'crispr_id', 'crispr_start', 'crispr_end', 'repeat_sequence', 'cas__bacteria_id',
         'cas__contig_id', 'cas__consensus_prediction', 'cas__cas_id'
@@ -185,9 +180,9 @@ class UnMAGBacteriaCRISPRCasSystemsView(GenericTableQueryView):
 
 class UnMAGBacteriaCRISPRCasSystemsFilterOptionsView(APIView):
     def get(self, request):
-        cas_subtype_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaCRISPRCasTypes').value
+        cas_subtype_values = get_filter_option('UnMAGBacteriaCRISPRCasTypes')
 
-        crispr_subtype_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaCRISPRTypes').value
+        crispr_subtype_values = get_filter_option('UnMAGBacteriaCRISPRTypes')
 
         return Response({
             'crispr_subtype': crispr_subtype_values,
@@ -231,23 +226,16 @@ class UnMAGBacteriaCRISPRCasSystemsSingleDownloadView(GenericSingleDownloadView)
 class UnMAGBacteriaCRISPRCasSystemsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGBacteriaCRISPR
     entity_name = 'CRISPR/Cas_Systems'
+    csv_related = ('cas',)
 
     def get_queryset(self):
         return super().get_queryset().select_related('cas')
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for crispr in queryset:
-            cas = crispr.cas
-            writer.writerow(to_csv_row(crispr, cas))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, crispr):
+        return to_csv_row(crispr, crispr.cas)
 
     def get_filter_q(self, payload):
         return get_CRISPR_Cas_systems_filter_q(payload)
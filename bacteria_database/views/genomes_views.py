@@ -3,17 +3,17 @@ from rest_framework.views import APIView
 from rest_framework import status
 
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse, FileResponse
+from django.http import HttpResponse
 from django.db.models import Q
 
 from io import StringIO
 import csv
 import os
-import gzip
-from Bio import SeqIO
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView, \
+    GenericGenomeBundleView, GenericGenomeFASTAView, GenericGenomeTrackView, \
+    GenericGenomeOverlapView
 from bacteria_database.models import MAGBacteria, UnMAGBacteria, MAGBacteriaProtein, UnMAGBacteriaProtein, \
     MAGBacteriaTRNA, UnMAGBacteriaTRNA, MAGBacteriaCRISPR, UnMAGBacteriaCRISPR, MAGBacteriaSecondaryMetaboliteRegion, \
     UnMAGBacteriaSecondaryMetaboliteRegion, MAGBacteriaAntiCRISPRAnnotation, UnMAGBacteriaAntiCRISPRAnnotation, \
@@ -21,7 +21,7 @@ from bacteria_database.models import MAGBacteria, UnMAGBacteria, MAGBacteriaProt
     UnMAGBacteriaVirulenceFactor, MAGBacteriaTransmembraneHelices, MAGBacteriaAntibioticResistance, \
     UnMAGBacteriaAntibioticResistance, UnMAGBacteriaTransmembraneHelices, MAGBacteriaGTDB, UnMAGBacteriaGTDB
 from bacteria_database.serializers.genomes_serializers import MAGBacteriaSerializer, UnMAGBacteriaSerializer, \
-    MAGBacteriaDetailSerializer, UnMAGBacteriaDetailSerializer
+    MAGBacteriaDetailSerializer, UnMAGBacteriaDetailSerializer, MAGBacteriaGTDBSerializer, UnMAGBacteriaGTDBSerializer
 from bacteria_database.serializers.proteins_serializers import MAGBacteriaProteinSerializer, \
     UnMAGBacteriaProteinSerializer
 from bacteria_database.serializers.tRNAs_serializers import MAGBacteriaTRNASerializer, UnMAGBacteriaTRNASerializer
@@ -41,12 +41,15 @@ from bacteria_database.serializers.transmembrane_helices_serializers import MAGB
     UnMAGBacteriaTransmembraneHelicesSerializer
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer, GenomeDetailSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
+from utils.fast_serializer import FastListSerializer
 from utils.read_files import *
+from utils.file_cache import parsed_file_cache
 
 from MicrobialScope_api.constant import MEDIA_DATA_DIR
+from utils.file_serving import GENOME_FILE_TYPES
 
 
 def get_csv_header():
@@ -79,7 +82,7 @@ def get_genome_search_q(search_content):
     if search_content['field'] == 'bacteria_id':
         return Q(**{f"{search_content['field']}__contains": [search_content['value'].strip()]})
 
-    return Q(**{f"{search_content['field']}__icontains": search_content['value']})
+    return Q(**{f"{search_content['field']}__ilike_contains": search_content['value']})
 
 
 # MAG Genome Views
@@ -88,7 +91,11 @@ class BacteriaGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGBacteria.objects.all()
     serializer_class = MAGBacteriaSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'bacteria_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'bacteria_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -102,8 +109,11 @@ class BacteriaGenomesView(GenericTableQueryView):
 
         if not unique_ids:
             return {"gtdb_map": {}}
-        gtdb_qs = MAGBacteriaGTDB.objects.filter(unique_id__in=unique_ids)
-        gtdb_map = {x.unique_id: x for x in gtdb_qs}
+        # 每页一次查询并序列化为字典，get_gtdb 直接返回
+        gtdb_rows = FastListSerializer(MAGBacteriaGTDBSerializer).serialize_queryset(
+            MAGBacteriaGTDB.objects.filter(unique_id__in=unique_ids)
+        )
+        gtdb_map = {row['unique_id']: row for row in gtdb_rows}
         return {"gtdb_map": gtdb_map}
 
 
@@ -145,7 +155,7 @@ class BacteriaGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_bacteria_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_bacteria_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -261,7 +271,7 @@ class BacteriaGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_bacteria_arg_file(arg_file)
+                args = parsed_file_cache.get(read_bacteria_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -294,46 +304,20 @@ class BacteriaGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_bacteria_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_bacteria_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class BacteriaGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Bacteria',
-                'MAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class BacteriaGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'MAG'
 
 
 class BacteriaGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaAssemblyLevel').value
+        assembly_level_values = get_filter_option('MAGBacteriaAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -363,38 +347,8 @@ class BacteriaGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'MAG', 'fna', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'MAG', 'gbk', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'MAG', 'gff', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Bacteria', 'MAG')
 
         return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
@@ -403,18 +357,11 @@ class BacteriaGenomesBatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteria
     entity_name = 'genome'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
 
 # unMAG Genome Views
@@ -423,7 +370,11 @@ class UnMAGBacteriaGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGBacteria.objects.all()
     serializer_class = UnMAGBacteriaSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'bacteria_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'bacteria_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -437,8 +388,11 @@ class UnMAGBacteriaGenomesView(GenericTableQueryView):
 
         if not unique_ids:
             return {"gtdb_map": {}}
-        gtdb_qs = UnMAGBacteriaGTDB.objects.filter(unique_id__in=unique_ids)
-        gtdb_map = {x.unique_id: x for x in gtdb_qs}
+        # 每页一次查询并序列化为字典，get_gtdb 直接返回
+        gtdb_rows = FastListSerializer(UnMAGBacteriaGTDBSerializer).serialize_queryset(
+            UnMAGBacteriaGTDB.objects.filter(unique_id__in=unique_ids)
+        )
+        gtdb_map = {row['unique_id']: row for row in gtdb_rows}
         return {"gtdb_map": gtdb_map}
 
 
@@ -627,40 +581,14 @@ class UnMAGBacteriaGenomeTransmembraneHelicesView(APIView):
 #         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class UnMAGBacteriaGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Bacteria',
-                'unMAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGBacteriaGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'unMAG'
 
 
 class UnMAGBacteriaGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaAssemblyLevel').value
+        assembly_level_values = get_filter_option('UnMAGBacteriaAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -690,55 +618,68 @@ class UnMAGBacteriaGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'unMAG', 'fna', file_name)
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Bacteria', 'unMAG')
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'unMAG', 'gbk', file_name)
+class UnMAGBacteriaGenomesBatchDownloadView(GenericBatchDownloadView):
+    model = UnMAGBacteria
+    entity_name = 'genome'
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+    def get_csv_header(self):
+        return get_csv_header()
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Bacteria', 'unMAG', 'gff', file_name)
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+class BacteriaGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': BacteriaGenomeDetailView,
+        'proteins': BacteriaGenomeProteinsView,
+        'tRNAs': BacteriaGenomeTRNAsView,
+        'crispr': BacteriaGenomeCRISPRCasView,
+        'anti_crispr': BacteriaGenomeAntiCRISPRView,
+        'secondary_metabolites': BacteriaGenomeSecondaryMetabolitesView,
+        'signal_peptides': BacteriaGenomeSignalPeptidesView,
+        'virulence_factors': BacteriaGenomeVirulenceFactorsView,
+        'antibiotic_resistance': BacteriaGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': BacteriaGenomeTransmembraneHelicesView,
+    }
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGBacteriaGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': UnBacteriaGenomeDetailView,
+        'proteins': UnBacteriaGenomeProteinsView,
+        'tRNAs': UnMAGBacteriaGenomeTRNAsView,
+        'crispr': UnMAGBacteriaGenomeCRISPRCasView,
+        'anti_crispr': UnMAGBacteriaGenomeAntiCRISPRView,
+        'secondary_metabolites': UnMAGBacteriaGenomeSecondaryMetabolitesView,
+        'signal_peptides': UnMAGBacteriaGenomeSignalPeptidesView,
+        'virulence_factors': UnMAGBacteriaGenomeVirulenceFactorsView,
+        'antibiotic_resistance': UnMAGBacteriaGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': UnMAGBacteriaGenomeTransmembraneHelicesView,
+    }
 
 
-class UnMAGBacteriaGenomesBatchDownloadView(GenericBatchDownloadView):
-    model = UnMAGBacteria
-    entity_name = 'genome'
+class BacteriaGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'MAG'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
 
-        writer.writerow(get_csv_header())
+class UnMAGBacteriaGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'unMAG'
 
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
 
-        buffer.seek(0)
+class BacteriaGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'MAG'
+
 
-        return buffer
+class UnMAGBacteriaGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Bacteria'
+    mag_dir = 'unMAG'
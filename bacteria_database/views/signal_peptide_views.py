@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from bacteria_database.serializers.signal_peptide_serializers import MAGSignalPeptideSerializer, \
     UnMAGSignalPeptideSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -52,6 +52,7 @@ class BacteriaSignalPeptidesView(GenericTableQueryView):
     queryset = MAGBacteriaSignalPeptidePrediction.objects.all()
     serializer_class = MAGSignalPeptideSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('prediction',)
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id'
     ]
@@ -59,7 +60,7 @@ class BacteriaSignalPeptidesView(GenericTableQueryView):
 
 class BacteriaSignalPeptidesFilterOptionsView(APIView):
     def get(self, request):
-        prediction_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaSignalPeptidePredictions').value
+        prediction_values = get_filter_option('MAGBacteriaSignalPeptidePredictions')
 
         return Response({
             'prediction': prediction_values
@@ -97,18 +98,11 @@ class BacteriaSignalPeptidesBatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteriaSignalPeptidePrediction
     entity_name = 'signal_peptide'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for signal_peptide in queryset:
-            writer.writerow(to_csv_row(signal_peptide))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, signal_peptide):
+        return to_csv_row(signal_peptide)
 
 
 # MAG Signal Peptide Views
@@ -118,6 +112,7 @@ class UnMAGBacteriaSignalPeptidesView(GenericTableQueryView):
     queryset = UnMAGBacteriaSignalPeptidePrediction.objects.all()
     serializer_class = UnMAGSignalPeptideSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('prediction',)
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id'
     ]
@@ -125,7 +120,7 @@ class UnMAGBacteriaSignalPeptidesView(GenericTableQueryView):
 
 class UnMAGBacteriaSignalPeptidesFilterOptionsView(APIView):
     def get(self, request):
-        prediction_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaSignalPeptidePredictions').value
+        prediction_values = get_filter_option('UnMAGBacteriaSignalPeptidePredictions')
 
         return Response({
             'prediction': prediction_values
@@ -163,15 +158,8 @@ class UnMAGBacteriaSignalPeptidesBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGBacteriaSignalPeptidePrediction
     entity_name = 'signal_peptide'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for signal_peptide in queryset:
-            writer.writerow(to_csv_row(signal_peptide))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, signal_peptide):
+        return to_csv_row(signal_peptide)
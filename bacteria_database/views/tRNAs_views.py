@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 import re
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from bacteria_database.models import MAGBacteriaTRNA, UnMAGBacteriaTRNA
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from bacteria_database.serializers.tRNAs_serializers import MAGBacteriaTRNASerializer, UnMAGBacteriaTRNASerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -63,6 +64,8 @@ class BacteriaTRNAsView(GenericTableQueryView):
     queryset = MAGBacteriaTRNA.objects.all()
     serializer_class = MAGBacteriaTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'bacteria_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -71,9 +74,13 @@ class BacteriaTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class BacteriaTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = BacteriaTRNAsView
+
+
 class BacteriaTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaTRNATypes').value
+        trna_types = get_filter_option('MAGBacteriaTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -110,18 +117,11 @@ class BacteriaTRNABatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteriaTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -134,6 +134,8 @@ class UnMAGBacteriaTRNAsView(GenericTableQueryView):
     queryset = UnMAGBacteriaTRNA.objects.all()
     serializer_class = UnMAGBacteriaTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'bacteria_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -142,9 +144,13 @@ class UnMAGBacteriaTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class UnMAGBacteriaTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGBacteriaTRNAsView
+
+
 class UnMAGBacteriaTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaTRNATypes').value
+        trna_types = get_filter_option('UnMAGBacteriaTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -181,18 +187,11 @@ class UnMAGBacteriaTRNABatchDownloadView(GenericBatchDownloadView):
     model = UnMAGBacteriaTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
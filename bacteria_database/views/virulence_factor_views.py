@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from bacteria_database.serializers.virulence_factor_serializers import MAGBacteriaVirulenceFactorSerializer, \
     UnMAGBacteriaVirulenceFactorSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -58,6 +58,7 @@ class BacteriaVirulenceFactorsView(GenericTableQueryView):
     queryset = MAGBacteriaVirulenceFactor.objects.all()
     serializer_class = MAGBacteriaVirulenceFactorSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('vf_category',)
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id', 'vf_database', 'vf_category'
     ]
@@ -65,7 +66,7 @@ class BacteriaVirulenceFactorsView(GenericTableQueryView):
 
 class BacteriaVirulenceFactorsFilterOptionsView(APIView):
     def get(self, request):
-        vf_category_values = MicrobeFilterOptionsNew.objects.get(key='MAGBacteriaVirulenceFactorVFCategory').value
+        vf_category_values = get_filter_option('MAGBacteriaVirulenceFactorVFCategory')
 
         return Response({
             'vf_category': vf_category_values,
@@ -103,18 +104,11 @@ class BacteriaVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = MAGBacteriaVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)
 
 
 # UnMAG Virulence Factor Views
@@ -124,6 +118,7 @@ class UnMAGBacteriaVirulenceFactorsView(GenericTableQueryView):
     queryset = UnMAGBacteriaVirulenceFactor.objects.all()
     serializer_class = UnMAGBacteriaVirulenceFactorSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('vf_category',)
     search_fields = [
         'bacteria_id', 'contig_id', 'protein_id', 'vf_database', 'vf_category'
     ]
@@ -131,7 +126,7 @@ class UnMAGBacteriaVirulenceFactorsView(GenericTableQueryView):
 
 class UnMAGBacteriaVirulenceFactorsFilterOptionsView(APIView):
     def get(self, request):
-        vf_category_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGBacteriaVirulenceFactorVFCategory').value
+        vf_category_values = get_filter_option('UnMAGBacteriaVirulenceFactorVFCategory')
 
         return Response({
             'vf_category': vf_category_values,
@@ -169,15 +164,8 @@ class UnMAGBacteriaVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGBacteriaVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)
@@ -0,0 +1,32 @@
+# Generated by Django 4.2 on 2026-10-18 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=100)),
+                ('spec', models.JSONField()),
+                ('spec_hash', models.CharField(db_index=True, max_length=64)),
+                ('data_version', models.CharField(max_length=100)),
+                ('status', models.CharField(default='Created', max_length=20)),
+                ('file_name', models.CharField(blank=True, max_length=300, null=True)),
+                ('content_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('artifact_path', models.CharField(blank=True, max_length=500, null=True)),
+                ('artifact_size', models.BigIntegerField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
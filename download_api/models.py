@@ -1,3 +1,18 @@
 from django.db import models
 
-# Create your models here.
+
+class ExportJob(models.Model):
+    # 导出来源 (见 utils.export_jobs.EXPORT_SOURCES) 与参数，spec_hash 为两者的规范化摘要
+    source = models.CharField(max_length=100)
+    spec = models.JSONField()
+    spec_hash = models.CharField(max_length=64, db_index=True)
+    data_version = models.CharField(max_length=100)
+    # Created / Running / Success / Failed
+    status = models.CharField(max_length=20, default='Created')
+    file_name = models.CharField(max_length=300, blank=True, null=True)
+    content_type = models.CharField(max_length=100, blank=True, null=True)
+    artifact_path = models.CharField(max_length=500, blank=True, null=True)
+    artifact_size = models.BigIntegerField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
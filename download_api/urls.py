@@ -6,6 +6,9 @@ urlpatterns = [
     path('fasta', download_fasta_data, name='download_fasta_data'),
     path('gbk', download_gbk_data, name='download_gbk_data'),
     path('gff', download_gff_data, name='download_gff_data'),
+    path('genome_files', download_genome_files, name='download_genome_files'),
+    path('export_jobs/<int:job_id>', export_job_status, name='export_job_status'),
+    path('export_jobs/<int:job_id>/file', export_job_file, name='export_job_file'),
     path('annotation', download_annotation_data, name='download_annotation_data'),
 
 ]
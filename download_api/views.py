@@ -1,4 +1,4 @@
-from django.http import StreamingHttpResponse, JsonResponse, FileResponse
+from django.http import StreamingHttpResponse, JsonResponse
 from django.db.models import Q
 from django.conf import settings
 from MicrobialScope_api.constant import MEDIA_DATA_DIR, NEW_MEDIA_DATA_DIR
@@ -14,6 +14,10 @@ import archaea_database.views as archaea_views
 import bacteria_database.views as bacteria_views
 import fungi_database.views as fungi_views
 import viruses_database.views as viruses_views
+from download_api.models import ExportJob
+from utils.download_files import stream_tar_response
+from utils.file_serving import get_genome_file_path, serve_file
+from utils.export_jobs import EXPORT_JOB_SUCCESS, export_job_to_dict, register_export_source, submit_export
 
 def download_meta_data(request):
     """
@@ -216,23 +220,15 @@ def download_fasta_data(request):
         }, status=404)
 
     # Construct file path
-    file_name = f"{genome.unique_id}.fna.gz"
-    if archaea_type == 'monoisolate':
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'unMAG', 'fna', file_name)
-    else:
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'MAG', 'fna', file_name)
-    # Check if file exists
-    if not os.path.exists(file_path):
+    mag_folder = 'unMAG' if archaea_type == 'monoisolate' else 'MAG'
+    file_path, file_name = get_genome_file_path(microbe.capitalize(), mag_folder, genome.unique_id, 'fasta')
+
+    # Serve the file (Range requests or offloaded to the front proxy)
+    response = serve_file(request, file_path, file_name)
+    if response is None:
         return JsonResponse({
             'error': f"File not found: {file_name}"
         }, status=404)
-
-    # Serve the file
-    response = FileResponse(
-        open(file_path, 'rb'),
-        as_attachment=True,
-        filename=file_name
-    )
     return response
 
 def download_gbk_data(request):
@@ -282,24 +278,15 @@ def download_gbk_data(request):
         }, status=404)
 
     # Construct file path
-    file_name = f"{genome.unique_id}.gbk.gz"
-    if archaea_type == 'monoisolate':
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'unMAG', 'gbk', file_name)
-    else:
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'MAG', 'gbk', file_name)
+    mag_folder = 'unMAG' if archaea_type == 'monoisolate' else 'MAG'
+    file_path, file_name = get_genome_file_path(microbe.capitalize(), mag_folder, genome.unique_id, 'gbk')
 
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # Serve the file (Range requests or offloaded to the front proxy)
+    response = serve_file(request, file_path, file_name)
+    if response is None:
         return JsonResponse({
             'error': f"File not found: {file_name}"
         }, status=404)
-
-    # Serve the file
-    response = FileResponse(
-        open(file_path, 'rb'),
-        as_attachment=True,
-        filename=file_name
-    )
     return response
 
 def download_gff_data(request):
@@ -349,24 +336,139 @@ def download_gff_data(request):
         }, status=404)
 
     # Construct file path
-    file_name = f"{genome.unique_id}.gff.gz"
-    if archaea_type == 'monoisolate':
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'unMAG', 'gff', file_name)
-    else:
-        file_path = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), 'MAG', 'gff', file_name)
+    mag_folder = 'unMAG' if archaea_type == 'monoisolate' else 'MAG'
+    file_path, file_name = get_genome_file_path(microbe.capitalize(), mag_folder, genome.unique_id, 'gff3')
 
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # Serve the file (Range requests or offloaded to the front proxy)
+    response = serve_file(request, file_path, file_name)
+    if response is None:
         return JsonResponse({
             'error': f"File not found: {file_name}"
         }, status=404)
+    return response
+
+GENOME_MODEL_MAP = {
+    'archaea': {'mag': MAGArchaea, 'monoisolate': UnMAGArchaea},
+    'bacteria': {'mag': MAGBacteria, 'monoisolate': UnMAGBacteria},
+    'fungi': {'mag': MAGFungi, 'monoisolate': UnMAGFungi},
+    'viruses': {'mag': MAGViruses, 'monoisolate': UnMAGViruses},
+}
+
+# file_type -> (folder, extension)
+GENOME_FILE_TYPE_MAP = {
+    'fasta': ('fna', 'fna.gz'),
+    'gbk': ('gbk', 'gbk.gz'),
+    'gff': ('gff', 'gff.gz'),
+}
 
-    # Serve the file
-    response = FileResponse(
-        open(file_path, 'rb'),
-        as_attachment=True,
-        filename=file_name
+
+def build_genome_files_response(params):
+    """
+    Stream the files of the genomes in params as an uncompressed tar.
+    """
+    microbe = params['microbe']
+    archaea_type = params['type']
+    file_type = params['file_type']
+    model = GENOME_MODEL_MAP[microbe][archaea_type]
+
+    # Only genomes that exist in the model are packed
+    genome_ids = list(
+        model.objects.filter(unique_id__in=params['unique_ids']).order_by('id').values_list('unique_id', flat=True)
     )
+    if not genome_ids:
+        return JsonResponse({
+            'error': f"No genome found for {microbe} ({archaea_type})."
+        }, status=404)
+
+    folder, extension = GENOME_FILE_TYPE_MAP[file_type]
+    mag_folder = 'unMAG' if archaea_type == 'monoisolate' else 'MAG'
+    base_dir = os.path.join(MEDIA_DATA_DIR, microbe.capitalize(), mag_folder, folder)
+    file_paths = [os.path.join(base_dir, f"{genome_id}.{extension}") for genome_id in genome_ids]
+
+    return stream_tar_response(file_paths, f"{microbe}_{archaea_type}_{file_type}")
+
+
+def get_genome_files_dataset(params):
+    return GENOME_MODEL_MAP[params['microbe']][params['type']]._meta.label_lower
+
+
+register_export_source('genome_files', build_genome_files_response, get_genome_files_dataset)
+
+
+def download_genome_files(request):
+    """
+    API endpoint to download the FASTA, GenBank or GFF3 files of several genomes as one uncompressed tar.
+    The .gz files are streamed as they are, without being compressed again.
+    Parameters:
+    - microbe: 'archaea', 'bacteria', 'fungi', or 'viruses'
+    - type: 'mag' or 'monoisolate'
+    - file_type: 'fasta', 'gbk' or 'gff'
+    - unique_ids: Comma-separated unique identifiers of the genomes
+    - mode: 'sync' (default) or 'async' to create an export job and return its status instead
+    """
+    # Get query parameters
+    microbe = request.GET.get('microbe', '').lower()
+    archaea_type = request.GET.get('type', '').lower()
+    file_type = request.GET.get('file_type', '').lower()
+    unique_ids = [unique_id.strip() for unique_id in request.GET.get('unique_ids', '').split(',') if unique_id.strip()]
+    mode = request.GET.get('mode', 'sync').lower()
+
+    # Validate parameters
+    if microbe not in GENOME_MODEL_MAP:
+        return JsonResponse({
+            'error': "Invalid 'microbe' parameter. Must be 'archaea', 'bacteria', 'fungi', or 'viruses'."
+        }, status=400)
+
+    if archaea_type not in ['mag', 'monoisolate']:
+        return JsonResponse({
+            'error': "Invalid 'type' parameter. Must be 'mag' or 'monoisolate'."
+        }, status=400)
+
+    if file_type not in GENOME_FILE_TYPE_MAP:
+        return JsonResponse({
+            'error': "Invalid 'file_type' parameter. Must be 'fasta', 'gbk', or 'gff'."
+        }, status=400)
+
+    if not unique_ids:
+        return JsonResponse({
+            'error': "'unique_ids' parameter is required."
+        }, status=400)
+
+    params = {'microbe': microbe, 'type': archaea_type, 'file_type': file_type, 'unique_ids': unique_ids}
+    if mode == 'async':
+        job = submit_export('genome_files', params)
+        return JsonResponse(export_job_to_dict(job), status=202)
+
+    return build_genome_files_response(params)
+
+
+def export_job_status(request, job_id):
+    """
+    API endpoint to poll the status of an export job.
+    """
+    try:
+        job = ExportJob.objects.get(pk=job_id)
+    except ExportJob.DoesNotExist:
+        return JsonResponse({'error': f"No export job found with id '{job_id}'."}, status=404)
+
+    return JsonResponse(export_job_to_dict(job))
+
+
+def export_job_file(request, job_id):
+    """
+    API endpoint to download the artifact of a finished export job.
+    """
+    try:
+        job = ExportJob.objects.get(pk=job_id)
+    except ExportJob.DoesNotExist:
+        return JsonResponse({'error': f"No export job found with id '{job_id}'."}, status=404)
+
+    if job.status != EXPORT_JOB_SUCCESS:
+        return JsonResponse({'error': f"Export job '{job_id}' is not finished.", 'status': job.status}, status=409)
+
+    response = serve_file(request, job.artifact_path, job.file_name, content_type=job.content_type or None)
+    if response is None:
+        return JsonResponse({'error': f"The file of export job '{job_id}' has been removed."}, status=410)
     return response
 
 def download_annotation_data(request):
@@ -521,16 +623,11 @@ def download_annotation_data(request):
             file_path = os.path.join(NEW_MEDIA_DATA_DIR, microbe.capitalize(), 'unMAG', annotation+'s', file_name)
         else:
             file_path = os.path.join(NEW_MEDIA_DATA_DIR, microbe.capitalize(), 'MAG', annotation+'s', file_name)
-        if not os.path.exists(file_path):
+        response = serve_file(request, file_path, f"{microbe}_{archaea_type}_{annotation}_{unique_id}.tsv")
+        if response is None:
             return JsonResponse({
                 'error': f"File not found: {file_name}"
             }, status=404)
-
-        response = FileResponse(
-            open(file_path, 'rb'),
-            as_attachment=True,
-            filename=f"{microbe}_{archaea_type}_{annotation}_{unique_id}.tsv"
-        )
         return response
 
     # For other annotations, generate CSV from database records
@@ -0,0 +1,76 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("fungi_database", "0006_alter_magfungi_fungi_id_alter_magfungi_organism_name_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="mf_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="mf_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="umf_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="umf_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="mf_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="mf_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="mf_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="umf_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="umf_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="umf_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,172 @@
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("fungi_database", "0007_search_trigram_indexes"),
+    ]
+
+    operations = [
+        # GiST operator classes for the plain genome id and contig_id columns of the indexes
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="magfungiprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungitrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungisecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungisignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungivirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungiantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magfungitransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungiprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungitrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungisecondarymetaboliteregion",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungisignalpeptideprediction",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungivirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungiantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagfungitransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungitrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungisecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungisignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungivirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungitransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="mf_tmh_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungitrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungisecondarymetaboliteregion",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_sm_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungisignalpeptideprediction",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_sp_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungivirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungitransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["fungi_id", "contig_id", "location"], name="umf_tmh_location_gist_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("fungi_database", "0008_genome_location_ranges"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=models.Index(fields=["organism_name", "id"], name="mf_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=models.Index(fields=["species", "id"], name="mf_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=models.Index(fields=["total_sequence_length", "id"], name="mf_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungi",
+            index=models.Index(fields=["gc_content", "id"], name="mf_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=models.Index(fields=["fungi_id", "id"], name="mf_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magfungiprotein",
+            index=models.Index(fields=["protein_id", "id"], name="mf_protein_protein_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=models.Index(fields=["organism_name", "id"], name="umf_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=models.Index(fields=["species", "id"], name="umf_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=models.Index(fields=["total_sequence_length", "id"], name="umf_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungi",
+            index=models.Index(fields=["gc_content", "id"], name="umf_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=models.Index(fields=["fungi_id", "id"], name="umf_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagfungiprotein",
+            index=models.Index(fields=["protein_id", "id"], name="umf_protein_protein_keyset_idx"),
+        ),
+    ]
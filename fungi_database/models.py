@@ -1,7 +1,7 @@
 from django.db import models
 
-from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.fields import ArrayField, BigIntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
 
 
 # MAG Fungi Models
@@ -31,6 +31,12 @@ class MAGFungi(models.Model):
         verbose_name_plural = "MAG Fungi Genomes"
         indexes = [
             GinIndex(fields=['fungi_id'], name='mf_fungi_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='mf_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='mf_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='mf_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='mf_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='mf_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='mf_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -69,6 +75,7 @@ class MAGFungiProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -103,6 +110,12 @@ class MAGFungiProtein(models.Model):
         verbose_name_plural = "MAG Fungi Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='mf_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='mf_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='mf_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='mf_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_protein_location_gist_idx'),
+            models.Index(fields=['fungi_id', 'id'], name='mf_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='mf_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -121,6 +134,7 @@ class MAGFungiTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -129,6 +143,9 @@ class MAGFungiTRNA(models.Model):
     class Meta:
         verbose_name = "MAG Fungi tRNA Annotation"
         verbose_name_plural = "MAG Fungi tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -142,6 +159,7 @@ class MAGFungiSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -157,6 +175,7 @@ class MAGFungiSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "MAG Fungi Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='mf_sm_type_gin_idx'),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -167,6 +186,7 @@ class MAGFungiSignalPeptidePrediction(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -183,6 +203,9 @@ class MAGFungiSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "MAG Fungi Signal Peptide Prediction"
         verbose_name_plural = "MAG Fungi Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -192,6 +215,7 @@ class MAGFungiVirulenceFactor(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     uni_prot_id = models.CharField(max_length=255, blank=True)
@@ -210,6 +234,9 @@ class MAGFungiVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "MAG Fungi Virulence Factor"
         verbose_name_plural = "MAG Fungi Virulence Factors"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.uni_prot_id or 'VF'}"
@@ -219,6 +246,7 @@ class MAGFungiAntibioticResistance(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -249,6 +277,7 @@ class MAGFungiAntibioticResistance(models.Model):
         verbose_name_plural = "MAG Fungi Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='mf_arg_type_gin_idx'),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -259,6 +288,7 @@ class MAGFungiTransmembraneHelices(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -271,6 +301,9 @@ class MAGFungiTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "MAG Fungi Transmembrane Helix"
         verbose_name_plural = "MAG Fungi Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='mf_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
@@ -317,6 +350,12 @@ class UnMAGFungi(models.Model):
         verbose_name_plural = "UnMAG Fungi Genomes"
         indexes = [
             GinIndex(fields=['fungi_id'], name='umf_fungi_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='umf_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='umf_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='umf_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='umf_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='umf_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='umf_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -355,6 +394,7 @@ class UnMAGFungiProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -389,6 +429,12 @@ class UnMAGFungiProtein(models.Model):
         verbose_name_plural = "UnMAG Fungi Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='umf_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='umf_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='umf_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='umf_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_protein_location_gist_idx'),
+            models.Index(fields=['fungi_id', 'id'], name='umf_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='umf_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -407,6 +453,7 @@ class UnMAGFungiTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -415,6 +462,9 @@ class UnMAGFungiTRNA(models.Model):
     class Meta:
         verbose_name = "UnMAG Fungi tRNA Annotation"
         verbose_name_plural = "UnMAG Fungi tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -428,6 +478,7 @@ class UnMAGFungiSecondaryMetaboliteRegion(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     type = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -443,6 +494,7 @@ class UnMAGFungiSecondaryMetaboliteRegion(models.Model):
         verbose_name_plural = "UnMAG Fungi Secondary Metabolite Regions"
         indexes = [
             GinIndex(fields=['type'], name='umf_sm_type_gin_idx'),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_sm_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -453,6 +505,7 @@ class UnMAGFungiSignalPeptidePrediction(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     source = models.CharField(max_length=255, blank=True)
     prediction = models.CharField(max_length=255, blank=True)
 
@@ -469,6 +522,9 @@ class UnMAGFungiSignalPeptidePrediction(models.Model):
     class Meta:
         verbose_name = "UnMAG Fungi Signal Peptide Prediction"
         verbose_name_plural = "UnMAG Fungi Signal Peptide Predictions"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_sp_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.prediction})"
@@ -478,6 +534,7 @@ class UnMAGFungiVirulenceFactor(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     uni_prot_id = models.CharField(max_length=255, blank=True)
@@ -496,6 +553,9 @@ class UnMAGFungiVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "UnMAG Fungi Virulence Factor"
         verbose_name_plural = "UnMAG Fungi Virulence Factors"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.uni_prot_id or 'VF'}"
@@ -505,6 +565,7 @@ class UnMAGFungiAntibioticResistance(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -535,6 +596,7 @@ class UnMAGFungiAntibioticResistance(models.Model):
         verbose_name_plural = "UnMAG Fungi Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='umf_arg_type_gin_idx'),
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -545,6 +607,7 @@ class UnMAGFungiTransmembraneHelices(models.Model):
     fungi_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -557,6 +620,9 @@ class UnMAGFungiTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "UnMAG Fungi Transmembrane Helix"
         verbose_name_plural = "UnMAG Fungi Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['fungi_id', 'contig_id', 'location'], name='umf_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiAntibioticResistance, UnMAGFungiAntibi
 class MAGFungiAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
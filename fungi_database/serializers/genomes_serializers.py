@@ -1,6 +1,8 @@
 from rest_framework import serializers
-import pandas as pd
 import os
+
+from utils.annotation_summary import AnnotationSummaryMixin
+from utils.read_files import count_tsv_proteins, count_tsv_rows
 from fungi_database.models import MAGFungi, UnMAGFungi, UnMAGFungiProtein, UnMAGFungiAntibioticResistance, \
     UnMAGFungiTRNA, UnMAGFungiSecondaryMetaboliteRegion, \
     UnMAGFungiSignalPeptidePrediction, UnMAGFungiVirulenceFactor, UnMAGFungiTransmembraneHelices, \
@@ -15,7 +17,7 @@ class MAGFungiSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class MAGFungiDetailSerializer(serializers.ModelSerializer):
+class MAGFungiDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     secondary_metabolite_count = serializers.SerializerMethodField()
@@ -24,45 +26,44 @@ class MAGFungiDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Fungi'
+    summary_mag_status = 'MAG'
+
     class Meta:
         model = MAGFungi
         fields = '__all__'
 
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Fungi/MAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGFungiProtein.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return MAGFungiTRNA.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return MAGFungiSecondaryMetaboliteRegion.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return MAGFungiSignalPeptidePrediction.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return MAGFungiVirulenceFactor.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Fungi/MAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return MAGFungiAntibioticResistance.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Fungi/MAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
         # return MAGFungiTransmembraneHelices.objects.filter(fungi_id=obj.unique_id).count()
 
 
@@ -72,7 +73,7 @@ class UnMAGFungiSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class UnMAGFungiDetailSerializer(serializers.ModelSerializer):
+class UnMAGFungiDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     secondary_metabolite_count = serializers.SerializerMethodField()
@@ -81,30 +82,32 @@ class UnMAGFungiDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Fungi'
+    summary_mag_status = 'unMAG'
+
     class Meta:
         model = UnMAGFungi
         fields = '__all__'
 
     # def get_protein_count(self, obj):
     #     return UnMAGFungiProtein.objects.filter(fungi_id=obj.unique_id).count()
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Fungi/unMAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGFungiProtein.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return UnMAGFungiTRNA.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_secondary_metabolite_count(self, obj):
+    def compute_secondary_metabolite_count(self, obj):
         return UnMAGFungiSecondaryMetaboliteRegion.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_signal_peptide_count(self, obj):
+    def compute_signal_peptide_count(self, obj):
         return UnMAGFungiSignalPeptidePrediction.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return UnMAGFungiVirulenceFactor.objects.filter(fungi_id=obj.unique_id).count()
 
     # def get_arg_count(self, obj):
@@ -113,18 +116,15 @@ class UnMAGFungiDetailSerializer(serializers.ModelSerializer):
     # def get_tmh_count(self, obj):
     #     return UnMAGFungiTransmembraneHelices.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         arg_file = f'/delta_microbia/new_data/Fungi/unMAG/args/{obj.unique_id}.tsv'
         if not os.path.exists(arg_file):
             return 0
-        df = pd.read_csv(arg_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(arg_file)
         # return MAGFungiAntibioticResistance.objects.filter(fungi_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Fungi/unMAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
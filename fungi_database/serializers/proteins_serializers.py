@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiProtein, UnMAGFungiProtein
 class MAGFungiProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiProtein
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiProtein
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiSecondaryMetaboliteRegion, UnMAGFungiS
 class MAGFungiSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiSecondaryMetaboliteSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiSecondaryMetaboliteRegion
-        fields = '__all__'
+        exclude = ('location',)
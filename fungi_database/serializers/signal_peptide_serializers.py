@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiSignalPeptidePrediction, UnMAGFungiSig
 class MAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGSignalPeptideSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiSignalPeptidePrediction
-        fields = '__all__'
+        exclude = ('location',)
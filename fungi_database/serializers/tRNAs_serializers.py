@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiTRNA, UnMAGFungiTRNA
 class MAGFungiTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiTRNA
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiTRNA
-        fields = '__all__'
+        exclude = ('location',)
@@ -15,7 +15,7 @@ class MAGFungiTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGFungiTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiHelicesSerializer(serializers.ModelSerializer):
@@ -29,4 +29,4 @@ class UnMAGFungiTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGFungiTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
@@ -6,10 +6,10 @@ from fungi_database.models import MAGFungiVirulenceFactor, UnMAGFungiVirulenceFa
 class MAGFungiVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGFungiVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGFungiVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGFungiVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
@@ -13,7 +13,9 @@ urlpatterns = [
     path('genome_batch_download', genomes_views.FungiGenomesBatchDownloadView.as_view()),
     path('genome_batch_download_unmag', genomes_views.UnMAGFungiGenomesBatchDownloadView.as_view()),
     path('proteins', proteins_views.FungiProteinsView.as_view()),
+    path('proteins_fields', proteins_views.FungiProteinsFieldsView.as_view()),
     path('proteins_unmag', proteins_views.UnMAGFungiProteinsView.as_view()),
+    path('proteins_fields_unmag', proteins_views.UnMAGFungiProteinsFieldsView.as_view()),
     path('proteins_filter_options', proteins_views.FungiProteinsFilterOptionsView.as_view()),
     path('proteins_filter_options_unmag', proteins_views.UnMAGFungiProteinsFilterOptionsView.as_view()),
     path('protein_single_download', proteins_views.FungiProteinsSingleDownloadView.as_view()),
@@ -21,7 +23,9 @@ urlpatterns = [
     path('protein_batch_download', proteins_views.FungiProteinsBatchDownloadView.as_view()),
     path('protein_batch_download_unmag', proteins_views.UnMAGFungiProteinsBatchDownloadView.as_view()),
     path('tRNAs', tRNAs_views.FungiTRNAsView.as_view()),
+    path('tRNAs_fields', tRNAs_views.FungiTRNAsFieldsView.as_view()),
     path('tRNAs_unmag', tRNAs_views.UnMAGFungiTRNAsView.as_view()),
+    path('tRNAs_fields_unmag', tRNAs_views.UnMAGFungiTRNAsFieldsView.as_view()),
     path('tRNAs_filter_options', tRNAs_views.FungiTRNAFilterOptionsView.as_view()),
     path('tRNAs_filter_options_unmag', tRNAs_views.UnMAGFungiTRNAFilterOptionsView.as_view()),
     path('tRNA_single_download', tRNAs_views.FungiTRNASingleDownloadView.as_view()),
@@ -65,7 +69,10 @@ urlpatterns = [
     path('virulence_factor_batch_download_unmag',
          virulence_factor_views.UnMAGFungiVirulenceFactorsBatchDownloadView.as_view()),
     path('antibiotic_resistances', antibiotic_resistance_views.FungiAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields', antibiotic_resistance_views.FungiAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_unmag', antibiotic_resistance_views.UnMAGFungiAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields_unmag',
+         antibiotic_resistance_views.UnMAGFungiAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_filter_options',
          antibiotic_resistance_views.FungiAntibioticResistancesFilterOptionsView.as_view()),
     path('antibiotic_resistances_filter_options_unmag',
@@ -112,6 +119,12 @@ urlpatterns = [
     path('genome_detail_transmembrane_helices_unmag',
          genomes_views.UnMAGFungiGenomeTransmembraneHelicesView.as_view()
          ),
+    path('genome_bundle', genomes_views.FungiGenomeBundleView.as_view()),
+    path('genome_bundle_unmag', genomes_views.UnMAGFungiGenomeBundleView.as_view()),
     path('genome_fasta', genomes_views.FungiGenomeFASTAView.as_view()),
     path('genome_fasta_unmag', genomes_views.UnMAGFungiGenomeFASTAView.as_view()),
+    path('genome_tracks', genomes_views.FungiGenomeTrackView.as_view()),
+    path('genome_tracks_unmag', genomes_views.UnMAGFungiGenomeTrackView.as_view()),
+    path('genome_overlaps', genomes_views.FungiGenomeOverlapView.as_view()),
+    path('genome_overlaps_unmag', genomes_views.UnMAGFungiGenomeOverlapView.as_view()),
 ]
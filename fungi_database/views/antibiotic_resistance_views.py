@@ -10,13 +10,14 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from fungi_database.models import MAGFungiAntibioticResistance, UnMAGFungiAntibioticResistance
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from fungi_database.serializers.antibiotic_resistance_serializers import MAGFungiAntibioticResistanceSerializer, \
     UnMAGFungiAntibioticResistanceSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -71,6 +72,10 @@ class FungiAntibioticResistancesView(GenericTableQueryView):
     queryset = MAGFungiAntibioticResistance.objects.all()
     serializer_class = MAGFungiAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'fungi_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -79,10 +84,14 @@ class FungiAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class FungiAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = FungiAntibioticResistancesView
+
+
 class FungiAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('MAGFungiAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('MAGFungiAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -121,18 +130,11 @@ class FungiAntibioticResistancesBatchDownloadView(GenericBatchDownloadView):
     model = MAGFungiAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -145,6 +147,10 @@ class UnMAGFungiAntibioticResistancesView(GenericTableQueryView):
     queryset = UnMAGFungiAntibioticResistance.objects.all()
     serializer_class = UnMAGFungiAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'fungi_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -153,10 +159,14 @@ class UnMAGFungiAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class UnMAGFungiAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGFungiAntibioticResistancesView
+
+
 class UnMAGFungiAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('UnMAGFungiAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('UnMAGFungiAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -195,18 +205,11 @@ class UnMAGFungiAntibioticResistancesBatchDownloadView(GenericBatchDownloadView)
     model = UnMAGFungiAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
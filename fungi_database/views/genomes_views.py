@@ -3,17 +3,17 @@ from rest_framework.views import APIView
 from rest_framework import status
 
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse, FileResponse
+from django.http import HttpResponse
 from django.db.models import Q
 
 from io import StringIO
 import csv
 import os
-import gzip
-from Bio import SeqIO
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView, \
+    GenericGenomeBundleView, GenericGenomeFASTAView, GenericGenomeTrackView, \
+    GenericGenomeOverlapView
 from fungi_database.models import MAGFungi, UnMAGFungi, MAGFungiProtein, UnMAGFungiProtein, \
     MAGFungiTRNA, UnMAGFungiTRNA, MAGFungiSecondaryMetaboliteRegion, \
     UnMAGFungiSecondaryMetaboliteRegion, \
@@ -36,12 +36,14 @@ from fungi_database.serializers.transmembrane_helices_serializers import MAGFung
     UnMAGFungiTransmembraneHelicesSerializer
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer, GenomeDetailSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 from utils.read_files import *
+from utils.file_cache import parsed_file_cache
 
 from MicrobialScope_api.constant import MEDIA_DATA_DIR
+from utils.file_serving import GENOME_FILE_TYPES
 
 
 def get_csv_header():
@@ -74,7 +76,7 @@ def get_genome_search_q(search_content):
     if search_content['field'] == 'fungi_id':
         return Q(**{f"{search_content['field']}__contains": [search_content['value'].strip()]})
 
-    return Q(**{f"{search_content['field']}__icontains": search_content['value']})
+    return Q(**{f"{search_content['field']}__ilike_contains": search_content['value']})
 
 
 # MAG Genome Views
@@ -83,7 +85,11 @@ class FungiGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGFungi.objects.all()
     serializer_class = MAGFungiSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'fungi_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'fungi_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -131,7 +137,7 @@ class FungiGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_fungi_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_fungi_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -219,7 +225,7 @@ class FungiGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_fungi_arg_file(arg_file)
+                args = parsed_file_cache.get(read_fungi_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -252,46 +258,20 @@ class FungiGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_fungi_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_fungi_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class FungiGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Fungi',
-                'MAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class FungiGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'MAG'
 
 
 class FungiGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiAssemblyLevel').value
+        assembly_level_values = get_filter_option('MAGFungiAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -321,38 +301,8 @@ class FungiGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'MAG', 'fna', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'MAG', 'gbk', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'MAG', 'gff', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Fungi', 'MAG')
 
         return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
@@ -361,18 +311,11 @@ class FungiGenomesBatchDownloadView(GenericBatchDownloadView):
     model = MAGFungi
     entity_name = 'genome'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
 
 # unMAG Genome Views
@@ -381,7 +324,11 @@ class UnMAGFungiGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGFungi.objects.all()
     serializer_class = UnMAGFungiSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'fungi_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'fungi_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -428,7 +375,7 @@ class UnFungiGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_fungi_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_fungi_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -517,7 +464,7 @@ class UnMAGFungiGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_fungi_arg_file(arg_file)
+                args = parsed_file_cache.get(read_fungi_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -551,46 +498,20 @@ class UnMAGFungiGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_fungi_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_fungi_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class UnMAGFungiGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Fungi',
-                'unMAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGFungiGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'unMAG'
 
 
 class UnMAGFungiGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiAssemblyLevel').value
+        assembly_level_values = get_filter_option('UnMAGFungiAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -620,55 +541,64 @@ class UnMAGFungiGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'unMAG', 'fna', file_name)
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Fungi', 'unMAG')
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'unMAG', 'gbk', file_name)
+class UnMAGFungiGenomesBatchDownloadView(GenericBatchDownloadView):
+    model = UnMAGFungi
+    entity_name = 'genome'
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+    def get_csv_header(self):
+        return get_csv_header()
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Fungi', 'unMAG', 'gff', file_name)
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+class FungiGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': FungiGenomeDetailView,
+        'proteins': FungiGenomeProteinsView,
+        'tRNAs': FungiGenomeTRNAsView,
+        'secondary_metabolites': FungiGenomeSecondaryMetabolitesView,
+        'signal_peptides': FungiGenomeSignalPeptidesView,
+        'virulence_factors': FungiGenomeVirulenceFactorsView,
+        'antibiotic_resistance': FungiGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': FungiGenomeTransmembraneHelicesView,
+    }
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGFungiGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': UnFungiGenomeDetailView,
+        'proteins': UnFungiGenomeProteinsView,
+        'tRNAs': UnMAGFungiGenomeTRNAsView,
+        'secondary_metabolites': UnMAGFungiGenomeSecondaryMetabolitesView,
+        'signal_peptides': UnMAGFungiGenomeSignalPeptidesView,
+        'virulence_factors': UnMAGFungiGenomeVirulenceFactorsView,
+        'antibiotic_resistance': UnMAGFungiGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': UnMAGFungiGenomeTransmembraneHelicesView,
+    }
 
 
-class UnMAGFungiGenomesBatchDownloadView(GenericBatchDownloadView):
-    model = UnMAGFungi
-    entity_name = 'genome'
+class FungiGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'MAG'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
 
-        writer.writerow(get_csv_header())
+class UnMAGFungiGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'unMAG'
 
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
 
-        buffer.seek(0)
+class FungiGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'MAG'
+
 
-        return buffer
+class UnMAGFungiGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Fungi'
+    mag_dir = 'unMAG'
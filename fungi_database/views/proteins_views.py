@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from fungi_database.models import MAGFungiProtein, UnMAGFungiProtein
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from fungi_database.serializers.proteins_serializers import MAGFungiProteinSerializer, UnMAGFungiProteinSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -79,7 +80,14 @@ class FungiProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGFungiProtein.objects.all()
     serializer_class = MAGFungiProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('fungi_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'fungi_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -91,11 +99,15 @@ class FungiProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class FungiProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = FungiProteinsView
+
+
 class FungiProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiProteinStrand').value
+        strand_values = get_filter_option('MAGFungiProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiProteinCOGCategory').value
+        cog_category_values = get_filter_option('MAGFungiProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -133,18 +145,11 @@ class FungiProteinsBatchDownloadView(GenericBatchDownloadView):
     model = MAGFungiProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
@@ -156,7 +161,14 @@ class UnMAGFungiProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGFungiProtein.objects.all()
     serializer_class = UnMAGFungiProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('fungi_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'fungi_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -168,11 +180,15 @@ class UnMAGFungiProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class UnMAGFungiProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGFungiProteinsView
+
+
 class UnMAGFungiProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiProteinStrand').value
+        strand_values = get_filter_option('UnMAGFungiProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiProteinCOGCategory').value
+        cog_category_values = get_filter_option('UnMAGFungiProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -210,18 +226,11 @@ class UnMAGFungiProteinsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGFungiProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
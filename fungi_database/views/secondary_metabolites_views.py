@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from fungi_database.serializers.secondary_metabolites_serializers import MAGFungiSecondaryMetaboliteSerializer, \
     UnMAGFungiSecondaryMetaboliteSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -62,6 +62,7 @@ class FungiSecondaryMetabolitesView(GenericTableQueryView):
     queryset = MAGFungiSecondaryMetaboliteRegion.objects.all()
     serializer_class = MAGFungiSecondaryMetaboliteSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('type',)
     search_fields = [
         'fungi_id', 'contig_id', 'source', 'region', 'start', 'end', 'similarity'
     ]
@@ -72,7 +73,7 @@ class FungiSecondaryMetabolitesView(GenericTableQueryView):
 
 class FungiSecondaryMetabolitesFilterOptionsView(APIView):
     def get(self, request):
-        type_values = MicrobeFilterOptionsNew.objects.get(key='MAGFungiSecondaryMetabolitesTypes').value
+        type_values = get_filter_option('MAGFungiSecondaryMetabolitesTypes')
 
         return Response({
             'type': type_values
@@ -111,18 +112,11 @@ class FungiSecondaryMetabolitesBatchDownloadView(GenericBatchDownloadView):
     model = MAGFungiSecondaryMetaboliteRegion
     entity_name = 'secondary_metabolite'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for secondary_metabolite in queryset:
-            writer.writerow(to_csv_row(secondary_metabolite))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, secondary_metabolite):
+        return to_csv_row(secondary_metabolite)
 
     def get_filter_q(self, payload):
         return get_secondary_metabolites_filter_q(payload)
@@ -135,6 +129,7 @@ class UnMAGFungiSecondaryMetabolitesView(GenericTableQueryView):
     queryset = UnMAGFungiSecondaryMetaboliteRegion.objects.all()
     serializer_class = UnMAGFungiSecondaryMetaboliteSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('type',)
     search_fields = [
         'fungi_id', 'contig_id', 'source', 'region', 'start', 'end', 'similarity'
     ]
@@ -145,7 +140,7 @@ class UnMAGFungiSecondaryMetabolitesView(GenericTableQueryView):
 
 class UnMAGFungiSecondaryMetabolitesFilterOptionsView(APIView):
     def get(self, request):
-        type_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiSecondaryMetabolitesTypes').value
+        type_values = get_filter_option('UnMAGFungiSecondaryMetabolitesTypes')
 
         return Response({
             'type': type_values
@@ -184,18 +179,11 @@ class UnMAGFungiSecondaryMetabolitesBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGFungiSecondaryMetaboliteRegion
     entity_name = 'secondary_metabolite'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for secondary_metabolite in queryset:
-            writer.writerow(to_csv_row(secondary_metabolite))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, secondary_metabolite):
+        return to_csv_row(secondary_metabolite)
 
     def get_filter_q(self, payload):
         return get_secondary_metabolites_filter_q(payload)
@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 import re
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from fungi_database.models import MAGFungiTRNA, UnMAGFungiTRNA
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from fungi_database.serializers.tRNAs_serializers import MAGFungiTRNASerializer, UnMAGFungiTRNASerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -63,6 +64,8 @@ class FungiTRNAsView(GenericTableQueryView):
     queryset = MAGFungiTRNA.objects.all()
     serializer_class = MAGFungiTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'fungi_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -71,9 +74,13 @@ class FungiTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class FungiTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = FungiTRNAsView
+
+
 class FungiTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='MAGFungiTRNATypes').value
+        trna_types = get_filter_option('MAGFungiTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -110,18 +117,11 @@ class FungiTRNABatchDownloadView(GenericBatchDownloadView):
     model = MAGFungiTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -134,6 +134,8 @@ class UnMAGFungiTRNAsView(GenericTableQueryView):
     queryset = UnMAGFungiTRNA.objects.all()
     serializer_class = UnMAGFungiTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'fungi_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -142,9 +144,13 @@ class UnMAGFungiTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class UnMAGFungiTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGFungiTRNAsView
+
+
 class UnMAGFungiTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='UnMAGFungiTRNATypes').value
+        trna_types = get_filter_option('UnMAGFungiTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -181,18 +187,11 @@ class UnMAGFungiTRNABatchDownloadView(GenericBatchDownloadView):
     model = UnMAGFungiTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -99,18 +99,11 @@ class FungiVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = MAGFungiVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)
 
 
 # UnMAG Virulence Factor Views
@@ -161,15 +154,8 @@ class UnMAGFungiVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGFungiVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)
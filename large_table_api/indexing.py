@@ -0,0 +1,136 @@
+import os
+
+from django.db import transaction
+from django.db.models import F, Sum, Window
+
+from utils.read_files import build_protein_row_offsets, build_row_offsets
+from utils.response_cache import bump_dataset_version
+
+
+def fill_row_offsets(index_model, batch_size=1000):
+    """
+    为索引表写入累计偏移 row_offset (按 archaea_id 排序时该文件之前所有文件的行数之和)
+
+    排序在数据库中完成，与视图中 order_by('archaea_id') 的排序规则保持一致
+    """
+    rows = index_model.objects.annotate(
+        cumulative_rows=Window(expression=Sum('row_count'), order_by=[F('archaea_id').asc(), F('id').asc()])
+    ).values_list('id', 'row_count', 'cumulative_rows')
+
+    updates = []
+    with transaction.atomic():
+        for pk, row_count, cumulative_rows in rows.iterator(chunk_size=batch_size):
+            updates.append(index_model(id=pk, row_offset=cumulative_rows - row_count))
+
+            if len(updates) >= batch_size:
+                index_model.objects.bulk_update(updates, ['row_offset'])
+                updates = []
+
+        if updates:
+            index_model.objects.bulk_update(updates, ['row_offset'])
+
+        # 索引变化后使该表已缓存的分页结果失效
+        transaction.on_commit(lambda: bump_dataset_version(index_model._meta.label_lower))
+
+
+KINGDOMS = ('Archaea', 'Bacteria', 'Fungi', 'Viruses')
+MAG_STATUSES = ('MAG', 'unMAG')
+DATA_TYPE_FOLDERS = {'Protein': 'proteins', 'ARG': 'args', 'TMH': 'tmhs'}
+
+
+def get_index_specs():
+    """
+    返回 {索引模型名: (模型, 相对数据目录)}，例如
+    ArchaeaUnMAGTMHIndex -> (ArchaeaUnMAGTMHIndex, 'Archaea/unMAG/tmhs')
+    """
+    from large_table_api import models
+
+    specs = {}
+    for kingdom in KINGDOMS:
+        for mag_status in MAG_STATUSES:
+            for data_type, folder in DATA_TYPE_FOLDERS.items():
+                name = f"{kingdom}{mag_status[0].upper()}{mag_status[1:]}{data_type}Index"
+                specs[name] = (getattr(models, name), os.path.join(kingdom, mag_status, folder))
+    return specs
+
+
+def count_tsv_file(file_path):
+    """
+    统计单个TSV文件的行数并写入偏移索引 (在进程池中运行)
+
+    TMH 文件按蛋白计数，其余按数据行计数
+
+    Returns:
+    tuple: (file_path, file_size, file_mtime, row_count)
+    """
+    stat = os.stat(file_path)
+    if os.path.basename(os.path.dirname(file_path)) == DATA_TYPE_FOLDERS['TMH']:
+        row_count = build_protein_row_offsets(file_path)
+    else:
+        row_count = build_row_offsets(file_path)
+    return file_path, stat.st_size, stat.st_mtime, row_count
+
+
+def plan_index_update(index_model, data_dir, full=False):
+    """
+    比较数据目录与现有索引，找出需要重新计数的文件
+
+    Returns:
+    tuple: (需要计数的文件路径列表, 已删除文件对应的 archaea_id 集合)
+    """
+    existing = {
+        archaea_id: (file_path, file_size, file_mtime)
+        for archaea_id, file_path, file_size, file_mtime in index_model.objects.values_list(
+            'archaea_id', 'file_path', 'file_size', 'file_mtime'
+        ).iterator(chunk_size=10000)
+    }
+
+    changed_files = []
+    seen_ids = set()
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.tsv'):
+                continue
+            archaea_id = os.path.splitext(entry.name)[0]
+            seen_ids.add(archaea_id)
+
+            stat = entry.stat()
+            if full or existing.get(archaea_id) != (entry.path, stat.st_size, stat.st_mtime):
+                changed_files.append(entry.path)
+
+    return changed_files, set(existing) - seen_ids
+
+
+def apply_index_update(index_model, counted_files, removed_ids, batch_size=1000):
+    """
+    在同一个事务中写入新增/变化的文件并删除已不存在的文件，随后重算 row_offset
+
+    读请求在事务提交前始终看到完整的旧索引，提交后看到完整的新索引
+    """
+    counted = {
+        os.path.splitext(os.path.basename(file_path))[0]: (file_path, file_size, file_mtime, row_count)
+        for file_path, file_size, file_mtime, row_count in counted_files
+    }
+
+    with transaction.atomic():
+        if removed_ids:
+            index_model.objects.filter(archaea_id__in=removed_ids).delete()
+
+        existing = dict(index_model.objects.filter(archaea_id__in=counted).values_list('archaea_id', 'id'))
+
+        updates = []
+        creates = []
+        for archaea_id, (file_path, file_size, file_mtime, row_count) in counted.items():
+            fields = dict(file_path=file_path, file_size=file_size, file_mtime=file_mtime, row_count=row_count)
+            if archaea_id in existing:
+                updates.append(index_model(id=existing[archaea_id], archaea_id=archaea_id, **fields))
+            else:
+                creates.append(index_model(archaea_id=archaea_id, **fields))
+
+        index_model.objects.bulk_update(
+            updates, ['file_path', 'file_size', 'file_mtime', 'row_count'], batch_size=batch_size
+        )
+        index_model.objects.bulk_create(creates, batch_size=batch_size)
+
+        if counted or removed_ids:
+            fill_row_offsets(index_model, batch_size=batch_size)
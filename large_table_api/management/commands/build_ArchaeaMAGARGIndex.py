@@ -1,8 +1,11 @@
 import os
 from django.core.management.base import BaseCommand
 from large_table_api.models import ArchaeaMAGARGIndex
+from large_table_api.indexing import fill_row_offsets
 from tqdm import tqdm
 
+from utils.read_files import build_row_offsets
+
 class Command(BaseCommand):
     help = '为拆分后的TSV文件构建索引'
 
@@ -27,9 +30,8 @@ class Command(BaseCommand):
             file_path = os.path.join(data_dir, tsv_file)
             archaea_id = os.path.splitext(tsv_file)[0]
             
-            # 快速计算行数 (不包括标题行)
-            with open(file_path, 'rb') as f:
-                row_count = sum(1 for _ in f) - 1
+            # 计算行数 (不包括标题行)，同时写入行字节偏移索引
+            row_count = build_row_offsets(file_path)
             
             # 添加到批量列表
             index_objects.append(ArchaeaMAGARGIndex(
@@ -47,4 +49,7 @@ class Command(BaseCommand):
         if index_objects:
             ArchaeaMAGARGIndex.objects.bulk_create(index_objects)
         
+        # 写入累计偏移，供分页时直接定位起始文件
+        fill_row_offsets(ArchaeaMAGARGIndex)
+        
         self.stdout.write(self.style.SUCCESS(f'成功索引了 {len(tsv_files)} 个TSV文件'))
\ No newline at end of file
@@ -1,9 +1,11 @@
 import os
 from django.core.management.base import BaseCommand
 from large_table_api.models import ArchaeaUnMAGTMHIndex
-import pandas as pd
+from large_table_api.indexing import fill_row_offsets
 from tqdm import tqdm
 
+from utils.read_files import build_protein_row_offsets
+
 class Command(BaseCommand):
     help = '为拆分后的TSV文件构建索引'
 
@@ -28,10 +30,8 @@ class Command(BaseCommand):
             file_path = os.path.join(data_dir, tsv_file)
             archaea_id = os.path.splitext(tsv_file)[0]
             
-            # 快速计算行数 (不包括标题行)
-            df = pd.read_csv(file_path, sep='\t')
-            unique_protein_ids = df['Protein_ID'].unique()
-            row_count = len(unique_protein_ids)
+            # 按蛋白计数并写入行偏移与蛋白起始行索引 (不包括标题行)
+            row_count = build_protein_row_offsets(file_path)
             
             # 添加到批量列表
             index_objects.append(ArchaeaUnMAGTMHIndex(
@@ -49,4 +49,7 @@ class Command(BaseCommand):
         if index_objects:
             ArchaeaUnMAGTMHIndex.objects.bulk_create(index_objects)
         
+        # 写入累计偏移，供分页时直接定位起始文件
+        fill_row_offsets(ArchaeaUnMAGTMHIndex)
+        
         self.stdout.write(self.style.SUCCESS(f'成功索引了 {len(tsv_files)} 个TSV文件'))
\ No newline at end of file
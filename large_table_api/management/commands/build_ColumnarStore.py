@@ -0,0 +1,164 @@
+import os
+import json
+from django.core.management.base import BaseCommand, CommandError
+from tqdm import tqdm
+
+from utils.read_files import *
+
+# 按 数据类型/物种 选择与 large_table_api 视图相同的读取函数
+READERS = {
+    'proteins': {
+        'Archaea': read_archaea_protein_file,
+        'Bacteria': read_bacteria_protein_file,
+        'Fungi': read_fungi_protein_file,
+        'Viruses': read_viruses_protein_file,
+    },
+    'args': {
+        'Archaea': read_archaea_arg_file,
+        'Bacteria': read_bacteria_arg_file,
+        'Fungi': read_fungi_arg_file,
+        'Viruses': read_viruses_arg_file,
+    },
+    'tmhs': {
+        'Archaea': read_archaea_tmh_file,
+        'Bacteria': read_bacteria_tmh_file,
+        'Fungi': read_fungi_tmh_file,
+        'Viruses': read_viruses_tmh_file,
+    },
+}
+
+PROTEIN_COLUMNS = [
+    ('genome_id', 'string'), ('contig_id', 'string'), ('protein_id', 'string'), ('orf_prediction_source', 'string'),
+    ('start', 'int64'), ('end', 'int64'), ('strand', 'int64'), ('phase', 'int64'), ('product', 'string'),
+    ('function_prediction_source', 'string'), ('cog_category', 'list'), ('description', 'string'),
+    ('preferred_name', 'string'), ('gos', 'string'), ('ec', 'string'), ('kegg_ko', 'string'),
+    ('kegg_pathway', 'string'), ('kegg_module', 'string'), ('kegg_reaction', 'string'), ('kegg_rclass', 'string'),
+    ('brite', 'string'), ('kegg_tc', 'string'), ('cazy', 'string'), ('bigg_reaction', 'string'),
+    ('pfams', 'string'), ('sequence', 'string'),
+]
+
+ARG_COLUMNS = [
+    ('genome_id', 'string'), ('contig_id', 'string'), ('protein_id', 'string'), ('product', 'string'),
+    ('arg_database', 'string'), ('cutoff', 'string'), ('hsp_identifier', 'string'), ('best_hit_aro', 'string'),
+    ('best_identities', 'float64'), ('aro', 'int64'), ('drug_class', 'list'), ('resistance_mechanism', 'string'),
+    ('amr_gene_family', 'string'), ('antibiotic', 'string'), ('sequence', 'string'),
+    ('snps_in_best_hit_aro', 'string'), ('other_snps', 'string'),
+]
+
+TMH_COLUMNS = [
+    ('helices', 'helices'), ('genome_id', 'string'), ('contig_id', 'string'), ('protein_id', 'string'),
+    ('length', 'int64'), ('predicted_tmh_count', 'int64'), ('source', 'string'),
+    ('expected_aas_in_tmh', 'float64'), ('expected_first_60_aas', 'float64'), ('total_prob_n_in', 'float64'),
+]
+
+COLUMNS = {
+    'proteins': PROTEIN_COLUMNS,
+    'args': ARG_COLUMNS,
+    'tmhs': TMH_COLUMNS,
+}
+
+ID_FIELDS = {
+    'Archaea': 'archaea_id',
+    'Bacteria': 'bacteria_id',
+    'Fungi': 'fungi_id',
+    'Viruses': 'viruses_id',
+}
+
+
+class Command(BaseCommand):
+    help = '将 <Kingdom>/<MAG|unMAG>/{proteins,args,tmhs} 下的逐基因组TSV文件合并为一个列式存储文件 (Parquet)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('data_dir', type=str, help='包含TSV文件的目录路径，如 /delta_microbia/new_data/Archaea/MAG/proteins')
+        parser.add_argument('--row-group-size', type=int, default=2048,
+                            help='每个行组的行数；读取一页时只解码覆盖该页的行组，行组越小单页解码量越小，文件元数据越大')
+
+    def get_schema(self, pa, columns):
+        types = {
+            'string': pa.string(),
+            'int64': pa.int64(),
+            'float64': pa.float64(),
+            'list': pa.list_(pa.string()),
+            'helices': pa.list_(pa.struct([
+                ('id', pa.int64()), ('position', pa.string()), ('start', pa.int64()), ('end', pa.int64()),
+                ('tmh', pa.int64()),
+            ])),
+        }
+        return pa.schema([(name, types[column_type]) for name, column_type in columns])
+
+    def handle(self, *args, **options):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise CommandError('构建列式存储需要安装 pyarrow')
+
+        data_dir = os.path.normpath(options['data_dir'])
+        row_group_size = options['row_group_size']
+
+        data_type = os.path.basename(data_dir)
+        kingdom = os.path.basename(os.path.dirname(os.path.dirname(data_dir)))
+        if data_type not in READERS or kingdom not in ID_FIELDS:
+            raise CommandError(f'无法识别的数据目录: {data_dir}')
+
+        schema = self.get_schema(pa, COLUMNS[data_type])
+        read_file = READERS[data_type][kingdom]
+        id_field = ID_FIELDS[kingdom]
+        store_path = get_columnar_store_path(os.path.join(data_dir, 'placeholder.tsv'))
+
+        # 获取所有TSV文件
+        tsv_files = sorted(f for f in os.listdir(data_dir) if f.endswith('.tsv'))
+        self.stdout.write(f"发现{len(tsv_files)}个TSV文件，开始构建列式存储 {store_path} ...")
+
+        # 基因组 -> [在整个文件中的起始行, 行数]
+        genomes = {}
+        pending_rows = []
+        total_rows = 0
+        row_group = 0
+        tmp_path = store_path + '.tmp'
+        writer = pq.ParquetWriter(tmp_path, schema)
+
+        def flush(rows):
+            nonlocal row_group
+            table = pa.Table.from_pylist(rows, schema=schema)
+            writer.write_table(table, row_group_size=len(rows))
+            row_group += 1
+
+        try:
+            for tsv_file in tqdm(tsv_files):
+                genome_id = os.path.splitext(tsv_file)[0]
+                rows = read_file(os.path.join(data_dir, tsv_file))
+
+                genomes[genome_id] = [total_rows, len(rows)]
+                total_rows += len(rows)
+                for row in rows:
+                    row.pop('id')
+                    row['genome_id'] = row.pop(id_field)
+                    # "nan" 占位的数值列以空值存储，读取时还原
+                    for key in ('best_identities', 'aro'):
+                        if row.get(key) == "nan":
+                            row[key] = None
+                    pending_rows.append(row)
+
+                # 行组固定行数，可跨越基因组边界，避免大基因组形成巨大的行组
+                while len(pending_rows) >= row_group_size:
+                    flush(pending_rows[:row_group_size])
+                    pending_rows = pending_rows[row_group_size:]
+
+            if pending_rows:
+                flush(pending_rows)
+
+            # 基因组位置表写入文件元数据，读取时一次加载
+            writer.add_key_value_metadata({
+                'genome_rows': json.dumps(genomes),
+                'id_field': id_field,
+            })
+            writer.close()
+            os.replace(tmp_path, store_path)
+        finally:
+            if writer.is_open:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.stdout.write(self.style.SUCCESS(f'成功合并了 {len(tsv_files)} 个TSV文件，共 {row_group} 个行组'))
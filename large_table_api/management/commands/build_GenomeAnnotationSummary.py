@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.annotation_summary import ANNOTATION_COUNT_FIELDS, refresh_genome_annotation_summaries
+
+
+class Command(BaseCommand):
+    help = '重算基因组详情页使用的 GenomeAnnotationSummary 注释计数表 (每类注释一次分组查询)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('microbes', nargs='*', type=str,
+                            help=f"要重算的微生物类别，如 Archaea，缺省时重算全部: {', '.join(KINGDOMS)}")
+        parser.add_argument('--mag-status', choices=MAG_STATUSES, help='只重算 MAG 或 unMAG')
+        parser.add_argument('--fields', nargs='+', choices=ANNOTATION_COUNT_FIELDS, help='只重算指定的计数列')
+
+    def handle(self, *args, **options):
+        microbes = options['microbes'] or list(KINGDOMS)
+        unknown = [microbe for microbe in microbes if microbe not in KINGDOMS]
+        if unknown:
+            raise CommandError(f"未知的微生物类别: {', '.join(unknown)}")
+
+        mag_statuses = [options['mag_status']] if options['mag_status'] else list(MAG_STATUSES)
+        for microbe in microbes:
+            for mag_status in mag_statuses:
+                genome_count = refresh_genome_annotation_summaries(microbe, mag_status, options['fields'])
+                self.stdout.write(self.style.SUCCESS(f"{microbe} {mag_status}: 写入了 {genome_count} 个基因组的注释计数"))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.genome_locations import refresh_genome_locations
+
+
+class Command(BaseCommand):
+    help = '重算各注释表的 location 区间列 (基因组区间重叠查询使用的 GiST 索引列)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('microbes', nargs='*', type=str,
+                            help=f"要重算的微生物类别，如 Archaea，缺省时重算全部: {', '.join(KINGDOMS)}")
+        parser.add_argument('--mag-status', choices=MAG_STATUSES, help='只重算 MAG 或 unMAG')
+        parser.add_argument('--batch-size', type=int, default=100000, help='每条 UPDATE 覆盖的主键范围')
+
+    def handle(self, *args, **options):
+        microbes = options['microbes'] or list(KINGDOMS)
+        unknown = [microbe for microbe in microbes if microbe not in KINGDOMS]
+        if unknown:
+            raise CommandError(f"未知的微生物类别: {', '.join(unknown)}")
+
+        mag_statuses = [options['mag_status']] if options['mag_status'] else list(MAG_STATUSES)
+        for microbe in microbes:
+            for mag_status in mag_statuses:
+                results = refresh_genome_locations(microbe, mag_status, options['batch_size'])
+                for location_type, count in results.items():
+                    self.stdout.write(self.style.SUCCESS(f"{microbe} {mag_status} {location_type}: 更新了 {count} 行"))
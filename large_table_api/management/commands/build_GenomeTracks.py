@@ -0,0 +1,55 @@
+import os
+from django.core.management.base import BaseCommand, CommandError
+from tqdm import tqdm
+
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.annotation_summary import get_genome_model
+from utils.genome_tracks import get_track_file_path, is_track_file_current, read_track_file, write_genome_tracks
+
+
+class Command(BaseCommand):
+    help = '为每个基因组生成基因组浏览器轨道文件 (各轨道的要素与多分辨率分箱计数)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('microbes', nargs='*', type=str,
+                            help=f"要处理的微生物类别，缺省时处理全部: {', '.join(KINGDOMS)}")
+        parser.add_argument('--mag-status', choices=MAG_STATUSES, help='只处理 MAG 或 unMAG')
+        parser.add_argument('--full', action='store_true', help='重建全部轨道文件，缺省时只生成缺失或过期的轨道文件')
+
+    def is_current(self, microbe, mag_status, genome_id):
+        # 轨道文件存在、晚于源文件且由当前数据版本生成时跳过
+        path = get_track_file_path(microbe, mag_status, genome_id)
+        if not os.path.exists(path):
+            return False
+        try:
+            return is_track_file_current(microbe, mag_status, genome_id, read_track_file(path))
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def handle(self, *args, **options):
+        microbes = options['microbes'] or list(KINGDOMS)
+        unknown = [microbe for microbe in microbes if microbe not in KINGDOMS]
+        if unknown:
+            raise CommandError(f"未知的微生物类别: {', '.join(unknown)}")
+
+        mag_statuses = [options['mag_status']] if options['mag_status'] else list(MAG_STATUSES)
+        for microbe in microbes:
+            for mag_status in mag_statuses:
+                genome_ids = list(get_genome_model(microbe, mag_status).objects.values_list('unique_id', flat=True))
+                if not options['full']:
+                    genome_ids = [
+                        genome_id for genome_id in genome_ids
+                        if not self.is_current(microbe, mag_status, genome_id)
+                    ]
+
+                failed = 0
+                for genome_id in tqdm(genome_ids, desc=f'{microbe} {mag_status}'):
+                    try:
+                        write_genome_tracks(microbe, mag_status, genome_id)
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f"{genome_id}: {e}")
+
+                self.stdout.write(self.style.SUCCESS(
+                    f"{microbe} {mag_status}: 生成了 {len(genome_ids) - failed} 个基因组的轨道文件，失败 {failed} 个"
+                ))
@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from tqdm import tqdm
+
+from MicrobialScope_api.constant import MEDIA_DATA_DIR
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.fasta_index import build_indexed_fasta, get_indexed_fasta_path, is_indexed_fasta_current
+
+
+def build_one(paths):
+    source_path, target_path = paths
+    return source_path, build_indexed_fasta(source_path, target_path)
+
+
+class Command(BaseCommand):
+    help = '将基因组 .fna.gz 转为 BGZF 副本并生成 .fai/.gzi 索引，供基因组序列接口按 contig 与区间读取'
+
+    def add_arguments(self, parser):
+        parser.add_argument('microbes', nargs='*', type=str,
+                            help=f"要处理的微生物类别，缺省时处理全部: {', '.join(KINGDOMS)}")
+        parser.add_argument('--mag-status', choices=MAG_STATUSES, help='只处理 MAG 或 unMAG')
+        parser.add_argument('--base-dir', type=str, default=MEDIA_DATA_DIR, help='数据根目录')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='压缩进程数')
+        parser.add_argument('--full', action='store_true', help='忽略修改时间，重建全部文件')
+
+    def handle(self, *args, **options):
+        microbes = options['microbes'] or list(KINGDOMS)
+        unknown = [microbe for microbe in microbes if microbe not in KINGDOMS]
+        if unknown:
+            raise CommandError(f"未知的微生物类别: {', '.join(unknown)}")
+
+        mag_statuses = [options['mag_status']] if options['mag_status'] else list(MAG_STATUSES)
+
+        # 只处理 BGZF 副本或其索引不存在、早于原文件的基因组
+        jobs = []
+        for microbe in microbes:
+            for mag_status in mag_statuses:
+                fna_dir = os.path.join(options['base_dir'], microbe, mag_status, 'fna')
+                if not os.path.isdir(fna_dir):
+                    self.stdout.write(f"目录不存在: {fna_dir}，跳过")
+                    continue
+
+                with os.scandir(fna_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith('.fna.gz'):
+                            continue
+                        if not options['full'] and is_indexed_fasta_current(entry.path):
+                            continue
+                        jobs.append((entry.path, get_indexed_fasta_path(entry.path)))
+
+        self.stdout.write(f"{len(jobs)} 个基因组需要建立索引")
+        failed = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            futures = [executor.submit(build_one, job) for job in jobs]
+            for job, future in tqdm(zip(jobs, futures), total=len(jobs)):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{job[0]}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(f"完成 {len(jobs) - failed} 个基因组，失败 {failed} 个"))
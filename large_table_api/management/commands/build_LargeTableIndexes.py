@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from tqdm import tqdm
+
+from MicrobialScope_api.constant import NEW_MEDIA_DATA_DIR
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES, apply_index_update, count_tsv_file, get_index_specs, \
+    plan_index_update
+from utils.annotation_summary import FILE_COUNT_INDEXES, refresh_genome_annotation_summaries
+
+
+class Command(BaseCommand):
+    help = '并行、增量地构建大表索引 (可选择任意子集)，每个索引在单个事务中整体替换'
+
+    def add_arguments(self, parser):
+        parser.add_argument('indexes', nargs='*', type=str,
+                            help='要构建的索引名，如 ArchaeaMAGProteinIndex，缺省时构建全部 24 个')
+        parser.add_argument('--base-dir', type=str, default=NEW_MEDIA_DATA_DIR, help='数据根目录')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='计数进程数')
+        parser.add_argument('--full', action='store_true', help='忽略文件大小与修改时间，重新计数全部文件')
+
+    def handle(self, *args, **options):
+        specs = get_index_specs()
+        names = options['indexes'] or list(specs)
+        unknown = [name for name in names if name not in specs]
+        if unknown:
+            raise CommandError(f"未知的索引: {', '.join(unknown)}")
+
+        # 找出每个索引需要重新计数的文件
+        plans = {}
+        for name in names:
+            index_model, relative_dir = specs[name]
+            data_dir = os.path.join(options['base_dir'], relative_dir)
+            if not os.path.isdir(data_dir):
+                self.stdout.write(f"目录不存在: {data_dir}，跳过 {name}")
+                continue
+
+            changed_files, removed_ids = plan_index_update(index_model, data_dir, options['full'])
+            plans[name] = (changed_files, removed_ids)
+            self.stdout.write(f"{name}: {len(changed_files)} 个文件需要计数，{len(removed_ids)} 个文件已删除")
+
+        # 所有索引的文件共用一个进程池计数
+        counted = {name: [] for name in plans}
+        file_owners = {file_path: name for name, (changed_files, _) in plans.items() for file_path in changed_files}
+        if file_owners:
+            with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+                results = executor.map(count_tsv_file, file_owners, chunksize=64)
+                for result in tqdm(results, total=len(file_owners)):
+                    counted[file_owners[result[0]]].append(result)
+
+        # 逐个索引在事务中整体替换
+        for name, (changed_files, removed_ids) in plans.items():
+            index_model, _ = specs[name]
+            apply_index_update(index_model, counted[name], removed_ids)
+            self.stdout.write(self.style.SUCCESS(f"{name}: 更新了 {len(counted[name])} 个文件"))
+
+        # 索引中的行数同时是基因组详情页的蛋白 / ARG / TMH 计数
+        for kingdom in KINGDOMS:
+            for mag_status in MAG_STATUSES:
+                prefix = f"{kingdom}{mag_status[0].upper()}{mag_status[1:]}"
+                fields = [
+                    field for field, data_type in FILE_COUNT_INDEXES.items()
+                    if f"{prefix}{data_type}Index" in plans
+                ]
+                if fields:
+                    refresh_genome_annotation_summaries(kingdom, mag_status, fields)
+                    self.stdout.write(self.style.SUCCESS(f"{kingdom} {mag_status}: 更新了注释计数 {', '.join(fields)}"))
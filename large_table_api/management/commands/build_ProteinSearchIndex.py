@@ -0,0 +1,37 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.protein_search import SOURCES, build_protein_search_index
+
+
+class Command(BaseCommand):
+    help = '离线构建蛋白序列相似性搜索的 k-mer / minimizer 索引 (proteins/*.tsv 与 *Protein 表中的全部蛋白)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('microbes', nargs='*', type=str,
+                            help=f"要收录的微生物类别，如 Archaea，缺省时收录全部: {', '.join(KINGDOMS)}")
+        parser.add_argument('--mag-status', choices=MAG_STATUSES, help='只收录 MAG 或 unMAG')
+        parser.add_argument('--batch-residues', type=int, default=4000000,
+                            help='每批计算 minimizer 的残基数，决定构建时的内存占用')
+
+    def handle(self, *args, **options):
+        microbes = options['microbes'] or list(KINGDOMS)
+        unknown = [microbe for microbe in microbes if microbe not in KINGDOMS]
+        if unknown:
+            raise CommandError(f"未知的微生物类别: {', '.join(unknown)}")
+
+        mag_statuses = [options['mag_status']] if options['mag_status'] else list(MAG_STATUSES)
+        sources = [(microbe, mag_status) for microbe, mag_status in SOURCES
+                   if microbe in microbes and mag_status in mag_statuses]
+
+        # 新索引构建在单独的目录中，完成后才替换 current.json，构建期间旧索引照常查询
+        os.makedirs(settings.PROTEIN_SEARCH_INDEX_DIR, exist_ok=True)
+        manifest = build_protein_search_index(
+            settings.PROTEIN_SEARCH_INDEX_DIR, sources, options['batch_residues'], log=self.stdout.write
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"索引了 {manifest['protein_count']} 个蛋白，{manifest['posting_count']} 条 minimizer 记录"
+        ))
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import URLResolver, get_resolver
+
+from archaea_database.views.base import GenericTableQueryView
+
+
+def iter_fast_list_views(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_fast_list_views(pattern.url_patterns)
+            continue
+
+        view_class = getattr(pattern.callback, 'view_class', None)
+        if view_class and issubclass(view_class, GenericTableQueryView) and view_class.fast_list:
+            yield view_class
+
+
+class Command(BaseCommand):
+    help = '比较 fast_list 列表接口的 .values() 序列化结果与 serializer_class 的输出是否完全一致，并输出耗时'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='每个接口比较的行数')
+        parser.add_argument('--view', type=str, help='只检查指定的视图类名')
+
+    def handle(self, *args, **options):
+        view_classes = list(dict.fromkeys(iter_fast_list_views(get_resolver().url_patterns)))
+        if options['view']:
+            view_classes = [view_class for view_class in view_classes if view_class.__name__ == options['view']]
+            if not view_classes:
+                raise CommandError(f"未找到启用 fast_list 的视图: {options['view']}")
+
+        mismatches = 0
+        for view_class in view_classes:
+            view = view_class()
+            queryset = view.get_queryset().order_by('id')
+
+            start = time.perf_counter()
+            instances = list(queryset[:options['rows']])
+            context = view.get_context(instances, None)
+            expected = view.get_serializer_class()(instances, many=True, context=context).data
+            serializer_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            rows = list(view.get_list_queryset(queryset)[:options['rows']])
+            results = view.serialize_page(rows, None)
+            fast_time = time.perf_counter() - start
+
+            if results == expected:
+                status = self.style.SUCCESS('一致')
+            else:
+                mismatches += 1
+                status = self.style.ERROR('不一致')
+            self.stdout.write(
+                f'{view_class.__name__}: {status}, {len(instances)} 行, '
+                f'serializer {serializer_time * 1000:.1f} ms, fast_list {fast_time * 1000:.1f} ms'
+            )
+
+        if mismatches:
+            raise CommandError(f'{mismatches} 个接口的 fast_list 输出与 serializer_class 不一致')
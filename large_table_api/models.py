@@ -6,10 +6,16 @@ class ArchaeaMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class ArchaeaMAGARGIndex(models.Model):
@@ -17,10 +23,16 @@ class ArchaeaMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class ArchaeaMAGTMHIndex(models.Model):
@@ -28,10 +40,16 @@ class ArchaeaMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class ArchaeaUnMAGProteinIndex(models.Model):
@@ -39,10 +57,16 @@ class ArchaeaUnMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class ArchaeaUnMAGARGIndex(models.Model):
@@ -50,10 +74,16 @@ class ArchaeaUnMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class ArchaeaUnMAGTMHIndex(models.Model):
@@ -61,10 +91,16 @@ class ArchaeaUnMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiMAGProteinIndex(models.Model):
@@ -72,10 +108,16 @@ class FungiMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiMAGARGIndex(models.Model):
@@ -83,10 +125,16 @@ class FungiMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiMAGTMHIndex(models.Model):
@@ -94,10 +142,16 @@ class FungiMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiUnMAGProteinIndex(models.Model):
@@ -105,10 +159,16 @@ class FungiUnMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiUnMAGARGIndex(models.Model):
@@ -116,10 +176,16 @@ class FungiUnMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class FungiUnMAGTMHIndex(models.Model):
@@ -127,10 +193,16 @@ class FungiUnMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesMAGProteinIndex(models.Model):
@@ -138,10 +210,16 @@ class VirusesMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesMAGARGIndex(models.Model):
@@ -149,10 +227,16 @@ class VirusesMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesMAGTMHIndex(models.Model):
@@ -160,10 +244,16 @@ class VirusesMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesUnMAGProteinIndex(models.Model):
@@ -171,10 +261,16 @@ class VirusesUnMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesUnMAGARGIndex(models.Model):
@@ -182,10 +278,16 @@ class VirusesUnMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class VirusesUnMAGTMHIndex(models.Model):
@@ -193,10 +295,16 @@ class VirusesUnMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaMAGProteinIndex(models.Model):
@@ -204,10 +312,16 @@ class BacteriaMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaMAGARGIndex(models.Model):
@@ -215,10 +329,16 @@ class BacteriaMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaMAGTMHIndex(models.Model):
@@ -226,10 +346,16 @@ class BacteriaMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaUnMAGProteinIndex(models.Model):
@@ -237,10 +363,16 @@ class BacteriaUnMAGProteinIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaUnMAGARGIndex(models.Model):
@@ -248,10 +380,16 @@ class BacteriaUnMAGARGIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
 
 class BacteriaUnMAGTMHIndex(models.Model):
@@ -259,8 +397,14 @@ class BacteriaUnMAGTMHIndex(models.Model):
     archaea_id = models.CharField(max_length=255, unique=True)
     file_path = models.TextField()
     row_count = models.IntegerField(default=0)
+    # 按 archaea_id 排序时该文件之前所有文件的累计行数，由 build_*Index 命令写入
+    row_offset = models.BigIntegerField(null=True, blank=True)
+    # 建索引时文件的大小与修改时间，增量重建时据此跳过未变化的文件
+    file_size = models.BigIntegerField(null=True, blank=True)
+    file_mtime = models.FloatField(null=True, blank=True)
     
     class Meta:
         indexes = [
             models.Index(fields=['archaea_id']),
+            models.Index(fields=['row_offset', 'row_count']),
         ]
\ No newline at end of file
@@ -1,173 +1,98 @@
-import os
 import json
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponseNotModified
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
-from django.db.models import Q, Sum
-from django.core.cache import cache
-import hashlib
+from django.db.models import Q, F
 
 from large_table_api.models import *
 from utils.read_files import *
 from utils.download_files import download_meta_data
+from utils.file_cache import parsed_file_cache
+from utils.response_cache import TableCacheEntry
 
-from django.views.decorators.cache import cache_page
 
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def archaea_protein_list(request):
+def get_overlapping_files(index_files, start_global_row, end_global_row):
     """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
+    计算与当前页面 [start_global_row, end_global_row] 重叠的文件及文件内行范围
+    index_files 需按全局顺序排列，且每项带有 row_offset (该文件之前的累计行数)
     """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"archaea_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'archaea_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
+    relevant_files = []
+
+    for file_info in index_files:
+        file_start_global = file_info['row_offset']
+        file_end_global = file_start_global + file_info['row_count'] - 1
+
+        # 如果已经越过当前页面，可以停止
+        if file_start_global > end_global_row:
+            break
+
+        # 检查此文件是否与当前页面相关
+        if file_end_global >= start_global_row:
+            relevant_files.append({
+                'file_info': file_info,
+                'start_in_file': max(0, start_global_row - file_start_global),
+                'end_in_file': min(file_info['row_count'] - 1, end_global_row - file_start_global),
+                'global_offset': file_start_global
             })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_archaea_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def archaea_arg_list(request):
+
+    return relevant_files
+
+
+def locate_page_files(index_model, query, start_global_row, page_size):
+    """
+    定位覆盖当前页面的文件，返回 (总行数, 相关文件列表)
+
+    未搜索时利用 build_*Index 写入的累计偏移 row_offset，通过两次索引范围查询定位，
+    页面延迟与页码无关；带搜索条件或索引尚未写入 row_offset 时，回退为逐个文件累加行数。
+    """
+    fields = ('id', 'archaea_id', 'file_path', 'row_count', 'row_offset')
+
+    if not query:
+        last_file = index_model.objects.order_by(
+            F('row_offset').desc(nulls_last=True), '-row_count'
+        ).values('row_offset', 'row_count').first()
+
+        if last_file is None:
+            return 0, []
+
+        if last_file['row_offset'] is not None:
+            total_rows = last_file['row_offset'] + last_file['row_count']
+            end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
+            if start_global_row >= total_rows:
+                return total_rows, []
+
+            # 找到包含起始行的文件的偏移，再取该偏移到页面末尾之间的文件
+            start_offset = index_model.objects.filter(
+                row_offset__lte=start_global_row
+            ).order_by('-row_offset').values_list('row_offset', flat=True).first() or 0
+            index_files = index_model.objects.filter(
+                row_offset__gte=start_offset,
+                row_offset__lte=end_global_row
+            ).order_by('row_offset', 'archaea_id').values(*fields)
+
+            return total_rows, get_overlapping_files(index_files, start_global_row, end_global_row)
+
+    # 获取匹配的文件列表及其行数信息，并在内存中累加偏移
+    index_files = list(index_model.objects.filter(query).order_by('archaea_id').values(*fields))
+    current_row_offset = 0
+    for file_info in index_files:
+        file_info['row_offset'] = current_row_offset
+        current_row_offset += file_info['row_count']
+
+    total_rows = current_row_offset
+    end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
+    if start_global_row >= total_rows:
+        return total_rows, []
+
+    return total_rows, get_overlapping_files(index_files, start_global_row, end_global_row)
+
+
+def large_table_list(request, index_model, read_file, cache_prefix, id_field):
     """
     处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
     避免同时加载太多文件到内存
+    id_field 为前端搜索所用的基因组 ID 字段名 (archaea_id / fungi_id / viruses_id / bacteria_id)，
+    各索引模型均将基因组 ID 存于 archaea_id 列
     """
     try:
         # 解析请求数据
@@ -181,41 +106,31 @@ def archaea_arg_list(request):
         search_field = search_content.get('field')
         search_value = search_content.get('value', '')
         
-        # 生成缓存键
-        cache_key = f"archaea_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
+        # 可选的列投影，未指定时返回全部字段
+        columns = data.get('columns') or None
         
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
+        # 以规范化的请求体与索引数据版本为键，从所有 worker 共享的缓存获取结果
+        cache_entry = TableCacheEntry(cache_prefix, index_model._meta.label_lower, data)
+        if cache_entry.is_not_modified(request):
+            response = HttpResponseNotModified()
+            response['ETag'] = cache_entry.etag
+            return response
+        if cache_entry.payload is not None:
+            response = JsonResponse(cache_entry.payload)
+            response['ETag'] = cache_entry.etag
+            return response
         
         # 构建查询
         query = Q()
-        if search_field == 'archaea_id' and search_value:
+        if search_field == id_field and search_value:
             query &= Q(archaea_id__icontains=search_value)
         
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
         # 计算当前页面应该从哪个文件的哪一行开始
         start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
+        total_rows, relevant_files = locate_page_files(index_model, query, start_global_row, page_size)
         
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
+        # 如果没有找到数据或请求的起始行超过了总行数，返回空结果
+        if not relevant_files:
             return JsonResponse({
                 'count': total_rows,
                 'page': current_page,
@@ -223,33 +138,6 @@ def archaea_arg_list(request):
                 'results': []
             })
         
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
         # 读取需要的文件并收集结果
         results = []
         id_counter = start_global_row + 1  # ID从1开始
@@ -260,11 +148,22 @@ def archaea_arg_list(request):
             end_in_file = file_data['end_in_file']
             
             try:
-                # 读取整个文件
-                all_rows = read_archaea_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
+                # 文件已被解析缓存时直接切片，否则优先从列式存储读取，不可用时借助行偏移索引只读取需要的行
+                needed_rows = None
+                cached_rows = parsed_file_cache.get_if_cached(read_file, file_info['file_path'])
+                if cached_rows is not None:
+                    needed_rows = [
+                        {key: row[key] for key in row if not columns or key in columns}
+                        for row in cached_rows[start_in_file:end_in_file + 1]
+                    ]
+                if needed_rows is None:
+                    needed_rows = read_columnar_rows(
+                        file_info['file_path'], file_info['archaea_id'], start_in_file, end_in_file, columns
+                    )
+                if needed_rows is None:
+                    needed_rows = read_file(file_info['file_path'], start_in_file, end_in_file)
+                    if columns:
+                        needed_rows = [{key: row[key] for key in row if key in columns} for row in needed_rows]
                 
                 # 处理行数据
                 for row in needed_rows:
@@ -294,9 +193,11 @@ def archaea_arg_list(request):
         }
         
         # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
+        cache_entry.store(response_data)
         
-        return JsonResponse(response_data)
+        response = JsonResponse(response_data)
+        response['ETag'] = cache_entry.etag
+        return response
     
     except Exception as e:
         import traceback
@@ -307,3263 +208,128 @@ def archaea_arg_list(request):
             'page': 1,
             'page_size': 10,
             'results': []
-        }, status=500) 
+        }, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def archaea_protein_list(request):
+    return large_table_list(request, ArchaeaMAGProteinIndex, read_archaea_protein_file, 'archaea_protein', 'archaea_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def archaea_arg_list(request):
+    return large_table_list(request, ArchaeaMAGARGIndex, read_archaea_arg_file, 'archaea_arg', 'archaea_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def archaea_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"archaea_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'archaea_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_archaea_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
+    return large_table_list(request, ArchaeaMAGTMHIndex, read_archaea_tmh_file, 'archaea_tmh', 'archaea_id')
+
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def archaea_unmag_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"archaea_unmag_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'archaea_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaUnMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_archaea_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
+    return large_table_list(request, ArchaeaUnMAGProteinIndex, read_archaea_protein_file, 'archaea_unmag_protein', 'archaea_id')
+
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def archaea_unmag_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"archaea_unmag_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'archaea_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaUnMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_archaea_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
+    return large_table_list(request, ArchaeaUnMAGARGIndex, read_archaea_arg_file, 'archaea_unmag_arg', 'archaea_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def archaea_unmag_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"archaea_unmag_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'archaea_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(ArchaeaUnMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_archaea_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_unmag_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_unmag_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiUnMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_unmag_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_unmag_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiUnMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def fungi_unmag_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"fungi_unmag_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'fungi_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(FungiUnMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_fungi_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_unmag_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_unmag_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesUnMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_unmag_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_unmag_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesUnMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def viruses_unmag_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"viruses_unmag_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'viruses_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(VirusesUnMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_viruses_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def bacteria_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
-@csrf_exempt
-@require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def bacteria_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
+    return large_table_list(request, ArchaeaUnMAGTMHIndex, read_archaea_tmh_file, 'archaea_unmag_tmh', 'archaea_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def bacteria_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
+def fungi_protein_list(request):
+    return large_table_list(request, FungiMAGProteinIndex, read_fungi_protein_file, 'fungi_protein', 'fungi_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
-def bacteria_unmag_protein_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_unmag_protein_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaUnMAGProteinIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_protein_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
-    
+def fungi_arg_list(request):
+    return large_table_list(request, FungiMAGARGIndex, read_fungi_arg_file, 'fungi_arg', 'fungi_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def fungi_tmh_list(request):
+    return large_table_list(request, FungiMAGTMHIndex, read_fungi_tmh_file, 'fungi_tmh', 'fungi_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def fungi_unmag_protein_list(request):
+    return large_table_list(request, FungiUnMAGProteinIndex, read_fungi_protein_file, 'fungi_unmag_protein', 'fungi_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def fungi_unmag_arg_list(request):
+    return large_table_list(request, FungiUnMAGARGIndex, read_fungi_arg_file, 'fungi_unmag_arg', 'fungi_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def fungi_unmag_tmh_list(request):
+    return large_table_list(request, FungiUnMAGTMHIndex, read_fungi_tmh_file, 'fungi_unmag_tmh', 'fungi_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_protein_list(request):
+    return large_table_list(request, VirusesMAGProteinIndex, read_viruses_protein_file, 'viruses_protein', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_arg_list(request):
+    return large_table_list(request, VirusesMAGARGIndex, read_viruses_arg_file, 'viruses_arg', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_tmh_list(request):
+    return large_table_list(request, VirusesMAGTMHIndex, read_viruses_tmh_file, 'viruses_tmh', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_unmag_protein_list(request):
+    return large_table_list(request, VirusesUnMAGProteinIndex, read_viruses_protein_file, 'viruses_unmag_protein', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_unmag_arg_list(request):
+    return large_table_list(request, VirusesUnMAGARGIndex, read_viruses_arg_file, 'viruses_unmag_arg', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def viruses_unmag_tmh_list(request):
+    return large_table_list(request, VirusesUnMAGTMHIndex, read_viruses_tmh_file, 'viruses_unmag_tmh', 'viruses_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def bacteria_protein_list(request):
+    return large_table_list(request, BacteriaMAGProteinIndex, read_bacteria_protein_file, 'bacteria_protein', 'bacteria_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def bacteria_arg_list(request):
+    return large_table_list(request, BacteriaMAGARGIndex, read_bacteria_arg_file, 'bacteria_arg', 'bacteria_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def bacteria_tmh_list(request):
+    return large_table_list(request, BacteriaMAGTMHIndex, read_bacteria_tmh_file, 'bacteria_tmh', 'bacteria_id')
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def bacteria_unmag_protein_list(request):
+    return large_table_list(request, BacteriaUnMAGProteinIndex, read_bacteria_protein_file, 'bacteria_unmag_protein', 'bacteria_id')
+
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def bacteria_unmag_arg_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_unmag_arg_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaUnMAGARGIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_arg_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
+    return large_table_list(request, BacteriaUnMAGARGIndex, read_bacteria_arg_file, 'bacteria_unmag_arg', 'bacteria_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@cache_page(60 * 5)  # 缓存5分钟
 def bacteria_unmag_tmh_list(request):
-    """
-    处理请求并返回分页的TSV数据，基于所有文件的总行数进行分页
-    避免同时加载太多文件到内存
-    """
-    try:
-        # 解析请求数据
-        data = json.loads(request.body)
-        pagination = data.get('pagination', {})
-        search_content = data.get('searchContent', {})
-        
-        current_page = pagination.get('current', 1)
-        page_size = pagination.get('pageSize', 10)
-        
-        search_field = search_content.get('field')
-        search_value = search_content.get('value', '')
-        
-        # 生成缓存键
-        cache_key = f"bacteria_unmag_tmh_data_{current_page}_{page_size}_{search_field}_{search_value}"
-        cache_key = hashlib.md5(cache_key.encode()).hexdigest()
-        
-        # 尝试从缓存获取结果
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return JsonResponse(cached_result)
-        
-        # 构建查询
-        query = Q()
-        if search_field == 'bacteria_id' and search_value:
-            query &= Q(archaea_id__icontains=search_value)
-        
-        # 获取匹配的文件列表及其行数信息
-        archaea_files = list(BacteriaUnMAGTMHIndex.objects.filter(query).order_by('archaea_id').values('id', 'archaea_id', 'file_path', 'row_count'))
-        
-        # 如果没有找到数据，返回空结果
-        if not archaea_files:
-            return JsonResponse({
-                'count': 0,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 计算总行数
-        total_rows = sum(file['row_count'] for file in archaea_files)
-        
-        # 计算当前页面应该从哪个文件的哪一行开始
-        start_global_row = (current_page - 1) * page_size
-        end_global_row = min(start_global_row + page_size - 1, total_rows - 1)
-        
-        # 如果请求的起始行超过了总行数，返回空结果
-        if start_global_row >= total_rows:
-            return JsonResponse({
-                'count': total_rows,
-                'page': current_page,
-                'page_size': page_size,
-                'results': []
-            })
-        
-        # 确定需要读取的文件
-        relevant_files = []
-        current_row_offset = 0
-        
-        for file_info in archaea_files:
-            file_start_global = current_row_offset
-            file_end_global = current_row_offset + file_info['row_count'] - 1
-            
-            # 检查此文件是否与当前页面相关
-            if file_end_global >= start_global_row and file_start_global <= end_global_row:
-                # 计算在文件内的行范围
-                start_in_file = max(0, start_global_row - file_start_global)
-                end_in_file = min(file_info['row_count'] - 1, end_global_row - file_start_global)
-                
-                relevant_files.append({
-                    'file_info': file_info,
-                    'start_in_file': start_in_file,
-                    'end_in_file': end_in_file,
-                    'global_offset': file_start_global
-                })
-            
-            current_row_offset += file_info['row_count']
-            
-            # 如果已经找到了足够的文件来覆盖当前页面，可以停止
-            if file_start_global > end_global_row:
-                break
-        
-        # 读取需要的文件并收集结果
-        results = []
-        id_counter = start_global_row + 1  # ID从1开始
-        
-        for file_data in relevant_files:
-            file_info = file_data['file_info']
-            start_in_file = file_data['start_in_file']
-            end_in_file = file_data['end_in_file']
-            
-            try:
-                # 读取整个文件
-                all_rows = read_bacteria_tmh_file(file_info['file_path'])
-                
-                # 只取需要的行
-                needed_rows = all_rows[start_in_file:end_in_file+1]
-                
-                # 处理行数据
-                for row in needed_rows:
-                    # 确保有ID和archaea_id
-                    row['id'] = id_counter
-                    
-                    results.append(row)
-                    id_counter += 1
-                    
-                    # 如果已经收集了足够的行，可以停止
-                    if len(results) >= page_size:
-                        break
-            
-            except Exception as e:
-                print(f"处理文件 {file_info['file_path']} 时出错: {str(e)}")
-            
-            # 如果已经收集了足够的行，可以停止
-            if len(results) >= page_size:
-                break
-        
-        # 构建响应
-        response_data = {
-            'count': total_rows,
-            'page': current_page,
-            'page_size': page_size,
-            'results': results
-        }
-        
-        # 缓存结果
-        cache.set(cache_key, response_data, 300)  # 5分钟缓存
-        
-        return JsonResponse(response_data)
-    
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'error': str(e),
-            'count': 0,
-            'page': 1,
-            'page_size': 10,
-            'results': []
-        }, status=500) 
+    return large_table_list(request, BacteriaUnMAGTMHIndex, read_bacteria_tmh_file, 'bacteria_unmag_tmh', 'bacteria_id')
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("microbe_database", "0002_microbefilteroptionsnew"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GenomeAnnotationSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("microbe", models.CharField(max_length=20)),
+                ("mag_status", models.CharField(max_length=10)),
+                ("unique_id", models.CharField(max_length=255)),
+                ("protein_count", models.IntegerField(blank=True, null=True)),
+                ("trna_count", models.IntegerField(blank=True, null=True)),
+                ("crispr_count", models.IntegerField(blank=True, null=True)),
+                ("anti_crispr_count", models.IntegerField(blank=True, null=True)),
+                (
+                    "secondary_metabolite_count",
+                    models.IntegerField(blank=True, null=True),
+                ),
+                ("signal_peptide_count", models.IntegerField(blank=True, null=True)),
+                ("virulence_factor_count", models.IntegerField(blank=True, null=True)),
+                ("arg_count", models.IntegerField(blank=True, null=True)),
+                ("tmh_count", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("microbe", "mag_status", "unique_id")},
+            },
+        ),
+    ]
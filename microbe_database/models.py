@@ -19,3 +19,24 @@ class MicrobeFilterOptionsNew(models.Model):
     key = models.CharField(max_length=100, unique=True)
     value = models.JSONField()
     updated_at = models.DateTimeField(auto_now=True)
+
+
+class GenomeAnnotationSummary(models.Model):
+    """每个基因组的注释条数，由导入脚本与 build_GenomeAnnotationSummary / build_LargeTableIndexes 命令写入"""
+    microbe = models.CharField(max_length=20)
+    mag_status = models.CharField(max_length=10)
+    unique_id = models.CharField(max_length=255)
+    # 该类别没有的注释类型为空
+    protein_count = models.IntegerField(null=True, blank=True)
+    trna_count = models.IntegerField(null=True, blank=True)
+    crispr_count = models.IntegerField(null=True, blank=True)
+    anti_crispr_count = models.IntegerField(null=True, blank=True)
+    secondary_metabolite_count = models.IntegerField(null=True, blank=True)
+    signal_peptide_count = models.IntegerField(null=True, blank=True)
+    virulence_factor_count = models.IntegerField(null=True, blank=True)
+    arg_count = models.IntegerField(null=True, blank=True)
+    tmh_count = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('microbe', 'mag_status', 'unique_id')
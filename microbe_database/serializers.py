@@ -12,3 +12,17 @@ class DownloadMetaSerializer(serializers.Serializer):
     baseFileName = serializers.CharField(required=True)
     type = serializers.CharField(required=True)
 
+
+
+class FilterOptionsBundleSerializer(serializers.Serializer):
+    microbe = serializers.ChoiceField(choices=['Archaea', 'Bacteria', 'Fungi', 'Virus'], required=True)
+    magStatus = serializers.ChoiceField(choices=['MAG', 'Monoisolate'], required=True)
+
+
+class ProteinSearchSerializer(serializers.Serializer):
+    # 蛋白序列，可以是 FASTA 格式
+    sequence = serializers.CharField(required=True)
+    # 只搜索某个微生物类别 / MAG 状态，缺省时搜索全部
+    microbe = serializers.ChoiceField(choices=['Archaea', 'Bacteria', 'Fungi', 'Virus'], required=False)
+    magStatus = serializers.ChoiceField(choices=['MAG', 'Monoisolate'], required=False)
+    limit = serializers.IntegerField(required=False, default=10, min_value=1, max_value=100)
@@ -1,15 +1,25 @@
 from io import BytesIO
 import os
 
-from django.http import FileResponse
+from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 
 from microbe_database.models import MicrobeStatistic
-from microbe_database.serializers import ProteinCIFSerializer, DownloadMetaSerializer
+from microbe_database.serializers import ProteinCIFSerializer, DownloadMetaSerializer, FilterOptionsBundleSerializer, \
+    ProteinSearchSerializer
 from utils.esm_fold_utils import esm_fold_cif_api
+from utils.file_serving import serve_file
+from utils.filter_options import filter_options_cache
+from utils.protein_search import SOURCES, clean_query_sequence, get_protein_search_index
+
+from archaea_database import urls as archaea_urls
+from bacteria_database import urls as bacteria_urls
+from fungi_database import urls as fungi_urls
+from viruses_database import urls as viruses_urls
 
 from MicrobialScope_api.constant import NEW_MEDIA_DATA_DIR
 
@@ -67,13 +77,111 @@ class DownloadMetaView(APIView):
             file_name = self.mag_map[mag_status] + '_' + microbe + base_file_name
             file_path = os.path.join(NEW_MEDIA_DATA_DIR, self.microbe_map[microbe], self.mag_map[mag_status], file_name)
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
             return_file_name = file_name if file_type == 'xls' else file_name.replace('.xls', '.tsv')
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=return_file_name)
+            response = serve_file(request, file_path, return_file_name)
+            if response is None:
+                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
             return response
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+
+class FilterOptionsBundleView(APIView):
+    """
+    一次返回某个微生物类别、MAG 状态下所有 *_filter_options 接口的内容，以接口路径名 (去掉 _filter_options) 为键
+    """
+    urls_map = {
+        'Archaea': archaea_urls,
+        'Bacteria': bacteria_urls,
+        'Fungi': fungi_urls,
+        'Virus': viruses_urls
+    }
+    suffix_map = {
+        'MAG': 'filter_options',
+        'Monoisolate': 'filter_options_unmag'
+    }
+
+    def build_bundle(self, request, microbe, mag_status):
+        suffix = self.suffix_map[mag_status]
+        bundle = {}
+        for pattern in self.urls_map[microbe].urlpatterns:
+            route = str(pattern.pattern)
+            if route.endswith(suffix):
+                section = route[:-len(suffix)].rstrip('_')
+                bundle[section] = pattern.callback.view_class().get(request).data
+        return bundle
+
+    def get(self, request):
+        serializer = FilterOptionsBundleSerializer(data=request.query_params)
+
+        if serializer.is_valid():
+            microbe = serializer.validated_data['microbe']
+            mag_status = serializer.validated_data['magStatus']
+
+            # 选项只在筛选项导入脚本写入后变化，内容与 ETag 均缓存在进程内
+            etag, bundle = filter_options_cache.get_bundle(
+                f'{microbe}.{mag_status}', lambda: self.build_bundle(request, microbe, mag_status)
+            )
+            if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+                return HttpResponseNotModified(headers={'ETag': etag})
+
+            return Response(bundle, headers={'ETag': etag})
+
+        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+
+class ProteinSearchView(APIView):
+    """
+    蛋白序列相似性搜索，在进程内查询 build_ProteinSearchIndex 生成的 k-mer / minimizer 索引：
+    先取与查询序列共享 minimizer 最多的候选蛋白，再用 BLOSUM62 局部比对打分排序，
+    返回得分最高的命中及其近似一致性 (identity) 与覆盖度
+    """
+    microbe_map = DownloadMetaView.microbe_map
+    mag_map = DownloadMetaView.mag_map
+
+    def post(self, request):
+        serializer = ProteinSearchSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        try:
+            query = clean_query_sequence(validated_data['sequence'])
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        max_length = getattr(settings, 'PROTEIN_SEARCH_MAX_QUERY_LENGTH', 10000)
+        if len(query) > max_length:
+            return Response({'error': f'The sequence is longer than {max_length} residues.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            index = get_protein_search_index()
+        except FileNotFoundError:
+            return Response({'error': 'The protein search index has not been built.'},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        allowed_sources = None
+        if 'microbe' in validated_data or 'magStatus' in validated_data:
+            microbe = self.microbe_map.get(validated_data.get('microbe'))
+            mag_status = self.mag_map.get(validated_data.get('magStatus'))
+            allowed_sources = [
+                position for position, (source_microbe, source_mag_status) in enumerate(SOURCES)
+                if microbe in (None, source_microbe) and mag_status in (None, source_mag_status)
+            ]
+
+        try:
+            hits = index.search(query, validated_data['limit'], allowed_sources)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 与请求参数使用相同的微生物类别 / MAG 状态名称
+        microbe_names = {value: key for key, value in self.microbe_map.items()}
+        mag_names = {value: key for key, value in self.mag_map.items()}
+        for hit in hits:
+            hit['microbe'] = microbe_names[hit['microbe']]
+            hit['magStatus'] = mag_names[hit['magStatus']]
+
+        return Response({'queryLength': len(query), 'results': hits}, status=status.HTTP_200_OK)
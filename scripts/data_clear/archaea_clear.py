@@ -5,6 +5,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from archaea_database.models import MAGArchaea, UnMAGArchaea, MAGArchaeaTaxonomy, UnMAGArchaeaTaxonomy, MAGArchaeaTRNA, \
     UnMAGArchaeaTRNA, MAGArchaeaCRISPRCas, MAGArchaeaCRISPR, UnMAGArchaeaCRISPRCas, UnMAGArchaeaCRISPR, \
     MAGArchaeaAntiCRISPRAnnotation, UnMAGArchaeaAntiCRISPRAnnotation, MAGArchaeaSecondaryMetaboliteRegion, \
@@ -167,3 +169,6 @@ def unmag_archaea_virulence_factor_clear(archaea_ids):
 
 if __name__ == '__main__':
     archaea_clear()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -4,6 +4,8 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from bacteria_database.models import (
     MAGBacteria, UnMAGBacteria,
     MAGBacteriaTaxonomy, UnMAGBacteriaTaxonomy,
@@ -174,3 +176,6 @@ def unmag_bacteria_virulence_factor_clear(bacteria_ids):
 
 if __name__ == '__main__':
     bacteria_clear()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -4,6 +4,8 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 # === 按你的项目实际模型路径与命名调整 ===
 from fungi_database.models import (
     MAGFungi, UnMAGFungi,
@@ -132,3 +134,6 @@ def unmag_fungi_virulence_factor_clear(fungi_ids):
 
 if __name__ == '__main__':
     fungi_clear()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -6,6 +6,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from bacteria_database.models import UnMAGBacteria
 from django.db.models import Q
 from django.db import transaction
@@ -37,3 +39,6 @@ def fix():
 
 if __name__ == '__main__':
     fix()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -4,6 +4,8 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from microbe_database.models import MicrobeStatistic
 from archaea_database.models import MAGArchaea, UnMAGArchaea, MAGArchaeaTaxonomy, UnMAGArchaeaTaxonomy, MAGArchaeaTRNA, \
     UnMAGArchaeaTRNA, MAGArchaeaCRISPRCas, MAGArchaeaCRISPR, UnMAGArchaeaCRISPRCas, UnMAGArchaeaCRISPR, \
@@ -466,3 +468,6 @@ if __name__ == '__main__':
     bacteria_update()
     fungi_update()
     viruses_update()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -4,6 +4,8 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from django.db import transaction
 
 # === 按你的实际工程调整这些导入（若部分模型在病毒域不存在就删掉对应行/函数）===
@@ -143,3 +145,6 @@ def unmag_viruses_virulence_factor_clear(viruses_ids):
 
 if __name__ == '__main__':
     viruses_clear()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
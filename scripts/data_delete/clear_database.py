@@ -7,6 +7,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from archaea_database.models import MAGArchaea, MAGArchaeaTaxonomy, MAGArchaeaProtein, MAGArchaeaTRNA, \
     MAGArchaeaCRISPRCas, MAGArchaeaCRISPR, MAGArchaeaAntiCRISPRAnnotation, MAGArchaeaSecondaryMetaboliteRegion, \
     MAGArchaeaSignalPeptidePrediction, MAGArchaeaVirulenceFactor, MAGArchaeaAntibioticResistance, \
@@ -146,3 +148,6 @@ if __name__ == '__main__':
     UnMAGVirusesAntibioticResistance.objects.all().delete()
     UnMAGVirusesTransmembraneHelices.objects.all().delete()
     UnMAGVirusesHelices.objects.all().delete()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -7,6 +7,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from archaea_database.models import MAGArchaea, MAGArchaeaCRISPRCas, MAGArchaeaCRISPR, MAGArchaeaProtein, \
     UnMAGArchaea, UnMAGArchaeaCRISPRCas, UnMAGArchaeaCRISPR, UnMAGArchaeaProtein
 from bacteria_database.models import MAGBacteria, MAGBacteriaCRISPRCas, MAGBacteriaCRISPR, MAGBacteriaProtein, \
@@ -51,3 +53,6 @@ if __name__ == '__main__':
     UnMAGVirusesCRISPRCas.objects.all().delete()
     UnMAGVirusesCRISPR.objects.all().delete()
     UnMAGVirusesProtein.objects.all().delete()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
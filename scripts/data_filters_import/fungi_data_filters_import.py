@@ -8,6 +8,9 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.filter_options import FILTER_OPTIONS_DATASET
+from utils.response_cache import bump_dataset_version
+
 from fungi_database.models import MAGFungi, MAGFungiProtein, MAGFungiTRNA, MAGFungiSecondaryMetaboliteRegion, \
     MAGFungiSignalPeptidePrediction, MAGFungiVirulenceFactor, MAGFungiAntibioticResistance, \
     MAGFungiTransmembraneHelices, UnMAGFungi, UnMAGFungiProtein, \
@@ -320,3 +323,6 @@ def unmag_transmembrane_helices_filters_import():
 
 if __name__ == '__main__':
     fungi_data_import()
+
+    # 筛选项已变化，使各进程缓存的筛选项与 ETag 失效
+    bump_dataset_version(FILTER_OPTIONS_DATASET)
@@ -6,6 +6,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.response_cache import bump_dataset_version
+
 from archaea_database.models import MAGArchaeaGTDB, UnMAGArchaeaGTDB
 from bacteria_database.models import MAGBacteriaGTDB, UnMAGBacteriaGTDB
 
@@ -155,3 +157,6 @@ def unmag_bacteria_gtdb_import():
 
 if __name__ == '__main__':
     gtdb_data_import()
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -7,6 +7,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.annotation_summary import refresh_genome_annotation_summaries
+from utils.genome_locations import refresh_genome_locations
+from utils.response_cache import bump_dataset_version
+
 from bacteria_database.models import MAGBacteria, MAGBacteriaTaxonomy, MAGBacteriaProtein, MAGBacteriaTRNA, \
     MAGBacteriaCRISPRCas, MAGBacteriaCRISPR, MAGBacteriaAntiCRISPRAnnotation, MAGBacteriaSecondaryMetaboliteRegion, \
     MAGBacteriaSignalPeptidePrediction, MAGBacteriaVirulenceFactor, MAGBacteriaAntibioticResistance, \
@@ -1122,3 +1126,14 @@ def unmag_bacteria_transmembrane_helices_import():
 
 if __name__ == '__main__':
     bacteria_data_import()
+
+    # 重算区间重叠查询使用的 location 列
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_locations('Bacteria', mag_status)
+
+    # 重算基因组详情页的注释计数
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_annotation_summaries('Bacteria', mag_status)
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -6,6 +6,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.annotation_summary import refresh_genome_annotation_summaries
+from utils.genome_locations import refresh_genome_locations
+from utils.response_cache import bump_dataset_version
+
 from fungi_database.models import MAGFungi, MAGFungiTaxonomy, MAGFungiProtein, MAGFungiTRNA, \
     MAGFungiSecondaryMetaboliteRegion, MAGFungiSignalPeptidePrediction, MAGFungiVirulenceFactor, \
     MAGFungiAntibioticResistance, MAGFungiTransmembraneHelices, MAGFungiHelices, UnMAGFungi, UnMAGFungiTaxonomy, \
@@ -865,3 +869,14 @@ def unmag_fungi_transmembrane_helices_import():
 
 if __name__ == '__main__':
     fungi_data_import()
+
+    # 重算区间重叠查询使用的 location 列
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_locations('Fungi', mag_status)
+
+    # 重算基因组详情页的注释计数
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_annotation_summaries('Fungi', mag_status)
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
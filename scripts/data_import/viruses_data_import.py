@@ -7,6 +7,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MicrobialScope_api.settings')
 
 django.setup()
 
+from utils.annotation_summary import refresh_genome_annotation_summaries
+from utils.genome_locations import refresh_genome_locations
+from utils.response_cache import bump_dataset_version
+
 from viruses_database.models import MAGViruses, MAGVirusesTaxonomy, MAGVirusesProtein, MAGVirusesTRNA, \
     MAGVirusesCRISPRCas, MAGVirusesCRISPR, MAGVirusesAntiCRISPRAnnotation, MAGVirusesVirulenceFactor, \
     MAGVirusesAntibioticResistance, MAGVirusesTransmembraneHelices, MAGVirusesHelices, UnMAGViruses, \
@@ -964,3 +968,14 @@ def unmag_viruses_transmembrane_helices_import():
 
 if __name__ == '__main__':
     viruses_data_import()
+
+    # 重算区间重叠查询使用的 location 列
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_locations('Viruses', mag_status)
+
+    # 重算基因组详情页的注释计数
+    for mag_status in ('MAG', 'unMAG'):
+        refresh_genome_annotation_summaries('Viruses', mag_status)
+
+    # 数据已变化，使表格接口的响应缓存失效
+    bump_dataset_version()
@@ -0,0 +1,162 @@
+from importlib import import_module
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from microbe_database.models import GenomeAnnotationSummary
+
+ANNOTATION_COUNT_FIELDS = (
+    'protein_count', 'trna_count', 'crispr_count', 'anti_crispr_count', 'secondary_metabolite_count',
+    'signal_peptide_count', 'virulence_factor_count', 'arg_count', 'tmh_count',
+)
+
+# Counts taken from the row_count of the large_table_api index of the per-genome TSV files
+FILE_COUNT_INDEXES = {'protein_count': 'Protein', 'arg_count': 'ARG', 'tmh_count': 'TMH'}
+
+# Counts taken from the annotation tables -> model name suffix
+TABLE_COUNT_MODELS = {
+    'trna_count': 'TRNA',
+    'crispr_count': 'CRISPR',
+    'anti_crispr_count': 'AntiCRISPRAnnotation',
+    'secondary_metabolite_count': 'SecondaryMetaboliteRegion',
+    'signal_peptide_count': 'SignalPeptidePrediction',
+    'virulence_factor_count': 'VirulenceFactor',
+}
+
+# Counts shown on the detail page of each microbe; the others stay empty
+MICROBE_COUNT_FIELDS = {
+    'Archaea': ANNOTATION_COUNT_FIELDS,
+    'Bacteria': ANNOTATION_COUNT_FIELDS,
+    'Fungi': tuple(name for name in ANNOTATION_COUNT_FIELDS if name not in ('crispr_count', 'anti_crispr_count')),
+    'Viruses': tuple(
+        name for name in ANNOTATION_COUNT_FIELDS
+        if name not in ('secondary_metabolite_count', 'signal_peptide_count', 'arg_count')
+    ),
+}
+
+
+def get_genome_model(microbe, mag_status, suffix=''):
+    models = import_module(f'{microbe.lower()}_database.models')
+    prefix = 'MAG' if mag_status == 'MAG' else 'UnMAG'
+    return getattr(models, f'{prefix}{microbe}{suffix}')
+
+
+def get_index_model(microbe, mag_status, data_type):
+    from large_table_api import models
+
+    return getattr(models, f'{microbe}{mag_status[0].upper()}{mag_status[1:]}{data_type}Index')
+
+
+def count_annotations(microbe, mag_status, name):
+    """
+    {unique_id: count} of one annotation type, or None when the source has not been built.
+    """
+    if name in FILE_COUNT_INDEXES:
+        index_model = get_index_model(microbe, mag_status, FILE_COUNT_INDEXES[name])
+        counts = dict(index_model.objects.values_list('archaea_id', 'row_count').iterator(chunk_size=10000))
+        return counts or None
+
+    model = get_genome_model(microbe, mag_status, TABLE_COUNT_MODELS[name])
+    lookup = f'{microbe.lower()}_id'
+    if name == 'crispr_count':
+        lookup = f'cas__{lookup}'
+    rows = model.objects.order_by().values(lookup).annotate(count=Count('id')).values_list(lookup, 'count')
+    return dict(rows.iterator(chunk_size=10000))
+
+
+def refresh_genome_annotation_summaries(microbe, mag_status, fields=None, batch_size=1000):
+    """
+    Recompute the GenomeAnnotationSummary rows of one microbe and MAG status with one grouped
+    query per annotation type. Only the given count fields are written (all by default);
+    rows of genomes that no longer exist are removed.
+
+    Returns:
+    int: Number of genomes summarised
+    """
+    fields = [name for name in (fields or ANNOTATION_COUNT_FIELDS) if name in MICROBE_COUNT_FIELDS[microbe]]
+    genome_ids = set(get_genome_model(microbe, mag_status).objects.values_list('unique_id', flat=True))
+    counts = {name: count_annotations(microbe, mag_status, name) for name in fields}
+
+    summaries = GenomeAnnotationSummary.objects.filter(microbe=microbe, mag_status=mag_status)
+    with transaction.atomic():
+        existing = dict(summaries.values_list('unique_id', 'id'))
+        removed = [pk for unique_id, pk in existing.items() if unique_id not in genome_ids]
+        for start in range(0, len(removed), batch_size):
+            GenomeAnnotationSummary.objects.filter(id__in=removed[start:start + batch_size]).delete()
+
+        updates = []
+        creates = []
+        # bulk_update skips auto_now, so the timestamp is set on the instances
+        now = timezone.now()
+        for unique_id in genome_ids:
+            # A source that has not been built is left empty so the detail view computes it live
+            values = {
+                name: None if counts[name] is None else counts[name].get(unique_id, 0)
+                for name in fields
+            }
+            if unique_id in existing:
+                updates.append(GenomeAnnotationSummary(id=existing[unique_id], updated_at=now, **values))
+            else:
+                creates.append(GenomeAnnotationSummary(
+                    microbe=microbe, mag_status=mag_status, unique_id=unique_id, **values
+                ))
+
+        if fields:
+            GenomeAnnotationSummary.objects.bulk_update(updates, [*fields, 'updated_at'], batch_size=batch_size)
+        GenomeAnnotationSummary.objects.bulk_create(creates, batch_size=batch_size)
+
+    return len(genome_ids)
+
+
+class AnnotationSummaryMixin:
+    """
+    Detail serializer mixin answering get_<name>_count from the GenomeAnnotationSummary row
+    of the genome, fetched with a single lookup. Genomes missing from the table, and counts
+    left empty in it, fall back to the serializer's compute_<name>_count.
+    """
+
+    summary_microbe = None
+    summary_mag_status = None
+
+    def get_annotation_summary(self, obj):
+        summaries = self.__dict__.setdefault('_annotation_summaries', {})
+        if obj.unique_id not in summaries:
+            summaries[obj.unique_id] = GenomeAnnotationSummary.objects.filter(
+                microbe=self.summary_microbe, mag_status=self.summary_mag_status, unique_id=obj.unique_id
+            ).first()
+        return summaries[obj.unique_id]
+
+    def get_annotation_count(self, obj, name):
+        summary = self.get_annotation_summary(obj)
+        count = getattr(summary, name) if summary is not None else None
+        if count is None:
+            count = getattr(self, f'compute_{name}')(obj)
+        return count
+
+    def get_protein_count(self, obj):
+        return self.get_annotation_count(obj, 'protein_count')
+
+    def get_trna_count(self, obj):
+        return self.get_annotation_count(obj, 'trna_count')
+
+    def get_crispr_count(self, obj):
+        return self.get_annotation_count(obj, 'crispr_count')
+
+    def get_anti_crispr_count(self, obj):
+        return self.get_annotation_count(obj, 'anti_crispr_count')
+
+    def get_secondary_metabolite_count(self, obj):
+        return self.get_annotation_count(obj, 'secondary_metabolite_count')
+
+    def get_signal_peptide_count(self, obj):
+        return self.get_annotation_count(obj, 'signal_peptide_count')
+
+    def get_virulence_factor_count(self, obj):
+        return self.get_annotation_count(obj, 'virulence_factor_count')
+
+    def get_arg_count(self, obj):
+        return self.get_annotation_count(obj, 'arg_count')
+
+    def get_tmh_count(self, obj):
+        return self.get_annotation_count(obj, 'tmh_count')
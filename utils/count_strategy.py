@@ -0,0 +1,64 @@
+import hashlib
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+from utils.response_cache import GLOBAL_DATASET, get_dataset_version, get_table_cache
+
+
+class TableCountStrategy:
+    """
+    Row counts for paginated table queries.
+
+    - Unfiltered queries on large tables use the PostgreSQL planner estimate
+      (pg_class.reltuples) instead of a full COUNT(*).
+    - Other counts are exact and cached in the shared table cache per query signature;
+      the cache key contains the dataset version, so data imports invalidate them.
+
+    get_count returns (count, count_is_estimate). An estimate is only a display count:
+    PrecountedPaginator does not reject pages past it.
+    """
+
+    estimate_threshold = getattr(settings, 'TABLE_COUNT_ESTIMATE_THRESHOLD', 1000000)
+
+    def get_count(self, queryset, dataset):
+        if not queryset.query.where:
+            estimate = self.get_planner_estimate(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate, True
+
+        return self.get_cached_count(queryset, dataset), False
+
+    def get_planner_estimate(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+
+        # 从未 ANALYZE 的表 reltuples 为 -1 (PostgreSQL 14+) 或 0
+        if row is None or row[0] is None or row[0] <= 0:
+            return None
+        return row[0]
+
+    def get_cached_count(self, queryset, dataset):
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        versions = f'{get_dataset_version(GLOBAL_DATASET)}.{get_dataset_version(dataset)}'
+        digest = hashlib.md5(f'{versions}|{sql}|{params!r}'.encode()).hexdigest()
+        key = f'table_count:{dataset}:{digest}'
+
+        table_cache = get_table_cache()
+        count = table_cache.get(key)
+        if count is None:
+            count = queryset.count()
+            table_cache.set(key, count, timeout=settings.TABLE_RESPONSE_CACHE_TIMEOUT)
+        return count
@@ -0,0 +1,73 @@
+import csv
+from types import SimpleNamespace
+
+from django.http import StreamingHttpResponse
+
+CSV_STREAM_BUFFER_SIZE = 64 * 1024
+
+
+class Echo:
+    """
+    File-like object whose write returns the value, so csv.writer produces lines instead of buffering them.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_value_objects(queryset, related=(), chunk_size=2000):
+    """
+    Iterate the rows of queryset as attribute objects built from values_list chunks.
+
+    On PostgreSQL, iterator() reads through a server-side cursor, so memory use does not
+    depend on the size of the result. Each name in related is a forward relation whose
+    columns are joined in and exposed as a nested object (None when there is no related row).
+    """
+    model = queryset.model
+    fields = [field.attname for field in model._meta.concrete_fields]
+    related_fields = {
+        name: [field.attname for field in model._meta.get_field(name).related_model._meta.concrete_fields]
+        for name in related
+    }
+    values = fields + [f'{name}__{attname}' for name, attnames in related_fields.items() for attname in attnames]
+
+    for row in queryset.values_list(*values).iterator(chunk_size=chunk_size):
+        obj = SimpleNamespace(**dict(zip(fields, row)))
+        offset = len(fields)
+        for name, attnames in related_fields.items():
+            related_row = dict(zip(attnames, row[offset:offset + len(attnames)]))
+            offset += len(attnames)
+            has_row = any(value is not None for value in related_row.values())
+            setattr(obj, name, SimpleNamespace(**related_row) if has_row else None)
+        yield obj
+
+
+def iter_csv_content(header, rows):
+    """
+    Encode the header and rows as CSV, yielding chunks of about CSV_STREAM_BUFFER_SIZE characters.
+    """
+    writer = csv.writer(Echo())
+    chunk = [writer.writerow(header)]
+    size = len(chunk[0])
+
+    for row in rows:
+        line = writer.writerow(row)
+        chunk.append(line)
+        size += len(line)
+        if size >= CSV_STREAM_BUFFER_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield ''.join(chunk)
+
+
+def stream_csv_response(header, rows, filename):
+    return StreamingHttpResponse(
+        iter_csv_content(header, rows),
+        content_type='text/csv',
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"'
+        }
+    )
@@ -4,48 +4,105 @@ import os
 import re
 import time
 import tarfile
-from io import BytesIO
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from large_table_api.models import *
+from utils.read_files import read_lines_by_keys
 
-def compress_and_download_files(files_paths, archive_name="files_archive"):
+TAR_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def get_tar_members(files_paths):
     """
-    将多个文件打包成tar.gz格式并提供下载
-    
+    为存在的文件生成tar成员信息(同名文件只保留第一个)
+    """
+    members = []
+    names = set()
+    for file_path in files_paths:
+        file_name = os.path.basename(file_path)
+        if file_name in names or not os.path.isfile(file_path):
+            continue
+        names.add(file_name)
+
+        stat = os.stat(file_path)
+        tarinfo = tarfile.TarInfo(name=file_name)
+        tarinfo.size = stat.st_size
+        tarinfo.mtime = int(stat.st_mtime)
+        tarinfo.mode = 0o644
+        members.append((file_path, tarinfo))
+    return members
+
+
+def get_tar_size(members):
+    """
+    未压缩tar归档的总字节数: 每个成员的头块加按512字节对齐的内容，结尾两个空块并补齐到记录大小
+    """
+    size = 0
+    for _, tarinfo in members:
+        size += len(tarinfo.tobuf(format=tarfile.GNU_FORMAT)) + -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+    size += 2 * tarfile.BLOCKSIZE
+    return -(-size // tarfile.RECORDSIZE) * tarfile.RECORDSIZE
+
+
+def iter_tar_stream(members, chunk_size=TAR_STREAM_CHUNK_SIZE):
+    """
+    逐块生成未压缩tar归档，成员内容按原样写入(.gz文件不再二次压缩)，内存占用与文件大小无关
+    """
+    written = 0
+    for file_path, tarinfo in members:
+        header = tarinfo.tobuf(format=tarfile.GNU_FORMAT)
+        written += len(header)
+        yield header
+
+        # 按头中记录的大小写入，文件在下载期间被改写时仍保证归档结构正确
+        remaining = tarinfo.size
+        with open(file_path, 'rb') as f:
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        if remaining > 0:
+            yield bytes(remaining)
+
+        padding = -tarinfo.size % tarfile.BLOCKSIZE
+        if padding:
+            yield bytes(padding)
+        written += tarinfo.size + padding
+
+    end_size = get_tar_size(members) - written
+    yield bytes(end_size)
+
+
+def stream_tar_response(files_paths, archive_name="files_archive"):
+    """
+    将多个文件以未压缩tar流式打包下载
+
     参数:
-        files_paths: 文件路径列表
+        files_paths: 文件路径列表(不存在的文件会被跳过)
         archive_name: 下载文件的名称(不含扩展名)
-    
+
     返回:
-        HttpResponse对象用于文件下载
+        StreamingHttpResponse对象用于文件下载
     """
-    # 创建临时内存缓冲区
-    buffer = BytesIO()
-    
-    # 创建tar.gz归档
-    with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
-        for file_path in files_paths:
-            if os.path.exists(file_path):
-                # 获取文件名(不含路径)
-                file_name = os.path.basename(file_path)
-                # 将文件添加到归档中
-                tar.add(file_path, arcname=file_name)
-    
-    # 将缓冲区指针移到开始位置
-    buffer.seek(0)
-    
-    # 设置响应头，提供下载
-    filename = f"{archive_name}.tar.gz"
-    response = HttpResponse(
-        buffer.getvalue(),
-        content_type='application/x-gzip',  # 使用正确的MIME类型
+    members = get_tar_members(files_paths)
+    response = StreamingHttpResponse(
+        iter_tar_stream(members),
+        content_type='application/x-tar',
         headers={
-            'Content-Disposition': f'attachment; filename="{filename}"'
+            'Content-Disposition': f'attachment; filename="{archive_name}.tar"'
         }
     )
-    
+    response['Content-Length'] = get_tar_size(members)
     return response
 
+
+def iter_data_lines(file_path):
+    """逐行读取TSV文件的数据行（跳过标题行）"""
+    with open(file_path, 'r') as f:
+        next(f)
+        yield from f
+
 def download_meta_data(filter_list, microbe, magStatus, dataType):
     """
     高性能版本：仅读取文件中必要的行
@@ -255,26 +312,26 @@ def download_meta_data(filter_list, microbe, magStatus, dataType):
                 # 创建过滤条件集合，用于快速查找
                 filter_pairs = set(filters_by_file[archaea_id])
                 
-                # 逐行读取文件并匹配
-                with open(file_path, 'r') as f:
-                    # 跳过标题行
-                    next(f)
+                # 优先通过 (contig_id, protein_id) 偏移索引直接定位所需行，索引缺失时逐行扫描
+                lines = read_lines_by_keys(file_path, filter_pairs)
+                if lines is None:
+                    lines = iter_data_lines(file_path)
+                
+                for line in lines:
+                    cols = line.strip().split('\t')
+                    
+                    if len(cols) <= max(contig_idx, protein_idx):
+                        continue
+                    
+                    # 获取关键列的值
+                    contig_id = cols[contig_idx]
+                    protein_id = cols[protein_idx]
                     
-                    for line in f:
-                        cols = line.strip().split('\t')
-                        
-                        if len(cols) <= max(contig_idx, protein_idx):
-                            continue
-                        
-                        # 获取关键列的值
-                        contig_id = cols[contig_idx]
-                        protein_id = cols[protein_idx]
-                        
-                        # 检查是否匹配
-                        if (contig_id, protein_id) in filter_pairs:
-                            # 写入CSV
-                            csv_writer.writerow(cols)
-                            row_count += 1
+                    # 检查是否匹配
+                    if (contig_id, protein_id) in filter_pairs:
+                        # 写入CSV
+                        csv_writer.writerow(cols)
+                        row_count += 1
             
             except Exception as e:
                 print(f"处理文件 {file_path} 时出错: {str(e)}")
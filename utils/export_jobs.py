@@ -0,0 +1,129 @@
+import hashlib
+import os
+import re
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from download_api.models import ExportJob
+from utils.response_cache import GLOBAL_DATASET, canonical_body, get_dataset_version
+
+EXPORT_JOB_CREATED = 'Created'
+EXPORT_JOB_RUNNING = 'Running'
+EXPORT_JOB_SUCCESS = 'Success'
+EXPORT_JOB_FAILED = 'Failed'
+
+# name -> (build, get_dataset); build(params) returns the HttpResponse of the export,
+# get_dataset(params) the dataset whose version the artifact depends on
+EXPORT_SOURCES = {}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def register_export_source(name, build, get_dataset):
+    EXPORT_SOURCES[name] = (build, get_dataset)
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'EXPORT_JOB_WORKERS', 2), thread_name_prefix='export-job'
+            )
+        return _executor
+
+
+def get_spec_hash(source, params):
+    return hashlib.sha256(canonical_body({'source': source, 'params': params}).encode()).hexdigest()
+
+
+def submit_export(source, params):
+    """
+    Return the export job of (source, params) for the current data version: a finished job
+    whose artifact still exists or a job in progress is reused, otherwise a new job is
+    queued on this process's worker pool.
+    """
+    build, get_dataset = EXPORT_SOURCES[source]
+    spec_hash = get_spec_hash(source, params)
+    data_version = f'{get_dataset_version(GLOBAL_DATASET)}.{get_dataset_version(get_dataset(params))}'
+
+    # Jobs stuck in progress longer than this belong to a worker process that has gone away
+    stale_before = timezone.now() - timedelta(seconds=getattr(settings, 'EXPORT_JOB_STALE_AFTER', 6 * 60 * 60))
+    jobs = ExportJob.objects.filter(spec_hash=spec_hash, data_version=data_version).order_by('-id')
+    for job in jobs.exclude(status=EXPORT_JOB_FAILED)[:5]:
+        if job.status == EXPORT_JOB_SUCCESS and job.artifact_path and os.path.exists(job.artifact_path):
+            return job
+        if job.status != EXPORT_JOB_SUCCESS and job.created_at >= stale_before:
+            return job
+
+    job = ExportJob.objects.create(
+        source=source, spec=params, spec_hash=spec_hash, data_version=data_version, status=EXPORT_JOB_CREATED
+    )
+    transaction.on_commit(lambda: get_executor().submit(run_export_job, job.pk))
+    return job
+
+
+def get_attachment_name(response, default):
+    match = re.search(r'filename="([^"]+)"', response.get('Content-Disposition', ''))
+    return os.path.basename(match.group(1)) if match else default
+
+
+def run_export_job(job_id):
+    """
+    Produce the artifact of a job by writing the export response to EXPORT_JOB_DIR.
+    """
+    close_old_connections()
+    job = ExportJob.objects.get(pk=job_id)
+    try:
+        job.status = EXPORT_JOB_RUNNING
+        job.save(update_fields=['status'])
+
+        build, _ = EXPORT_SOURCES[job.source]
+        response = build(job.spec)
+        if response.status_code != 200:
+            raise ValueError(f'Export returned status {response.status_code}')
+
+        os.makedirs(settings.EXPORT_JOB_DIR, exist_ok=True)
+        artifact_path = os.path.join(settings.EXPORT_JOB_DIR, f'{job.pk}_{job.spec_hash[:16]}')
+        part_path = f'{artifact_path}.part'
+        try:
+            with open(part_path, 'wb') as f:
+                for chunk in (response.streaming_content if response.streaming else [response.content]):
+                    f.write(chunk)
+        finally:
+            response.close()
+        os.replace(part_path, artifact_path)
+
+        job.file_name = get_attachment_name(response, f'export_{job.pk}')
+        job.content_type = response.get('Content-Type')
+        job.artifact_path = artifact_path
+        job.artifact_size = os.path.getsize(artifact_path)
+        job.status = EXPORT_JOB_SUCCESS
+    except Exception:
+        job.status = EXPORT_JOB_FAILED
+        job.error = traceback.format_exc()
+    finally:
+        job.finished_at = timezone.now()
+        job.save()
+        connection.close()
+
+
+def export_job_to_dict(job):
+    return {
+        'id': job.pk,
+        'status': job.status,
+        'created_at': job.created_at,
+        'finished_at': job.finished_at,
+        'file_name': job.file_name,
+        'size': job.artifact_size,
+        'status_url': reverse('export_job_status', args=[job.pk]),
+        'download_url': reverse('export_job_file', args=[job.pk]) if job.status == EXPORT_JOB_SUCCESS else None,
+    }
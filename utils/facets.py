@@ -0,0 +1,69 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import Count, F
+
+from utils.response_cache import GLOBAL_DATASET, get_dataset_version, get_table_cache
+
+FACET_VALUE = 'facet_value'
+
+
+def get_lookup_field(model, lookup):
+    """
+    Model field reached by a lookup path such as 'cas__cas_subtype'.
+    """
+    field = None
+    for part in lookup.split('__'):
+        field = model._meta.get_field(part)
+        model = field.related_model
+    return field
+
+
+class TableFacetCounter:
+    """
+    Per-value row counts of a filter field for a table query, computed with one grouped
+    query per field. Array fields are expanded with unnest so each element is counted
+    once per row. Results are cached in the shared table cache per query signature and
+    dataset versions, like TableCountStrategy.
+
+    get_counts returns [{'value': ..., 'count': ...}] ordered by count, at most limit items.
+    """
+
+    limit = getattr(settings, 'TABLE_FACET_LIMIT', 100)
+
+    def get_counts(self, queryset, lookup, dataset):
+        rows = queryset.order_by().values(**{FACET_VALUE: F(lookup)})
+        try:
+            sql, params = rows.query.sql_with_params()
+        except EmptyResultSet:
+            return []
+
+        versions = f'{get_dataset_version(GLOBAL_DATASET)}.{get_dataset_version(dataset)}'
+        digest = hashlib.md5(f'{versions}|{lookup}|{self.limit}|{sql}|{params!r}'.encode()).hexdigest()
+        key = f'table_facets:{dataset}:{digest}'
+
+        table_cache = get_table_cache()
+        counts = table_cache.get(key)
+        if counts is None:
+            if isinstance(get_lookup_field(queryset.model, lookup), ArrayField):
+                counts = self.count_array_values(queryset.db, sql, params)
+            else:
+                counts = [
+                    {'value': row[FACET_VALUE], 'count': row['count']}
+                    for row in rows.annotate(count=Count('*')).order_by('-count', FACET_VALUE)[:self.limit]
+                ]
+            table_cache.set(key, counts, timeout=settings.TABLE_RESPONSE_CACHE_TIMEOUT)
+        return counts
+
+    def count_array_values(self, using, sql, params):
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f'SELECT element, COUNT(*) AS count FROM ({sql}) AS facet_rows '
+                f'CROSS JOIN LATERAL unnest(facet_rows.{FACET_VALUE}) AS element '
+                f'GROUP BY element ORDER BY count DESC, element LIMIT %s',
+                [*params, self.limit]
+            )
+            return [{'value': value, 'count': count} for value, count in cursor.fetchall()]
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from rest_framework import relations, serializers
+
+
+class FastListSerializer:
+    """
+    Serialize rows fetched with .values() using the field representations of a ModelSerializer.
+
+    The output is the same as serializer_class(instances, many=True).data, but no model
+    instances are built and each field is read straight from the row dict.
+    SerializerMethodFields receive the row as an attribute object, so methods that only
+    read plain columns (such as the GTDB lookup of the genome serializers) work unchanged.
+    Serializers with nested serializers, dotted sources or non primary key relations
+    are not supported and raise NotImplementedError.
+    When field_names is given, only those fields are serialized.
+    """
+
+    def __init__(self, serializer_class, context=None, field_names=None):
+        self.serializer = serializer_class(context=context or {})
+        # (field_name, source, to_representation, method_field) in the serializer's field order
+        self.fields = []
+
+        for field_name, field in self.serializer.fields.items():
+            if field.write_only or (field_names is not None and field_name not in field_names):
+                continue
+            if isinstance(field, serializers.SerializerMethodField):
+                self.fields.append((field_name, None, field.to_representation, True))
+            elif isinstance(field, serializers.BaseSerializer) or '.' in field.source or field.source == '*':
+                raise NotImplementedError(f"Field '{field_name}' is not supported by FastListSerializer.")
+            elif isinstance(field, relations.RelatedField):
+                if not isinstance(field, relations.PrimaryKeyRelatedField) or field.pk_field is not None:
+                    raise NotImplementedError(f"Field '{field_name}' is not supported by FastListSerializer.")
+                # values() already returns the primary key of the related row
+                self.fields.append((field_name, field.source, None, False))
+            else:
+                self.fields.append((field_name, field.source, field.to_representation, False))
+
+    def get_value_fields(self):
+        return [source for _, source, _, method_field in self.fields if not method_field]
+
+    @staticmethod
+    def as_objects(rows):
+        return [SimpleNamespace(**row) for row in rows]
+
+    def to_representation(self, obj):
+        row = obj.__dict__
+        ret = {}
+        for field_name, source, to_representation, method_field in self.fields:
+            if method_field:
+                ret[field_name] = to_representation(obj)
+                continue
+            value = row[source]
+            ret[field_name] = value if value is None or to_representation is None else to_representation(value)
+        return ret
+
+    def serialize(self, objs):
+        return [self.to_representation(obj) for obj in objs]
+
+    def serialize_queryset(self, queryset):
+        """
+        Fetch only the serialized columns of queryset with .values() and serialize them.
+        """
+        return self.serialize(self.as_objects(queryset.values(*self.get_value_fields())))
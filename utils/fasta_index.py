@@ -0,0 +1,228 @@
+import gzip
+import os
+import re
+import struct
+from bisect import bisect_right
+
+from Bio import SeqIO, bgzf
+
+from utils.file_cache import parsed_file_cache
+
+FASTA_LINE_WIDTH = 60
+INDEXED_FASTA_FOLDER = 'fna_bgzf'
+
+REGION_RE = re.compile(r'^(?P<contig>.+):(?P<start>[\d,]+)-(?P<end>[\d,]+)$')
+
+
+def get_indexed_fasta_path(fasta_path):
+    """
+    BGZF copy of a genome FASTA, e.g. .../MAG/fna/X.fna.gz -> .../MAG/fna_bgzf/X.fna.bgz;
+    the samtools style indexes sit next to it as X.fna.bgz.fai and X.fna.bgz.gzi.
+    """
+    mag_dir = os.path.dirname(os.path.dirname(fasta_path))
+    file_name = os.path.basename(fasta_path)
+    if file_name.endswith('.gz'):
+        file_name = file_name[:-len('.gz')]
+    return os.path.join(mag_dir, INDEXED_FASTA_FOLDER, f'{file_name}.bgz')
+
+
+def parse_region(region):
+    """
+    Parse 'contig:start-end' (1-based, inclusive) or 'contig' into (contig, start, end),
+    with start 0-based and end exclusive; start and end are None for a whole contig.
+    """
+    match = REGION_RE.match(region)
+    if not match:
+        return region, None, None
+
+    start = int(match.group('start').replace(',', ''))
+    end = int(match.group('end').replace(',', ''))
+    if start < 1 or end < start:
+        raise ValueError(f"Invalid region '{region}': start must be >= 1 and end >= start.")
+    return match.group('contig'), start - 1, end
+
+
+def write_fasta_record(writer, header, sequence, offset, line_width):
+    """
+    Write one record with fixed-width sequence lines and return (fai row, new offset).
+    """
+    writer.write(header + b'\n')
+    sequence_offset = offset + len(header) + 1
+
+    written = 0
+    for start in range(0, len(sequence), line_width):
+        line = sequence[start:start + line_width]
+        writer.write(line + b'\n')
+        written += len(line) + 1
+
+    name = header[1:].split(maxsplit=1)[0].decode() if len(header) > 1 else ''
+    fai_row = (name, len(sequence), sequence_offset, line_width, line_width + 1)
+    return fai_row, sequence_offset + written
+
+
+def build_indexed_fasta(source_path, target_path, line_width=FASTA_LINE_WIDTH):
+    """
+    Rewrite a gzipped FASTA as BGZF with fixed-width lines and write its .fai and .gzi
+    indexes. All files are written next to their targets and moved into place at the end.
+
+    Returns:
+    int: Number of contigs
+    """
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    part_path = f'{target_path}.part'
+
+    fai_rows = []
+    offset = 0
+    with gzip.open(source_path, 'rb') as source, bgzf.BgzfWriter(part_path, 'wb') as writer:
+        header = None
+        pieces = []
+        for line in source:
+            line = line.strip()
+            if line.startswith(b'>'):
+                if header is not None:
+                    fai_row, offset = write_fasta_record(writer, header, b''.join(pieces), offset, line_width)
+                    fai_rows.append(fai_row)
+                header = line
+                pieces = []
+            elif line:
+                pieces.append(line)
+
+        if header is not None:
+            fai_row, offset = write_fasta_record(writer, header, b''.join(pieces), offset, line_width)
+            fai_rows.append(fai_row)
+
+    # Every block after the first: (compressed offset, uncompressed offset), as bgzip -i writes
+    with open(part_path, 'rb') as handle:
+        gzi_rows = [
+            (block_start, data_start)
+            for block_start, _, data_start, data_length in bgzf.BgzfBlocks(handle)
+            if block_start > 0 and data_length > 0
+        ]
+
+    with open(f'{target_path}.fai.part', 'w') as fai:
+        for row in fai_rows:
+            fai.write('\t'.join(str(value) for value in row) + '\n')
+    with open(f'{target_path}.gzi.part', 'wb') as gzi:
+        gzi.write(struct.pack('<Q', len(gzi_rows)))
+        for row in gzi_rows:
+            gzi.write(struct.pack('<QQ', *row))
+
+    os.replace(f'{target_path}.fai.part', f'{target_path}.fai')
+    os.replace(f'{target_path}.gzi.part', f'{target_path}.gzi')
+    os.replace(part_path, target_path)
+    return len(fai_rows)
+
+
+def read_fai_file(fai_path):
+    contigs = {}
+    with open(fai_path) as fai:
+        for line in fai:
+            name, length, offset, line_bases, line_width = line.rstrip('\n').split('\t')[:5]
+            contigs[name] = (int(length), int(offset), int(line_bases), int(line_width))
+    return contigs
+
+
+def read_gzi_file(gzi_path):
+    with open(gzi_path, 'rb') as gzi:
+        count, = struct.unpack('<Q', gzi.read(8))
+        values = struct.unpack(f'<{count * 2}Q', gzi.read(count * 16))
+    # The first block starts at offset 0 in both files and is not stored
+    return [(0, 0)] + list(zip(values[0::2], values[1::2]))
+
+
+class IndexedFasta:
+    """
+    Random access to a BGZF FASTA through its .fai and .gzi indexes: a slice only
+    decompresses the blocks that hold it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fai = parsed_file_cache.get(read_fai_file, f'{path}.fai')
+        self.blocks = parsed_file_cache.get(read_gzi_file, f'{path}.gzi')
+        self.block_starts = [data_start for _, data_start in self.blocks]
+
+    def contigs(self):
+        return [{'contig': name, 'length': entry[0]} for name, entry in self.fai.items()]
+
+    def get_length(self, contig):
+        return self.fai[contig][0]
+
+    def get_virtual_offset(self, position):
+        block = bisect_right(self.block_starts, position) - 1
+        block_start, data_start = self.blocks[block]
+        return bgzf.make_virtual_offset(block_start, position - data_start)
+
+    def fetch(self, contig, start, end):
+        length, offset, line_bases, line_width = self.fai[contig]
+        end = min(end, length)
+        if start >= end:
+            return ''
+
+        data_start = offset + (start // line_bases) * line_width + start % line_bases
+        last = end - 1
+        data_end = offset + (last // line_bases) * line_width + last % line_bases + 1
+
+        with bgzf.BgzfReader(self.path, 'rb') as reader:
+            reader.seek(self.get_virtual_offset(data_start))
+            data = reader.read(data_end - data_start)
+        return data.replace(b'\n', b'').replace(b'\r', b'').decode()
+
+
+class PlainFasta:
+    """
+    Same interface as IndexedFasta for a genome whose BGZF copy has not been built yet;
+    the gzipped FASTA is parsed from the start.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def records(self):
+        with gzip.open(self.path, 'rt') as handle:
+            yield from SeqIO.parse(handle, 'fasta')
+
+    def contigs(self):
+        return [{'contig': record.id, 'length': len(record.seq)} for record in self.records()]
+
+    def get_length(self, contig):
+        return len(self.get_record(contig).seq)
+
+    def get_record(self, contig):
+        for record in self.records():
+            if record.id == contig:
+                return record
+        raise KeyError(contig)
+
+    def fetch(self, contig, start, end):
+        return str(self.get_record(contig).seq[start:end])
+
+
+def is_indexed_fasta_current(fasta_path):
+    """
+    Whether the BGZF copy of a genome FASTA and both of its indexes exist and are not
+    older than the source FASTA, so they hold the same sequence.
+    """
+    indexed_path = get_indexed_fasta_path(fasta_path)
+    try:
+        indexed_mtime = min(
+            os.path.getmtime(path) for path in (indexed_path, f'{indexed_path}.fai', f'{indexed_path}.gzi')
+        )
+    except OSError:
+        return False
+
+    try:
+        return indexed_mtime >= os.path.getmtime(fasta_path)
+    except OSError:
+        # Only the BGZF copy is left
+        return True
+
+
+def open_genome_fasta(fasta_path):
+    """
+    Indexed reader of a genome FASTA; a missing or outdated BGZF copy (rebuilt by
+    build_IndexedFASTA) falls back to parsing the source FASTA.
+    """
+    if is_indexed_fasta_current(fasta_path):
+        return IndexedFasta(get_indexed_fasta_path(fasta_path))
+    return PlainFasta(fasta_path)
@@ -0,0 +1,147 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from itertools import islice
+
+from django.conf import settings
+
+# Items of a container measured by estimate_size before scaling to its length
+SIZE_SAMPLE = 16
+SIZE_MAX_DEPTH = 6
+
+
+def estimate_size(value, depth=0, seen=None):
+    """
+    Approximate memory footprint of a parsed value in bytes: sys.getsizeof of the value
+    and, recursively, of its contents, counting shared objects (such as the column name
+    keys of row dicts) once. Containers are measured on up to SIZE_SAMPLE evenly spaced
+    items and scaled to their length, so large files are sized in constant time per level.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if depth >= SIZE_MAX_DEPTH or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+
+    if isinstance(value, dict):
+        count = len(value)
+        sample = list(islice(value.items(), SIZE_SAMPLE))
+        measured = sum(
+            estimate_size(key, depth + 1, seen) + estimate_size(item, depth + 1, seen) for key, item in sample
+        )
+    elif isinstance(value, (list, tuple)):
+        count = len(value)
+        step = max(count // SIZE_SAMPLE, 1)
+        sample = value[::step][:SIZE_SAMPLE]
+        measured = sum(estimate_size(item, depth + 1, seen) for item in sample)
+    elif isinstance(value, (set, frozenset)):
+        count = len(value)
+        sample = list(islice(value, SIZE_SAMPLE))
+        measured = sum(estimate_size(item, depth + 1, seen) for item in sample)
+    else:
+        return size
+
+    if not sample:
+        return size
+    return size + measured * count // len(sample)
+
+
+class ParsedFileCache:
+    """
+    Process-wide LRU cache of parsed TSV files.
+
+    Entries are keyed by (reader, path) and remember the file's mtime, so a rewritten
+    file is parsed again. Each entry is charged the estimated in-memory size of the parsed
+    value (estimate_size), which for row dicts is several times the file size; the total
+    is bounded by max_bytes and values larger than max_entry_bytes are not cached.
+    Cached rows are shared between requests and must not be modified by callers.
+    """
+
+    def __init__(self, max_bytes, max_entry_bytes):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_if_cached(self, read_file, tsv_file_path):
+        """
+        Return the cached rows of the file, or None without parsing when it is not cached.
+        """
+        try:
+            mtime = os.path.getmtime(tsv_file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get((read_file, tsv_file_path))
+            if entry is None or entry[0] != mtime:
+                return None
+            self._entries.move_to_end((read_file, tsv_file_path))
+            self.hits += 1
+            return entry[2]
+
+    def get(self, read_file, tsv_file_path):
+        """
+        Return read_file(tsv_file_path), parsing the file only when it is not cached
+        or has changed since it was cached.
+        """
+        stat = os.stat(tsv_file_path)
+        key = (read_file, tsv_file_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        rows = read_file(tsv_file_path)
+        size = estimate_size(rows)
+        if size > self.max_entry_bytes:
+            return rows
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.current_bytes -= old_entry[1]
+
+            self._entries[key] = (stat.st_mtime, size, rows)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= size
+                self.evictions += 1
+
+        return rows
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+parsed_file_cache = ParsedFileCache(
+    max_bytes=getattr(settings, 'PARSED_FILE_CACHE_MAX_BYTES', 256 * 1024 * 1024),
+    max_entry_bytes=getattr(settings, 'PARSED_FILE_CACHE_MAX_ENTRY_BYTES', 16 * 1024 * 1024),
+)
@@ -0,0 +1,174 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from MicrobialScope_api.constant import MEDIA_DATA_DIR
+
+# file_type -> (folder, extension) of the per-genome files under MEDIA_DATA_DIR
+GENOME_FILE_TYPES = {
+    'fasta': ('fna', 'fna.gz'),
+    'gbk': ('gbk', 'gbk.gz'),
+    'gff3': ('gff', 'gff.gz'),
+}
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def get_genome_file_path(microbe_dir, mag_dir, unique_id, file_type):
+    """
+    Path and file name of a genome file, e.g. ('Archaea', 'MAG', 'GCA_000007185.1', 'fasta').
+    """
+    folder, extension = GENOME_FILE_TYPES[file_type]
+    file_name = f'{unique_id}.{extension}'
+    return os.path.join(MEDIA_DATA_DIR, microbe_dir, mag_dir, folder, file_name), file_name
+
+
+class FileRange:
+    """
+    Read-only view of bytes [start, start + length) of an open file.
+
+    fileno() is exposed so WSGI servers that support wsgi.file_wrapper (gunicorn) send the
+    range with os.sendfile, starting at the current file offset for Content-Length bytes.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def get_etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range(header, size):
+    """
+    (start, end) of a single 'bytes=' range, None when the header should be ignored, or
+    False when the range cannot be satisfied. Multiple ranges are answered with the whole file.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    start, end = match.groups()
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def is_range_current(request, stat):
+    """
+    If-Range holds an ETag or a date; the range only applies if the file has not changed since.
+    """
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        return if_range == get_etag(stat)
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(stat.st_mtime) <= since
+
+
+def get_internal_location(file_path):
+    for directory, location in getattr(settings, 'FILE_SERVING_INTERNAL_LOCATIONS', {}).items():
+        directory = os.path.join(directory, '')
+        if file_path.startswith(directory):
+            return location.rstrip('/') + '/' + quote(file_path[len(directory):])
+    return None
+
+
+def set_file_headers(response, stat, filename, as_attachment):
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['ETag'] = get_etag(stat)
+    response['Accept-Ranges'] = 'bytes'
+    if filename:
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    return response
+
+
+def get_content_type(filename):
+    content_type, encoding = mimetypes.guess_type(filename)
+    return {
+        'bzip2': 'application/x-bzip',
+        'gzip': 'application/gzip',
+        'xz': 'application/x-xz',
+    }.get(encoding, content_type or 'application/octet-stream')
+
+
+def serve_file(request, file_path, filename=None, as_attachment=True, content_type=None):
+    """
+    Response sending the file at file_path, or None if it does not exist.
+
+    With FILE_SERVING_BACKEND 'x-accel-redirect' or 'x-sendfile' the transfer (including
+    Range requests) is handed to the front proxy. Otherwise a single 'bytes=' Range is
+    answered with 206, and the body is a file object so the WSGI server can use os.sendfile.
+    """
+    try:
+        stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    filename = filename or os.path.basename(file_path)
+    content_type = content_type or get_content_type(filename)
+    backend = getattr(settings, 'FILE_SERVING_BACKEND', 'django')
+
+    if backend == 'x-accel-redirect':
+        location = get_internal_location(file_path)
+        if location is not None:
+            response = HttpResponse(content_type=content_type)
+            response['X-Accel-Redirect'] = location
+            return set_file_headers(response, stat, filename, as_attachment)
+    elif backend == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = file_path
+        return set_file_headers(response, stat, filename, as_attachment)
+
+    size = stat.st_size
+    byte_range = None
+    range_header = request.headers.get('Range') if request is not None else None
+    if range_header and is_range_current(request, stat):
+        byte_range = parse_range(range_header, size)
+        if byte_range is False:
+            response = HttpResponse(status=416, content_type=content_type)
+            response['Content-Range'] = f'bytes */{size}'
+            return set_file_headers(response, stat, None, as_attachment)
+
+    if byte_range is None:
+        response = FileResponse(open(file_path, 'rb'), content_type=content_type)
+        response['Content-Length'] = size
+    else:
+        start, end = byte_range
+        response = FileResponse(FileRange(open(file_path, 'rb'), start, end - start + 1), content_type=content_type)
+        response.status_code = 206
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+
+    return set_file_headers(response, stat, filename, as_attachment)
@@ -0,0 +1,71 @@
+import hashlib
+import threading
+
+from microbe_database.models import MicrobeFilterOptionsNew
+from utils.response_cache import GLOBAL_DATASET, get_dataset_version
+
+FILTER_OPTIONS_DATASET = MicrobeFilterOptionsNew._meta.label_lower
+
+
+class FilterOptionsCache:
+    """
+    Per-process cache of every MicrobeFilterOptionsNew value.
+
+    All rows are loaded with one query and kept until the dataset version of
+    MicrobeFilterOptionsNew (shared between processes through the table cache) changes,
+    which the filter import scripts bump after writing new values.
+    Built bundles are cached with the same lifetime.
+    """
+
+    def __init__(self):
+        self._version = None
+        self._options = {}
+        self._bundles = {}
+        self._lock = threading.Lock()
+
+    def get_version(self):
+        return f'{get_dataset_version(GLOBAL_DATASET)}.{get_dataset_version(FILTER_OPTIONS_DATASET)}'
+
+    def _refresh(self):
+        version = self.get_version()
+        with self._lock:
+            if version != self._version:
+                self._options = dict(MicrobeFilterOptionsNew.objects.values_list('key', 'value'))
+                self._bundles = {}
+                self._version = version
+            return version
+
+    def get(self, key):
+        """
+        Value of one option set; raises MicrobeFilterOptionsNew.DoesNotExist like objects.get(key=...).
+        """
+        self._refresh()
+        try:
+            return self._options[key]
+        except KeyError:
+            raise MicrobeFilterOptionsNew.DoesNotExist(f"MicrobeFilterOptionsNew matching key '{key}' does not exist.")
+
+    def get_bundle(self, name, build):
+        """
+        Return (etag, payload) of the bundle called name, calling build() only when the
+        bundle has not been built for the current version.
+        """
+        version = self._refresh()
+        etag = f'"{hashlib.md5(f"{name}|{version}".encode()).hexdigest()}"'
+
+        with self._lock:
+            payload = self._bundles.get(name)
+        if payload is None:
+            payload = build()
+            with self._lock:
+                if self._version == version:
+                    self._bundles[name] = payload
+
+        return etag, payload
+
+
+filter_options_cache = FilterOptionsCache()
+
+
+def get_filter_option(key):
+    return filter_options_cache.get(key)
@@ -0,0 +1,129 @@
+from django.contrib.postgres.fields import BigIntegerRangeField
+from django.db.backends.postgresql.psycopg_any import NumericRange
+from django.db.models import F, Func, Max, Min, OuterRef, Q, Subquery
+from django.db.models.functions import Greatest, Least
+
+from utils.annotation_summary import get_genome_model
+
+# Annotation type (as in the genome bundle panels) -> (model name suffix, name field, start field, end field).
+# Types without start and end fields are located by their protein in the Protein table.
+LOCATION_TYPES = {
+    'proteins': ('Protein', 'protein_id', 'start', 'end'),
+    'tRNAs': ('TRNA', 'trna_id', 'start', 'end'),
+    'crispr': ('CRISPRCas', 'cas_id', 'cas_start', 'cas_end'),
+    'crispr_arrays': ('CRISPR', 'crispr_id', 'crispr_start', 'crispr_end'),
+    'anti_crispr': ('AntiCRISPRAnnotation', 'protein_id', 'start', 'end'),
+    'secondary_metabolites': ('SecondaryMetaboliteRegion', 'region', 'start', 'end'),
+    'signal_peptides': ('SignalPeptidePrediction', 'protein_id', None, None),
+    'virulence_factors': ('VirulenceFactor', 'protein_id', None, None),
+    'antibiotic_resistance': ('AntibioticResistance', 'protein_id', None, None),
+    'transmembrane_helices': ('TransmembraneHelices', 'protein_id', None, None),
+}
+
+
+def get_location_model(microbe, mag_status, location_type):
+    """
+    Model of an annotation type, or None when the microbe has no such annotation.
+    """
+    try:
+        return get_genome_model(microbe, mag_status, LOCATION_TYPES[location_type][0])
+    except AttributeError:
+        return None
+
+
+def get_location_types(microbe, mag_status):
+    return [name for name in LOCATION_TYPES if get_location_model(microbe, mag_status, name) is not None]
+
+
+def get_genome_prefix(location_type):
+    # CRISPR arrays reach the genome id and contig through their Cas locus
+    return 'cas__' if location_type == 'crispr_arrays' else ''
+
+
+def get_location_expression(start_field, end_field):
+    """
+    int8range covering [start, end] (1-based, inclusive), whichever way round the two are stored.
+    """
+    return Func(
+        Least(F(start_field), F(end_field)), Greatest(F(start_field), F(end_field)) + 1,
+        function='int8range', output_field=BigIntegerRangeField(),
+    )
+
+
+def fill_locations(queryset, location, batch_size):
+    """
+    Set location on every row of queryset, batch_size primary keys per UPDATE.
+
+    Returns:
+    int: Number of rows updated
+    """
+    bounds = queryset.aggregate(first=Min('pk'), last=Max('pk'))
+    first, last = bounds['first'], bounds['last']
+    if first is None:
+        return 0
+
+    updated = 0
+    for start in range(first, last + 1, batch_size):
+        updated += queryset.filter(pk__gte=start, pk__lt=start + batch_size).update(location=location)
+    return updated
+
+
+def refresh_genome_locations(microbe, mag_status, batch_size=100000):
+    """
+    Recompute the location range columns of every annotation type of one microbe and MAG status.
+    Proteins are filled first, since the protein-located types copy their range.
+
+    Returns:
+    dict: {annotation type: number of rows updated}
+    """
+    id_field = f'{microbe.lower()}_id'
+    protein_model = get_genome_model(microbe, mag_status, 'Protein')
+
+    results = {}
+    for location_type in get_location_types(microbe, mag_status):
+        model = get_location_model(microbe, mag_status, location_type)
+        _, _, start_field, end_field = LOCATION_TYPES[location_type]
+
+        queryset = model.objects.all()
+        if start_field is not None:
+            # LEAST / GREATEST skip NULLs, rows missing a coordinate get no location
+            missing = Q(**{f'{start_field}__isnull': True}) | Q(**{f'{end_field}__isnull': True})
+            model.objects.filter(missing).update(location=None)
+            queryset = queryset.exclude(missing)
+            location = get_location_expression(start_field, end_field)
+        else:
+            location = Subquery(
+                protein_model.objects.filter(**{
+                    id_field: OuterRef(id_field), 'protein_id': OuterRef('protein_id'),
+                }).values('location')[:1]
+            )
+        results[location_type] = fill_locations(queryset, location, batch_size)
+    return results
+
+
+def query_overlaps(microbe, mag_status, location_type, unique_id, contig, start, end, within=False, limit=1000):
+    """
+    Annotations of one type on a contig of a genome that overlap [start, end] (1-based, inclusive;
+    end None for the rest of the contig), or lie entirely inside it when within is set, in genome order. Answered from the GiST index
+    on (genome id, contig_id, location).
+
+    Returns:
+    tuple: (list of {'id', 'name', 'contig', 'start', 'end'}, whether more than limit matched)
+    """
+    model = get_location_model(microbe, mag_status, location_type)
+    _, name_field, _, _ = LOCATION_TYPES[location_type]
+    prefix = get_genome_prefix(location_type)
+    lookup = 'contained_by' if within else 'overlap'
+
+    rows = list(
+        model.objects.filter(**{
+            f'{prefix}{microbe.lower()}_id': unique_id,
+            f'{prefix}contig_id': contig,
+            f'location__{lookup}': NumericRange(start, None if end is None else end + 1),
+        }).order_by('location', 'id').values_list('id', name_field, 'location')[:limit + 1]
+    )
+    results = [
+        {'id': pk, 'name': name, 'contig': contig, 'start': location.lower, 'end': location.upper - 1}
+        for pk, name, location in rows[:limit]
+    ]
+    return results, len(rows) > limit
@@ -0,0 +1,334 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import traceback
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from MicrobialScope_api.constant import MEDIA_DATA_DIR, NEW_MEDIA_DATA_DIR
+from utils.annotation_summary import get_genome_model
+from utils.fasta_index import open_genome_fasta
+from utils.file_cache import parsed_file_cache
+from utils.read_files import iter_tsv_rows
+from utils.response_cache import GLOBAL_DATASET, get_dataset_version
+
+TRACKS = ('proteins', 'tRNAs', 'crispr', 'secondary_metabolites', 'tmh_proteins')
+
+TRACK_FILE_VERSION = 1
+BASE_BIN_SIZE = 1000
+BIN_SIZE_FACTOR = 4
+
+# path -> lock serializing the builds of one track file within the process
+_build_locks = defaultdict(threading.Lock)
+_build_locks_lock = threading.Lock()
+
+# Background builds of missing or stale track files, at most one pending build per path
+_executor = None
+_executor_lock = threading.Lock()
+_pending_builds = set()
+
+
+def get_track_max_bins():
+    return getattr(settings, 'GENOME_TRACK_MAX_BINS', 500)
+
+
+def get_track_file_path(microbe, mag_status, unique_id):
+    return os.path.join(settings.GENOME_TRACK_DIR, microbe, mag_status, f'{unique_id}.json.gz')
+
+
+def get_track_sources(microbe, mag_status, unique_id):
+    """
+    Per-genome files a track file is built from; the annotation tables are covered by the data version.
+    """
+    return {
+        'proteins': os.path.join(NEW_MEDIA_DATA_DIR, microbe, mag_status, 'proteins', f'{unique_id}.tsv'),
+        'tmhs': os.path.join(NEW_MEDIA_DATA_DIR, microbe, mag_status, 'tmhs', f'{unique_id}.tsv'),
+        'fna': os.path.join(MEDIA_DATA_DIR, microbe, mag_status, 'fna', f'{unique_id}.fna.gz'),
+    }
+
+
+def get_build_lock(path):
+    with _build_locks_lock:
+        return _build_locks[path]
+
+
+def get_bin_sizes(length):
+    """
+    Bin sizes of one contig, from BASE_BIN_SIZE up to the first size that covers the
+    contig in at most GENOME_TRACK_MAX_BINS bins, so any window fits in one of them.
+    """
+    sizes = [BASE_BIN_SIZE]
+    while -(-length // sizes[-1]) > get_track_max_bins():
+        sizes.append(sizes[-1] * BIN_SIZE_FACTOR)
+    return sizes
+
+
+def count_bins(features, length, bin_size):
+    """
+    Number of features overlapping each bin; features are 1-based inclusive (start, end, ...).
+    """
+    bin_count = max(-(-length // bin_size), 1)
+    changes = [0] * (bin_count + 1)
+    for start, end, *_ in features:
+        first = min((start - 1) // bin_size, bin_count - 1)
+        last = min((end - 1) // bin_size, bin_count - 1)
+        changes[first] += 1
+        changes[last + 1] -= 1
+    return list(accumulate(changes[:-1]))
+
+
+def collect_features(microbe, mag_status, unique_id):
+    """
+    {track: {contig: [(start, end, strand, name)]}} of one genome, read from the per-genome
+    protein and TMH TSVs and the tRNA, CRISPR and secondary metabolite tables.
+    """
+    tracks = {name: defaultdict(list) for name in TRACKS}
+
+    def add(track, contig, start, end, strand, name):
+        if start is None or end is None:
+            return
+        start, end = sorted((int(start), int(end)))
+        tracks[track][contig].append((max(start, 1), end, strand, name))
+
+    sources = get_track_sources(microbe, mag_status, unique_id)
+    proteins = {}
+    protein_file = sources['proteins']
+    if os.path.exists(protein_file):
+        for _, row in iter_tsv_rows(protein_file):
+            strand = 0 if row[6] == '+' else 1
+            add('proteins', row[1], row[4], row[5], strand, row[2])
+            proteins[(row[1], row[2])] = (row[4], row[5], strand)
+
+    # Helix positions in the TMH file are residues of the protein; proteins are placed by their genome coordinates
+    tmh_file = sources['tmhs']
+    if os.path.exists(tmh_file):
+        seen = set()
+        for _, row in iter_tsv_rows(tmh_file):
+            key = (row[1], row[2])
+            if key in proteins and key not in seen:
+                seen.add(key)
+                add('tmh_proteins', row[1], *proteins[key], row[2])
+
+    id_field = f'{microbe.lower()}_id'
+    trna_model = get_genome_model(microbe, mag_status, 'TRNA')
+    for contig, start, end, strand, trna_type in trna_model.objects.filter(**{id_field: unique_id}).values_list(
+            'contig_id', 'start', 'end', 'strand', 'trna_type'):
+        add('tRNAs', contig, start, end, strand, trna_type)
+
+    try:
+        crispr_model = get_genome_model(microbe, mag_status, 'CRISPR')
+    except AttributeError:
+        crispr_model = None
+    if crispr_model is not None:
+        for contig, start, end, crispr_id in crispr_model.objects.filter(
+                **{f'cas__{id_field}': unique_id}).values_list('cas__contig_id', 'crispr_start', 'crispr_end', 'crispr_id'):
+            add('crispr', contig, start, end, None, crispr_id)
+
+    try:
+        region_model = get_genome_model(microbe, mag_status, 'SecondaryMetaboliteRegion')
+    except AttributeError:
+        region_model = None
+    if region_model is not None:
+        for contig, start, end, region in region_model.objects.filter(**{id_field: unique_id}).values_list(
+                'contig_id', 'start', 'end', 'region'):
+            add('secondary_metabolites', contig, start, end, None, region)
+
+    return tracks
+
+
+def build_genome_tracks(microbe, mag_status, unique_id):
+    """
+    Features and binned feature counts of every track of one genome, per contig.
+    Contig lengths come from the genome FASTA, or from the last feature when it is missing.
+    """
+    # Read before the tables, so changes made during the build leave the file stale
+    data_version = get_dataset_version(GLOBAL_DATASET)
+    tracks = collect_features(microbe, mag_status, unique_id)
+
+    contigs = {}
+    fasta_path = get_track_sources(microbe, mag_status, unique_id)['fna']
+    if os.path.exists(fasta_path):
+        contigs = {contig['contig']: contig['length'] for contig in open_genome_fasta(fasta_path).contigs()}
+    for features_by_contig in tracks.values():
+        for contig, features in features_by_contig.items():
+            contigs[contig] = max(contigs.get(contig, 0), max(end for _, end, _, _ in features))
+
+    bin_sizes = {contig: get_bin_sizes(length) for contig, length in contigs.items()}
+    data = {'version': TRACK_FILE_VERSION, 'data_version': data_version, 'contigs': contigs, 'bin_sizes': bin_sizes, 'tracks': {}}
+    for track, features_by_contig in tracks.items():
+        data['tracks'][track] = {}
+        for contig, features in features_by_contig.items():
+            features.sort(key=lambda feature: (feature[0], feature[1]))
+            data['tracks'][track][contig] = {
+                'features': features,
+                'max_span': max(end - start + 1 for start, end, _, _ in features),
+                'bins': {
+                    str(bin_size): count_bins(features, contigs[contig], bin_size)
+                    for bin_size in bin_sizes[contig]
+                },
+            }
+    return data
+
+
+def write_genome_tracks(microbe, mag_status, unique_id):
+    """
+    Build the track file of a genome. Each writer uses its own temporary file in the target
+    directory, so concurrent builds (other threads or processes) never share a file and
+    os.replace only ever publishes a complete one.
+    """
+    path = get_track_file_path(microbe, mag_status, unique_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    data = build_genome_tracks(microbe, mag_status, unique_id)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'{unique_id}.', suffix='.part', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as raw_file, gzip.open(raw_file, 'wt') as track_file:
+            json.dump(data, track_file, separators=(',', ':'))
+        # mkstemp creates the file readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def read_track_file(path):
+    with gzip.open(path, 'rt') as track_file:
+        data = json.load(track_file)
+    # Feature starts for bisecting, built once per cached file
+    for features_by_contig in data['tracks'].values():
+        for entry in features_by_contig.values():
+            entry['starts'] = [feature[0] for feature in entry['features']]
+    return data
+
+
+def is_track_file_current(microbe, mag_status, unique_id, data):
+    """
+    Whether the parsed track file of a genome is newer than its source files and was
+    built from the current data version of the annotation tables.
+    """
+    if data.get('version') != TRACK_FILE_VERSION or data.get('data_version') != get_dataset_version(GLOBAL_DATASET):
+        return False
+
+    track_mtime = os.path.getmtime(get_track_file_path(microbe, mag_status, unique_id))
+    for source_path in get_track_sources(microbe, mag_status, unique_id).values():
+        try:
+            if os.path.getmtime(source_path) > track_mtime:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'GENOME_TRACK_BUILD_WORKERS', 1), thread_name_prefix='genome-tracks'
+            )
+        return _executor
+
+
+def run_track_build(microbe, mag_status, unique_id):
+    path = get_track_file_path(microbe, mag_status, unique_id)
+    close_old_connections()
+    try:
+        with get_build_lock(path):
+            write_genome_tracks(microbe, mag_status, unique_id)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        with _executor_lock:
+            _pending_builds.discard(path)
+        connection.close()
+
+
+def schedule_genome_tracks(microbe, mag_status, unique_id):
+    """
+    Queue a background build of a genome's track file unless one is already pending.
+    """
+    path = get_track_file_path(microbe, mag_status, unique_id)
+    with _executor_lock:
+        if path in _pending_builds:
+            return
+        _pending_builds.add(path)
+    get_executor().submit(run_track_build, microbe, mag_status, unique_id)
+
+
+def get_genome_tracks(microbe, mag_status, unique_id):
+    """
+    Track data of a genome, or None when its track file has not been built yet.
+
+    Missing track files and files older than their sources or the data version are
+    rebuilt in the background; a stale file keeps being served until it is replaced.
+    """
+    path = get_track_file_path(microbe, mag_status, unique_id)
+    try:
+        data = parsed_file_cache.get(read_track_file, path)
+    except FileNotFoundError:
+        data = None
+
+    if data is None or not is_track_file_current(microbe, mag_status, unique_id, data):
+        schedule_genome_tracks(microbe, mag_status, unique_id)
+    return data
+
+
+def get_window_features(entry, start, end):
+    """
+    Features overlapping [start, end] (1-based, inclusive).
+    """
+    if entry is None:
+        return []
+    first = bisect_left(entry['starts'], start - entry['max_span'] + 1)
+    last = bisect_right(entry['starts'], end)
+    return [feature for feature in entry['features'][first:last] if feature[1] >= start]
+
+
+def get_window_density(entry, bin_sizes, start, end):
+    """
+    Bins of the smallest built bin size that covers [start, end] in at most GENOME_TRACK_MAX_BINS bins.
+    """
+    for bin_size in bin_sizes:
+        first = (start - 1) // bin_size
+        last = (end - 1) // bin_size
+        if last - first + 1 <= get_track_max_bins():
+            break
+
+    bins = entry['bins'][str(bin_size)][first:last + 1] if entry is not None else [0] * (last - first + 1)
+    return {
+        'mode': 'density',
+        'bin_size': bin_size,
+        'start': first * bin_size + 1,
+        'bins': bins,
+        'max': max(bins, default=0),
+    }
+
+
+def query_track(data, track, contig, start, end, density=False):
+    """
+    Window [start, end] (1-based, inclusive) of one track: the features themselves for
+    narrow windows, otherwise binned counts, so the response size is bounded either way.
+    """
+    entry = data['tracks'].get(track, {}).get(contig)
+
+    if not density and end - start + 1 <= getattr(settings, 'GENOME_TRACK_FEATURE_MAX_WINDOW', 100000):
+        features = get_window_features(entry, start, end)
+        if len(features) <= getattr(settings, 'GENOME_TRACK_MAX_FEATURES', 1000):
+            return {
+                'mode': 'features',
+                'features': [
+                    {'start': feature_start, 'end': feature_end, 'strand': strand, 'name': name}
+                    for feature_start, feature_end, strand, name in features
+                ],
+            }
+
+    return get_window_density(entry, data['bin_sizes'][contig], start, end)
@@ -1,5 +1,12 @@
+import base64
 import contextlib
+import json
 
+from django.core.paginator import EmptyPage, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Field, Func, Q, Value
+from django.db.models.lookups import GreaterThan, LessThan
 from rest_framework.pagination import PageNumberPagination
 
 
@@ -15,12 +22,63 @@ def _positive_int(integer_string, strict=False, cutoff=None):
     return ret
 
 
+class PrecountedPaginator(Paginator):
+    """
+    Django paginator that uses a count computed beforehand instead of running COUNT(*) itself.
+
+    When the count is an estimate, any page number is read rather than validated against it,
+    so a low estimate does not hide the tail of the table. Each page reads one extra row:
+    a short page gives the exact count, a full page raises the count to at least the rows seen.
+    """
+
+    def __init__(self, object_list, per_page, count=None, count_is_estimate=False, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_is_estimate = count is not None and count_is_estimate
+        if count is not None:
+            self.__dict__['count'] = count
+
+    def set_count(self, count, count_is_estimate):
+        self.__dict__['count'] = count
+        self.__dict__.pop('num_pages', None)
+        self.count_is_estimate = count_is_estimate
+
+    def validate_number(self, number):
+        if not self.count_is_estimate:
+            return super().validate_number(number)
+
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # 超出估计页数的页码照常读取，小于 1 的页码仍然无效
+            if int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        if not self.count_is_estimate:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if len(rows) > self.per_page:
+            self.set_count(max(self.count, bottom + len(rows)), True)
+        elif rows or number == 1:
+            self.set_count(bottom + len(rows), False)
+        return self._get_page(rows[:self.per_page], number, self)
+
+
 class CustomPostPagination(PageNumberPagination):
     page_size = 10
     page_query_param = 'current'
     page_size_query_param = 'pageSize'
     max_page_size = 1000
     pagination_query_param = 'pagination'
+    count = None
+    count_is_estimate = False
+
+    def django_paginator_class(self, object_list, per_page):
+        return PrecountedPaginator(object_list, per_page, count=self.count, count_is_estimate=self.count_is_estimate)
 
     def get_page_number(self, request, paginator):
         page_number = request.data.get(self.pagination_query_param, {}).get(self.page_query_param, 1)
@@ -39,3 +97,149 @@ class CustomPostPagination(PageNumberPagination):
                 )
 
         return self.page_size
+
+
+class RowValue(Func):
+    """
+    Row constructor (a, b, ...), compared element-wise by PostgreSQL and able to use a
+    composite index on the same columns.
+    """
+    template = '(%(expressions)s)'
+    output_field = Field()
+
+
+class KeysetPostPagination:
+    """
+    Cursor pagination for POST table requests.
+
+    The cursor is an opaque token holding the sort field, the direction and the
+    (sort value, id) of the last row of the previous page. The next page is read with the
+    row comparison (sort_field, id) > (value, id) in ORDER BY sort_field, id, which a
+    composite index on (sort_field, id) answers as a range scan instead of a growing OFFSET.
+    Sending pagination.cursor (empty for the first page) enables this mode.
+
+    NULL sort values never satisfy a row comparison, so they are paged separately by id
+    where PostgreSQL places them: after the other rows in ascending order, before them in
+    descending order.
+    """
+    page_size = 10
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'pageSize'
+    max_page_size = 1000
+    pagination_query_param = 'pagination'
+    value_annotation = 'keyset_value'
+
+    @classmethod
+    def is_requested(cls, request):
+        pagination = request.data.get(cls.pagination_query_param)
+        return isinstance(pagination, dict) and cls.cursor_query_param in pagination
+
+    def get_page_size(self, request):
+        with contextlib.suppress(KeyError, ValueError, TypeError):
+            return _positive_int(
+                request.data[self.pagination_query_param][self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+
+        return self.page_size
+
+    def encode_cursor(self, sort_field, descending, value, pk):
+        payload = json.dumps([sort_field, descending, value, pk], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            sort_field, descending, value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError):
+            raise ValueError('Invalid cursor.')
+        return sort_field, descending, value, pk
+
+    def get_sort_output_field(self, queryset, sort_field):
+        if sort_field in queryset.query.annotations:
+            return queryset.query.annotations[sort_field].output_field
+        try:
+            return queryset.model._meta.get_field(sort_field)
+        except FieldDoesNotExist:
+            raise ValueError(f"Unknown sort field '{sort_field}'.")
+
+    def get_segments(self, queryset, sort_field, descending, position):
+        """
+        (filter, ordering) of each part of the ordering still to be read, starting after
+        position, the (sort value, id) of the cursor (None for the first page).
+        """
+        id_order = '-id' if descending else 'id'
+        after_id = Q()
+        if position is not None:
+            after_id = Q(id__lt=position[1]) if descending else Q(id__gt=position[1])
+        if sort_field == 'id':
+            return [(after_id, [id_order])]
+
+        output_field = self.get_sort_output_field(queryset, sort_field)
+        sort_order = f'-{sort_field}' if descending else sort_field
+        nullable = sort_field in queryset.query.annotations or output_field.null
+        not_null = Q(**{f'{sort_field}__isnull': False}) if nullable else Q()
+
+        if position is not None and position[0] is not None:
+            after = LessThan if descending else GreaterThan
+            values_segment = (
+                after(
+                    RowValue(F(sort_field), F('id')),
+                    RowValue(Value(position[0], output_field=output_field), Value(position[1])),
+                ),
+                [sort_order, id_order],
+            )
+        else:
+            values_segment = (not_null, [sort_order, id_order])
+
+        if not nullable:
+            return [values_segment]
+
+        is_null = Q(**{f'{sort_field}__isnull': True})
+        if position is not None and position[0] is None:
+            # 游标位于 NULL 段：升序时 NULL 段之后已无数据，降序时接着从头读取非 NULL 段
+            nulls_segment = (is_null & after_id, [id_order])
+            return [nulls_segment, values_segment] if descending else [nulls_segment]
+
+        nulls_segment = (is_null, [id_order])
+        if not descending:
+            return [values_segment, nulls_segment]
+        # 降序时游标位于非 NULL 段说明 NULL 段已读完
+        return [values_segment] if position is not None else [nulls_segment, values_segment]
+
+    def paginate_queryset(self, queryset, request, sort_field, descending):
+        """
+        Return the rows of the requested page and set self.next_cursor (None on the last page).
+        """
+        page_size = self.get_page_size(request)
+        cursor = request.data[self.pagination_query_param][self.cursor_query_param]
+
+        position = None
+        if cursor:
+            cursor_field, cursor_descending, value, pk = self.decode_cursor(cursor)
+            if (cursor_field, cursor_descending) != (sort_field, descending):
+                raise ValueError('Cursor does not match the requested sort order.')
+            position = (value, pk)
+
+        # 排序值随行一同取出，用于生成下一页游标
+        if sort_field != 'id':
+            queryset = queryset.annotate(**{self.value_annotation: F(sort_field)})
+
+        rows = []
+        for segment_q, order in self.get_segments(queryset, sort_field, descending, position):
+            rows.extend(queryset.filter(segment_q).order_by(*order)[:page_size + 1 - len(rows)])
+            if len(rows) > page_size:
+                break
+
+        self.page_size = page_size
+        self.next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            # fast_list 模式下的行是 .values() 字典
+            if not isinstance(last, dict):
+                last = {'id': last.pk, self.value_annotation: getattr(last, self.value_annotation, None)}
+            value = last['id'] if sort_field == 'id' else last[self.value_annotation]
+            self.next_cursor = self.encode_cursor(sort_field, descending, value, last['id'])
+
+        return rows
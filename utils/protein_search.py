@@ -0,0 +1,438 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from array import array
+from datetime import datetime
+
+import numpy as np
+from Bio.Align import PairwiseAligner, substitution_matrices
+from django.conf import settings
+from numpy.lib.stride_tricks import sliding_window_view
+
+from MicrobialScope_api.constant import NEW_MEDIA_DATA_DIR
+from large_table_api.indexing import KINGDOMS, MAG_STATUSES
+from utils.annotation_summary import get_genome_model
+from utils.read_files import iter_tsv_rows
+
+AMINO_ACIDS = b'ACDEFGHIKLMNPQRSTVWY'
+INVALID_RESIDUE = 255
+
+KMER_SIZE = 5
+KMER_SPACE = len(AMINO_ACIDS) ** KMER_SIZE
+# Minimizer window, in k-mers: the index keeps the smallest (hashed) k-mer of every window
+MINIMIZER_WINDOW = 8
+HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+# Width of the diagonal bands used to group k-mer matches before alignment
+DIAGONAL_BAND = 16
+
+# (microbe, mag_status) of each protein, stored as its position in this list
+SOURCES = [(microbe, mag_status) for microbe in KINGDOMS for mag_status in MAG_STATUSES]
+
+MANIFEST_NAME = 'current.json'
+INDEX_VERSION = 1
+
+# ((manifest path, manifest mtime), ProteinSearchIndex) of the index loaded by this process
+_current_index = None
+_current_index_lock = threading.Lock()
+
+SEQUENCE_RE = re.compile(r'^[A-Za-z*\-]+$')
+# Letters missing from BLOSUM62 (U, O, J) are aligned as X
+ALIGNMENT_LETTERS = str.maketrans({letter: 'X' for letter in 'JOU'})
+
+RESIDUE_CODES = np.full(256, INVALID_RESIDUE, dtype=np.uint8)
+for code, residue in enumerate(AMINO_ACIDS):
+    RESIDUE_CODES[residue] = code
+    RESIDUE_CODES[ord(chr(residue).lower())] = code
+
+
+def encode_residues(sequence):
+    """
+    Residue codes (0-19) of a protein sequence; other letters become INVALID_RESIDUE.
+    """
+    return RESIDUE_CODES[np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)]
+
+
+def get_kmer_codes(residues, k=KMER_SIZE):
+    """
+    (codes, valid) of the k-mers starting at each position of residues; k-mers containing
+    an invalid residue are marked not valid.
+    """
+    count = len(residues) - k + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    codes = np.zeros(count, dtype=np.int64)
+    valid = np.ones(count, dtype=bool)
+    for offset in range(k):
+        window = residues[offset:offset + count]
+        codes = codes * len(AMINO_ACIDS) + window
+        valid &= window != INVALID_RESIDUE
+    return codes, valid
+
+
+def get_minimizer_positions(codes, valid, window=MINIMIZER_WINDOW):
+    """
+    Positions of the valid k-mers that are the smallest, by hash, in some window of
+    window consecutive k-mers.
+    """
+    if not len(codes):
+        return np.zeros(0, dtype=np.int64)
+
+    hashes = codes.astype(np.uint64) * HASH_MULTIPLIER
+    hashes[~valid] = np.iinfo(np.uint64).max
+    if len(hashes) <= window:
+        positions = np.array([hashes.argmin()])
+    else:
+        windows = sliding_window_view(hashes, window)
+        positions = np.unique(windows.argmin(axis=1) + np.arange(len(windows)))
+    return positions[valid[positions]]
+
+
+def get_sorted_kmers(residues):
+    """
+    (codes, positions) of the valid k-mers of a sequence, sorted by code.
+    """
+    codes, valid = get_kmer_codes(residues)
+    positions = np.flatnonzero(valid)
+    order = np.argsort(codes[positions], kind='stable')
+    return codes[positions][order], positions[order]
+
+
+def get_diagonal_hits(query_kmers, target_residues, band=DIAGONAL_BAND):
+    """
+    Largest number of k-mers shared by the query and a target on one diagonal band;
+    homologs share runs of k-mers on nearby diagonals, chance matches are scattered.
+    """
+    query_codes, query_positions = query_kmers
+    codes, valid = get_kmer_codes(target_residues)
+    target_positions = np.flatnonzero(valid)
+    if not len(query_codes) or not len(target_positions):
+        return 0
+
+    target_codes = codes[target_positions]
+    found = np.minimum(np.searchsorted(query_codes, target_codes), len(query_codes) - 1)
+    matched = query_codes[found] == target_codes
+    if not matched.any():
+        return 0
+
+    diagonals = target_positions[matched] - query_positions[found[matched]]
+    diagonals -= diagonals.min()
+    # Two band grids offset by half a band, so runs across a band edge are still counted together
+    return int(max(np.bincount(diagonals // band).max(), np.bincount((diagonals + band // 2) // band).max()))
+
+
+def clean_query_sequence(sequence):
+    """
+    Protein sequence from raw or FASTA input, without whitespace, gaps or stop codons.
+    Raises ValueError when the input is not a protein sequence.
+    """
+    lines = [line.strip() for line in sequence.strip().splitlines() if not line.startswith('>')]
+    sequence = ''.join(''.join(lines).split())
+    if not sequence or not SEQUENCE_RE.match(sequence):
+        raise ValueError('The sequence must be a protein sequence in one-letter codes.')
+    return sequence.replace('*', '').replace('-', '').upper().translate(ALIGNMENT_LETTERS)
+
+
+def iter_protein_records(microbe, mag_status):
+    """
+    Yield (genome_id, contig_id, protein_id, product, sequence) of every protein of one microbe
+    and MAG status: the per-genome proteins/*.tsv files first, then the rows of the Protein
+    table whose genome has no TSV file.
+    """
+    covered = set()
+    protein_dir = os.path.join(NEW_MEDIA_DATA_DIR, microbe, mag_status, 'proteins')
+    if os.path.isdir(protein_dir):
+        for file_name in sorted(os.listdir(protein_dir)):
+            if not file_name.endswith('.tsv'):
+                continue
+            covered.add(file_name[:-len('.tsv')])
+            for _, row in iter_tsv_rows(os.path.join(protein_dir, file_name)):
+                if len(row) > 25 and row[25]:
+                    yield row[0], row[1], row[2], row[8], row[25]
+
+    id_field = f'{microbe.lower()}_id'
+    rows = get_genome_model(microbe, mag_status, 'Protein').objects.exclude(sequence='').order_by('id').values_list(
+        id_field, 'contig_id', 'protein_id', 'product', 'sequence'
+    )
+    for row in rows.iterator(chunk_size=10000):
+        if row[0] not in covered:
+            yield row
+
+
+class ProteinIndexWriter:
+    """
+    Writes a protein search index into an empty directory:
+
+    proteins.tsv / record_offsets.npy: one line per protein (genome, contig, protein, product,
+    sequence) and the byte offset of each line, so hits are read without loading the file;
+    sources.npy: position in SOURCES of each protein;
+    kmer_offsets.npy / postings.npy: for every k-mer code, the proteins (ascending) that have
+    it as a minimizer, as offsets into one postings array.
+
+    Minimizers are computed for batches of proteins at once and spilled to disk, so memory
+    use is bounded by the batch size rather than the size of the corpus.
+    """
+
+    def __init__(self, directory, batch_residues=4000000):
+        self.directory = directory
+        self.batch_residues = batch_residues
+        self.records = open(os.path.join(directory, 'proteins.tsv'), 'wb')
+        self.record_offsets = array('q', [0])
+        self.sources = array('B')
+        self.batch = []
+        self.batch_size = 0
+        self.spills = []
+
+    def add(self, source, genome_id, contig_id, protein_id, product, sequence):
+        sequence = sequence.strip().rstrip('*').upper().translate(ALIGNMENT_LETTERS)
+        fields = (genome_id, contig_id, protein_id, product or '', sequence)
+        line = '\t'.join(' '.join(str(value).split()) for value in fields).encode() + b'\n'
+        self.records.write(line)
+        self.record_offsets.append(self.record_offsets[-1] + len(line))
+        self.sources.append(source)
+
+        self.batch.append(sequence)
+        self.batch_size += len(sequence) + MINIMIZER_WINDOW
+        if self.batch_size >= self.batch_residues:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+
+        # Proteins are separated by MINIMIZER_WINDOW invalid residues, so no window spans two proteins
+        first = len(self.sources) - len(self.batch)
+        padded = ''.join(sequence + '*' * MINIMIZER_WINDOW for sequence in self.batch)
+        lengths = np.array([len(sequence) + MINIMIZER_WINDOW for sequence in self.batch], dtype=np.int64)
+        owners = np.repeat(np.arange(first, first + len(self.batch), dtype=np.int64), lengths)
+
+        codes, valid = get_kmer_codes(encode_residues(padded))
+        positions = get_minimizer_positions(codes, valid)
+        # One posting per (k-mer, protein), sorted by k-mer then protein
+        keys = np.unique(codes[positions] * (1 << 32) + owners[positions])
+
+        spill_path = os.path.join(self.directory, f'spill_{len(self.spills)}.npy')
+        np.save(spill_path, keys)
+        self.spills.append(spill_path)
+        self.batch = []
+        self.batch_size = 0
+
+    def finish(self):
+        """
+        Merge the spilled postings into kmer_offsets.npy / postings.npy.
+
+        Returns:
+        dict: Manifest of the index
+        """
+        self.flush()
+        self.records.close()
+        np.save(os.path.join(self.directory, 'record_offsets.npy'), np.frombuffer(self.record_offsets, dtype=np.int64))
+        np.save(os.path.join(self.directory, 'sources.npy'), np.frombuffer(self.sources, dtype=np.uint8))
+
+        counts = np.zeros(KMER_SPACE, dtype=np.int64)
+        for spill_path in self.spills:
+            counts += np.bincount(np.load(spill_path) >> 32, minlength=KMER_SPACE)
+        offsets = np.zeros(KMER_SPACE + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        np.save(os.path.join(self.directory, 'kmer_offsets.npy'), offsets)
+
+        postings = np.lib.format.open_memmap(
+            os.path.join(self.directory, 'postings.npy'), mode='w+', dtype=np.uint32, shape=(int(offsets[-1]),)
+        )
+        cursor = offsets[:-1].copy()
+        for spill_path in self.spills:
+            keys = np.load(spill_path)
+            codes = keys >> 32
+            # Each spill is sorted by k-mer: rank of every posting within its k-mer
+            ranks = np.arange(len(keys)) - np.searchsorted(codes, codes)
+            postings[cursor[codes] + ranks] = keys & 0xFFFFFFFF
+            cursor += np.bincount(codes, minlength=KMER_SPACE)
+            os.remove(spill_path)
+        postings.flush()
+        del postings
+
+        return {
+            'version': INDEX_VERSION,
+            'kmer_size': KMER_SIZE,
+            'minimizer_window': MINIMIZER_WINDOW,
+            'protein_count': len(self.sources),
+            'posting_count': int(offsets[-1]),
+            'built_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+
+def build_protein_search_index(index_dir, sources=None, batch_residues=4000000, log=None):
+    """
+    Build a new index under index_dir from the given (microbe, mag_status) pairs (all by
+    default) and make it current by rewriting the manifest; older builds are removed.
+
+    Returns:
+    dict: Manifest of the new index
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix=datetime.now().strftime('build_%Y%m%d_%H%M%S_'), dir=index_dir)
+    # mkdtemp creates the directory accessible by the owner only
+    os.chmod(build_dir, 0o755)
+    build_name = os.path.basename(build_dir)
+
+    writer = ProteinIndexWriter(build_dir, batch_residues)
+    for microbe, mag_status in sources or SOURCES:
+        source = SOURCES.index((microbe, mag_status))
+        before = len(writer.sources)
+        for record in iter_protein_records(microbe, mag_status):
+            writer.add(source, *record)
+        if log:
+            log(f'{microbe} {mag_status}: {len(writer.sources) - before} proteins')
+
+    manifest = writer.finish()
+    manifest['directory'] = build_name
+    manifest_path = os.path.join(index_dir, MANIFEST_NAME)
+    with open(f'{manifest_path}.part', 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(f'{manifest_path}.part', manifest_path)
+
+    # Processes still holding an older build keep their open memory maps until they reload
+    for name in os.listdir(index_dir):
+        if name.startswith('build_') and name != build_name:
+            shutil.rmtree(os.path.join(index_dir, name), ignore_errors=True)
+    return manifest
+
+
+def get_aligner():
+    aligner = PairwiseAligner(mode='local', substitution_matrix=substitution_matrices.load('BLOSUM62'))
+    aligner.open_gap_score = -11
+    aligner.extend_gap_score = -1
+    return aligner
+
+
+class ProteinSearchIndex:
+    """
+    A built protein search index, memory-mapped so that a query only reads the postings
+    of its own k-mers and the records of its candidate hits.
+    """
+
+    def __init__(self, manifest_path):
+        with open(manifest_path) as manifest_file:
+            self.manifest = json.load(manifest_file)
+        directory = os.path.join(os.path.dirname(manifest_path), self.manifest['directory'])
+
+        self.records_path = os.path.join(directory, 'proteins.tsv')
+        self.record_offsets = np.load(os.path.join(directory, 'record_offsets.npy'), mmap_mode='r')
+        self.sources = np.load(os.path.join(directory, 'sources.npy'), mmap_mode='r')
+        self.kmer_offsets = np.load(os.path.join(directory, 'kmer_offsets.npy'), mmap_mode='r')
+        self.postings = np.load(os.path.join(directory, 'postings.npy'), mmap_mode='r')
+        self.aligner = get_aligner()
+
+    def get_candidates(self, residues, max_candidates, allowed_sources=None):
+        """
+        (proteins, shared k-mer counts) of the proteins sharing the most minimizers with the query.
+        K-mers more common than PROTEIN_SEARCH_MAX_POSTINGS are skipped, as they carry little signal.
+        """
+        codes, valid = get_kmer_codes(residues)
+        codes = np.unique(codes[valid])
+        if not len(codes):
+            raise ValueError(f'The sequence needs at least {KMER_SIZE} standard amino acids in a row.')
+
+        max_postings = getattr(settings, 'PROTEIN_SEARCH_MAX_POSTINGS', 200000)
+        starts = self.kmer_offsets[codes]
+        ends = self.kmer_offsets[codes + 1]
+        slices = [self.postings[start:end] for start, end in zip(starts, ends) if 0 < end - start <= max_postings]
+        if not slices:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        proteins, counts = np.unique(np.concatenate(slices), return_counts=True)
+        if allowed_sources is not None:
+            keep = np.isin(self.sources[proteins], allowed_sources)
+            proteins, counts = proteins[keep], counts[keep]
+
+        if len(proteins) > max_candidates:
+            top = np.argpartition(-counts, max_candidates - 1)[:max_candidates]
+            proteins, counts = proteins[top], counts[top]
+        return proteins, counts
+
+    def read_records(self, proteins):
+        records = {}
+        with open(self.records_path, 'rb') as records_file:
+            for protein in sorted(int(protein) for protein in proteins):
+                start, end = self.record_offsets[protein], self.record_offsets[protein + 1]
+                records_file.seek(start)
+                records[protein] = records_file.read(end - start).decode().rstrip('\n').split('\t')
+        return records
+
+    def get_hit(self, query, protein, record, score, shared_kmers):
+        genome_id, contig_id, protein_id, product, sequence = record
+        alignment = self.aligner.align(query, sequence)[0]
+        counts = alignment.counts()
+        aligned_columns = counts.identities + counts.mismatches + counts.gaps
+        (query_start, query_end), (target_start, target_end) = (
+            (blocks[0][0], blocks[-1][1]) for blocks in alignment.aligned
+        )
+        microbe, mag_status = SOURCES[self.sources[protein]]
+        return {
+            'microbe': microbe,
+            'magStatus': mag_status,
+            'genomeId': genome_id,
+            'contigId': contig_id,
+            'proteinId': protein_id,
+            'product': product,
+            'length': len(sequence),
+            'score': round(score, 1),
+            'identity': round(100 * counts.identities / aligned_columns, 1) if aligned_columns else 0.0,
+            'alignmentLength': aligned_columns,
+            'queryStart': int(query_start) + 1,
+            'queryEnd': int(query_end),
+            'targetStart': int(target_start) + 1,
+            'targetEnd': int(target_end),
+            'queryCoverage': round(100 * (query_end - query_start) / len(query), 1),
+            'targetCoverage': round(100 * (target_end - target_start) / len(sequence), 1),
+            'sharedKmers': int(shared_kmers),
+        }
+
+    def search(self, query, limit=10, allowed_sources=None):
+        """
+        Top hits of a cleaned query sequence in three steps: the proteins sharing the most
+        minimizers with the query; of those, the ones with the most k-mer matches on one
+        diagonal band, which are scored by local alignment (BLOSUM62); identity and coverage
+        are taken from the alignment of each returned hit.
+        """
+        max_candidates = getattr(settings, 'PROTEIN_SEARCH_CANDIDATES', 200)
+        max_alignments = max(getattr(settings, 'PROTEIN_SEARCH_ALIGNMENTS', 50), limit)
+
+        residues = encode_residues(query)
+        proteins, counts = self.get_candidates(residues, max_candidates, allowed_sources)
+        records = self.read_records(proteins)
+
+        query_kmers = get_sorted_kmers(residues)
+        candidates = sorted(
+            ((get_diagonal_hits(query_kmers, encode_residues(records[int(protein)][4])), int(count), int(protein))
+             for protein, count in zip(proteins, counts)),
+            reverse=True,
+        )[:max_alignments]
+
+        scored = sorted(
+            ((self.aligner.score(query, records[protein][4]), protein, count)
+             for _, count, protein in candidates),
+            key=lambda item: (-item[0], item[1]),
+        )
+        return [
+            self.get_hit(query, protein, records[protein], score, count)
+            for score, protein, count in scored[:limit] if score > 0
+        ]
+
+
+def get_protein_search_index():
+    """
+    The current index, reloaded when build_ProteinSearchIndex replaces it.
+    Raises FileNotFoundError when no index has been built.
+    """
+    global _current_index
+    manifest_path = os.path.join(settings.PROTEIN_SEARCH_INDEX_DIR, MANIFEST_NAME)
+    mtime = os.path.getmtime(manifest_path)
+
+    with _current_index_lock:
+        if _current_index is None or _current_index[0] != (manifest_path, mtime):
+            _current_index = ((manifest_path, mtime), ProteinSearchIndex(manifest_path))
+        return _current_index[1]
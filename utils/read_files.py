@@ -1,15 +1,356 @@
 import json
 import csv
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from itertools import islice
 import re
 
-def read_archaea_protein_file(tsv_file_path):
+ROW_OFFSETS_SUFFIX = '.offsets'
+PROTEIN_STARTS_SUFFIX = '.proteins'
+ROW_KEYS_SUFFIX = '.keyidx'
+# 键索引文件头: contig_id 与 protein_id 的定宽字节数; 每条记录为补齐的两个ID加起止偏移
+ROW_KEYS_HEADER = struct.Struct('<QQ')
+ROW_KEYS_RANGE = struct.Struct('<QQ')
+COLUMNAR_STORE_SUFFIX = '.parquet'
+
+
+def get_row_offsets_path(tsv_file_path, suffix=ROW_OFFSETS_SUFFIX):
+    return tsv_file_path + suffix
+
+
+def _write_sidecar(tsv_file_path, suffix, values):
+    tmp_path = get_row_offsets_path(tsv_file_path, suffix) + '.tmp'
+    with open(tmp_path, 'wb') as sidecar_file:
+        values.tofile(sidecar_file)
+    os.replace(tmp_path, get_row_offsets_path(tsv_file_path, suffix))
+
+
+def _get_row_key_columns(header_line):
+    headers = header_line.rstrip(b'\r\n').split(b'\t')
+    try:
+        return headers.index(b'Contig_ID'), headers.index(b'Protein_ID')
+    except ValueError:
+        return None
+
+
+def _add_row_key(row_keys, key_columns, line, position):
+    """
+    Record the byte range of a line under its (contig_id, protein_id); consecutive lines
+    of the same protein (ARG hits, TMH helices) extend a single range.
+    """
+    cols = line.strip().split(b'\t')
+    if key_columns is None or len(cols) <= max(key_columns):
+        return
+    key = (cols[key_columns[0]], cols[key_columns[1]])
+    if row_keys and row_keys[-1][0] == key and row_keys[-1][2] == position:
+        row_keys[-1][2] = position + len(line)
+    else:
+        row_keys.append([key, position, position + len(line)])
+
+
+def _write_row_keys(tsv_file_path, row_keys):
+    """
+    Write the (contig_id, protein_id) -> byte range sidecar as fixed-width records sorted
+    by key, so lookups can bisect the file instead of parsing it.
+    """
+    contig_width = max((len(key[0]) for key, _, _ in row_keys), default=0)
+    protein_width = max((len(key[1]) for key, _, _ in row_keys), default=0)
+
+    tmp_path = get_row_offsets_path(tsv_file_path, ROW_KEYS_SUFFIX) + '.tmp'
+    with open(tmp_path, 'wb') as keys_file:
+        keys_file.write(ROW_KEYS_HEADER.pack(contig_width, protein_width))
+        for (contig_id, protein_id), start, end in sorted(row_keys):
+            keys_file.write(contig_id.ljust(contig_width, b'\0'))
+            keys_file.write(protein_id.ljust(protein_width, b'\0'))
+            keys_file.write(ROW_KEYS_RANGE.pack(start, end))
+    os.replace(tmp_path, get_row_offsets_path(tsv_file_path, ROW_KEYS_SUFFIX))
+
+
+def build_row_offsets(tsv_file_path):
+    """
+    Scan a TSV file once and write a sidecar with the byte offset of every data line.
+
+    The sidecar is a packed array of unsigned 64-bit integers: one entry per data line
+    (header excluded) followed by the file size, so row i spans offsets[i]:offsets[i + 1].
+    A second sidecar maps every (contig_id, protein_id) to the byte range of its lines.
+
+    Parameters:
+    tsv_file_path (str): Path to the input TSV file
+
+    Returns:
+    int: Number of data lines in the file
+    """
+    offsets = array('Q')
+    row_keys = []
+
+    with open(tsv_file_path, 'rb') as tsv_file:
+        header_line = tsv_file.readline()
+        key_columns = _get_row_key_columns(header_line)
+        position = len(header_line)
+        for line in tsv_file:
+            offsets.append(position)
+            _add_row_key(row_keys, key_columns, line, position)
+            position += len(line)
+        offsets.append(position)
+
+    _write_sidecar(tsv_file_path, ROW_OFFSETS_SUFFIX, offsets)
+    _write_row_keys(tsv_file_path, row_keys)
+
+    return len(offsets) - 1
+
+
+def build_protein_row_offsets(tsv_file_path):
+    """
+    Scan a TMH TSV file once and write both the line byte offset sidecar and a protein
+    sidecar holding the first data line of every protein followed by the line count,
+    so protein k spans lines starts[k]:starts[k + 1]. Helix lines of one protein are
+    contiguous in the TMHMM output. The (contig_id, protein_id) sidecar is written too.
+
+    Parameters:
+    tsv_file_path (str): Path to the input TSV file
+
+    Returns:
+    int: Number of proteins in the file
+    """
+    offsets = array('Q')
+    protein_starts = array('Q')
+    row_keys = []
+    last_key = None
+
+    with open(tsv_file_path, 'rb') as tsv_file:
+        header_line = tsv_file.readline()
+        key_columns = _get_row_key_columns(header_line)
+        position = len(header_line)
+        for line_idx, line in enumerate(tsv_file):
+            offsets.append(position)
+            _add_row_key(row_keys, key_columns, line, position)
+            position += len(line)
+
+            # 蛋白由前六列与最后三列共同确定，与 read_*_tmh_file 的分组方式一致
+            cols = line.rstrip(b'\r\n').split(b'\t')
+            protein_key = cols[:6] + cols[9:12]
+            if protein_key != last_key:
+                protein_starts.append(line_idx)
+                last_key = protein_key
+        offsets.append(position)
+        protein_starts.append(len(offsets) - 1)
+
+    _write_sidecar(tsv_file_path, ROW_OFFSETS_SUFFIX, offsets)
+    _write_sidecar(tsv_file_path, PROTEIN_STARTS_SUFFIX, protein_starts)
+    _write_row_keys(tsv_file_path, row_keys)
+
+    return len(protein_starts) - 1
+
+
+def load_row_offsets(tsv_file_path, suffix=ROW_OFFSETS_SUFFIX):
+    """
+    Load the byte offset (or protein start) sidecar of a TSV file.
+
+    Returns None when the sidecar is missing or older than the TSV file, so callers
+    fall back to a sequential scan.
+    """
+    offsets_path = get_row_offsets_path(tsv_file_path, suffix)
+    try:
+        if os.path.getmtime(offsets_path) < os.path.getmtime(tsv_file_path):
+            return None
+        offsets = array('Q')
+        with open(offsets_path, 'rb') as offsets_file:
+            offsets.frombytes(offsets_file.read())
+        return offsets
+    except OSError:
+        return None
+
+
+def count_tsv_rows(tsv_file_path):
+    """
+    Number of data lines of a TSV file, from the byte offset sidecar when it is current,
+    otherwise by counting lines. Read errors are raised rather than counted as 0.
+    """
+    offsets = load_row_offsets(tsv_file_path)
+    if offsets is not None:
+        return len(offsets) - 1
+
+    with open(tsv_file_path, 'rb') as tsv_file:
+        tsv_file.readline()
+        return sum(1 for line in tsv_file if line.strip())
+
+
+def count_tsv_proteins(tsv_file_path):
+    """
+    Number of proteins of a TMH TSV file, from the protein sidecar when it is current,
+    otherwise as the distinct Protein_ID values. Raises KeyError when the column is missing.
+    """
+    protein_starts = load_row_offsets(tsv_file_path, PROTEIN_STARTS_SUFFIX)
+    if protein_starts is not None:
+        return len(protein_starts) - 1
+
+    with open(tsv_file_path, 'r') as tsv_file:
+        reader = csv.reader(tsv_file, delimiter='\t')
+        header = next(reader, [])
+        if 'Protein_ID' not in header:
+            raise KeyError(f"{tsv_file_path} has no Protein_ID column")
+        protein_column = header.index('Protein_ID')
+        return len({row[protein_column] for row in reader if len(row) > protein_column})
+
+
+class RowKeyIndex:
+    """
+    Sorted fixed-width (contig_id, protein_id) -> byte range records of a key sidecar.
+
+    Keys are NUL-padded to a common width, so comparing the padded bytes orders records
+    the same way as comparing the (contig_id, protein_id) tuples; indexing returns the
+    padded key of a record, which lets bisect find a key without reading the whole file.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.contig_width, self.protein_width = ROW_KEYS_HEADER.unpack_from(data, 0)
+        self.key_width = self.contig_width + self.protein_width
+        self.record_size = self.key_width + ROW_KEYS_RANGE.size
+        self.length = (len(data) - ROW_KEYS_HEADER.size) // self.record_size
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, idx):
+        start = ROW_KEYS_HEADER.size + idx * self.record_size
+        return self.data[start:start + self.key_width]
+
+    def get_ranges(self, contig_id, protein_id):
+        """
+        Return the byte ranges recorded for a (contig_id, protein_id) pair.
+        """
+        contig_id, protein_id = contig_id.encode('utf-8'), protein_id.encode('utf-8')
+        if len(contig_id) > self.contig_width or len(protein_id) > self.protein_width:
+            return []
+
+        padded_key = contig_id.ljust(self.contig_width, b'\0') + protein_id.ljust(self.protein_width, b'\0')
+        ranges = []
+        idx = bisect_left(self, padded_key)
+        while idx < self.length and self[idx] == padded_key:
+            offset = ROW_KEYS_HEADER.size + idx * self.record_size + self.key_width
+            ranges.append(ROW_KEYS_RANGE.unpack_from(self.data, offset))
+            idx += 1
+        return ranges
+
+
+def read_ranges_by_keys(tsv_file_path, keys):
+    """
+    Look up the byte ranges of the given (contig_id, protein_id) pairs in the key sidecar.
+
+    Returns the sorted, de-duplicated ranges, or None when the sidecar is missing or
+    older than the TSV file.
+    """
+    keys_path = get_row_offsets_path(tsv_file_path, ROW_KEYS_SUFFIX)
+    try:
+        if os.path.getmtime(keys_path) < os.path.getmtime(tsv_file_path):
+            return None
+        with open(keys_path, 'rb') as keys_file:
+            if os.fstat(keys_file.fileno()).st_size <= ROW_KEYS_HEADER.size:
+                return []
+            with mmap.mmap(keys_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                row_keys = RowKeyIndex(data)
+                return sorted({
+                    line_range
+                    for contig_id, protein_id in set(keys)
+                    for line_range in row_keys.get_ranges(contig_id, protein_id)
+                })
+    except OSError:
+        return None
+
+
+def read_lines_by_keys(tsv_file_path, keys):
+    """
+    Read the raw lines of the given (contig_id, protein_id) pairs from a TSV file.
+
+    Parameters:
+    tsv_file_path (str): Path to the input TSV file
+    keys (iterable): (contig_id, protein_id) pairs to look up
+
+    Returns:
+    list: Matching lines in file order, or None when the key sidecar is unavailable
+    """
+    ranges = read_ranges_by_keys(tsv_file_path, keys)
+    if ranges is None:
+        return None
+
+    lines = []
+    with open(tsv_file_path, 'rb') as tsv_file:
+        for start, end in ranges:
+            tsv_file.seek(start)
+            lines.extend(tsv_file.read(end - start).decode('utf-8').splitlines())
+
+    return lines
+
+
+def iter_tsv_rows(tsv_file_path, start_row=0, end_row=None):
+    """
+    Yield (idx, row) for the data lines start_row..end_row (0-based, inclusive) of a TSV file.
+
+    idx is the 1-based position of the line in the file, the same numbering the readers
+    below use for "id". When the byte offset sidecar is available only the requested
+    lines are read from disk.
+    """
+    offsets = load_row_offsets(tsv_file_path) if (start_row or end_row is not None) else None
+
+    if offsets is not None:
+        row_count = len(offsets) - 1
+        stop_row = row_count if end_row is None else min(end_row + 1, row_count)
+        if start_row >= stop_row:
+            return
+
+        with open(tsv_file_path, 'rb') as tsv_file:
+            tsv_file.seek(offsets[start_row])
+            chunk = tsv_file.read(offsets[stop_row] - offsets[start_row])
+
+        reader = csv.reader(chunk.decode('utf-8').splitlines(), delimiter='\t')
+        yield from enumerate(reader, start_row + 1)
+        return
+
+    with open(tsv_file_path, 'r') as tsv_file:
+        reader = csv.reader(tsv_file, delimiter='\t')
+        next(reader)
+        stop_row = None if end_row is None else end_row + 1
+        yield from enumerate(islice(reader, start_row, stop_row), start_row + 1)
+
+
+def iter_tmh_rows(tsv_file_path, start_row=0, end_row=None):
+    """
+    Select the helix lines of proteins start_row..end_row (0-based, inclusive) of a TMH TSV file.
+
+    Returns (skipped_proteins, rows) where rows yields (idx, row) like iter_tsv_rows. With
+    the protein sidecar only the lines of the requested proteins are read and
+    skipped_proteins is start_row; otherwise every line is yielded and it is 0.
+    """
+    protein_starts = None
+    if start_row or end_row is not None:
+        protein_starts = load_row_offsets(tsv_file_path, PROTEIN_STARTS_SUFFIX)
+
+    if protein_starts is None:
+        return 0, iter_tsv_rows(tsv_file_path)
+
+    protein_count = len(protein_starts) - 1
+    stop_row = protein_count if end_row is None else min(end_row + 1, protein_count)
+    if start_row >= stop_row:
+        return start_row, iter(())
+
+    return start_row, iter_tsv_rows(tsv_file_path, protein_starts[start_row], protein_starts[stop_row] - 1)
+
+
+def read_archaea_protein_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str): Path to save the output JSON file
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     bool: True if conversion is successful, False otherwise
@@ -20,48 +361,40 @@ def read_archaea_protein_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "archaea_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "orf_prediction_source": row[3],
-                    "start": int(row[4]),
-                    "end": int(row[5]),
-                    "strand": 0 if row[6] == '+' else 1,
-                    "phase": int(row[7]),
-                    "product": row[8],
-                    "function_prediction_source": row[9],
-                    "cog_category": list(row[10]) if row[10] != "-" else [],
-                    "description": row[11],
-                    "preferred_name": row[12],
-                    "gos": row[13],
-                    "ec": row[14],
-                    "kegg_ko": row[15],
-                    "kegg_pathway": row[16],
-                    "kegg_module": row[17],
-                    "kegg_reaction": row[18],
-                    "kegg_rclass": row[19],
-                    "brite": row[20],
-                    "kegg_tc": row[21],
-                    "cazy": row[22],
-                    "bigg_reaction": row[23],
-                    "pfams": row[24],
-                    "sequence": row[25]
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "archaea_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "orf_prediction_source": row[3],
+                "start": int(row[4]),
+                "end": int(row[5]),
+                "strand": 0 if row[6] == '+' else 1,
+                "phase": int(row[7]),
+                "product": row[8],
+                "function_prediction_source": row[9],
+                "cog_category": list(row[10]) if row[10] != "-" else [],
+                "description": row[11],
+                "preferred_name": row[12],
+                "gos": row[13],
+                "ec": row[14],
+                "kegg_ko": row[15],
+                "kegg_pathway": row[16],
+                "kegg_module": row[17],
+                "kegg_reaction": row[18],
+                "kegg_rclass": row[19],
+                "brite": row[20],
+                "kegg_tc": row[21],
+                "cazy": row[22],
+                "bigg_reaction": row[23],
+                "pfams": row[24],
+                "sequence": row[25]
+            }
+            
+            result.append(item)
         
         return result
     
@@ -69,13 +402,15 @@ def read_archaea_protein_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_archaea_arg_file(tsv_file_path):
+def read_archaea_arg_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with ARG data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     list: JSON-formatted data as a Python list
@@ -84,102 +419,106 @@ def read_archaea_arg_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Parse drug class as a list if it's not empty
-                drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
-                
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "archaea_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "product": row[3],
-                    "arg_database": row[4],
-                    "cutoff": row[5],
-                    "hsp_identifier": row[6],
-                    "best_hit_aro": row[7],
-                    "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
-                    "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
-                    "drug_class": drug_class,
-                    "resistance_mechanism": row[11],
-                    "amr_gene_family": row[12],
-                    "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
-                    "sequence": row[14],
-                    "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
-                    "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Parse drug class as a list if it's not empty
+            drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
+            
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "archaea_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "product": row[3],
+                "arg_database": row[4],
+                "cutoff": row[5],
+                "hsp_identifier": row[6],
+                "best_hit_aro": row[7],
+                "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
+                "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
+                "drug_class": drug_class,
+                "resistance_mechanism": row[11],
+                "amr_gene_family": row[12],
+                "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
+                "sequence": row[14],
+                "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
+                "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
+            }
+            
+            result.append(item)
         return result
     
     except Exception as e:
         print(f"Error during conversion: {e}")
         return []
     
-def read_archaea_tmh_file(tsv_file_path):
+def read_archaea_tmh_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with TMHMM data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First protein to return (0-based)
+    end_row (int, optional): Last protein to return (inclusive), None returns all
     
     Returns:
     list: JSON-formatted data as a Python list
     """
     
     try:
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Skip the header rows (there are two header rows in this format)
-            next(reader)
-            # next(reader)
-            
-            # Group rows by protein_id
-            protein_data = defaultdict(list)
-            for row in reader:
-                # Extract the relevant fields
-                archaea_id = row[0]
-                contig_id = row[1]
-                protein_id = row[2]
-                length = int(row[3])
-                predicted_tmh_count = int(row[4])
-                source = row[5]
-                position = row[6]
-                start = int(row[7])
-                end = int(row[8])
-                expected_aas_in_tmh = float(row[9])
-                expected_first_60_aas = float(row[10])
-                total_prob_n_in = float(row[11])
-                
-                # Store the data
-                protein_data[(archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
-                             expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)].append(
-                    {
-                        "position": position,
-                        "start": start,
-                        "end": end
-                    }
-                )
+        # Read only the helix lines of the requested proteins when the protein sidecar exists
+        skipped_proteins, rows = iter_tmh_rows(tsv_file_path, start_row, end_row)
+        first_line = None
         
+        # Group rows by protein_id
+        protein_data = defaultdict(list)
+        for idx, row in rows:
+            # Extract the relevant fields
+            archaea_id = row[0]
+            contig_id = row[1]
+            protein_id = row[2]
+            length = int(row[3])
+            predicted_tmh_count = int(row[4])
+            source = row[5]
+            position = row[6]
+            start = int(row[7])
+            end = int(row[8])
+            expected_aas_in_tmh = float(row[9])
+            expected_first_60_aas = float(row[10])
+            total_prob_n_in = float(row[11])
+            
+            protein_key = (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source,
+                           expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)
+
+            # Stop once the requested proteins are complete and the next protein starts
+            if end_row is not None and protein_key not in protein_data \
+                    and skipped_proteins + len(protein_data) > end_row:
+                break
+            if first_line is None:
+                first_line = idx
+            
+            # Store the data
+            protein_data[protein_key].append(
+                {
+                    "position": position,
+                    "start": start,
+                    "end": end
+                }
+            )
+    
         # Create the final JSON structure
         result = []
-        helix_id = 1
+        # Helix ids number the data lines of the file
+        helix_id = first_line or 1
         
-        for idx, (protein_key, helices) in enumerate(protein_data.items(), 1):
+        for idx, (protein_key, helices) in enumerate(protein_data.items(), skipped_proteins + 1):
+            # Proteins before the requested range still advance the helix numbering
+            if idx <= start_row:
+                helix_id += len(helices)
+                continue
+
             (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
              expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in) = protein_key
             
@@ -218,13 +557,15 @@ def read_archaea_tmh_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_fungi_protein_file(tsv_file_path):
+def read_fungi_protein_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str): Path to save the output JSON file
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     bool: True if conversion is successful, False otherwise
@@ -235,48 +576,40 @@ def read_fungi_protein_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "fungi_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "orf_prediction_source": row[3],
-                    "start": int(row[4]),
-                    "end": int(row[5]),
-                    "strand": 0 if row[6] == '+' else 1,
-                    "phase": int(row[7]),
-                    "product": row[8],
-                    "function_prediction_source": row[9],
-                    "cog_category": list(row[10]) if row[10] != "-" else [],
-                    "description": row[11],
-                    "preferred_name": row[12],
-                    "gos": row[13],
-                    "ec": row[14],
-                    "kegg_ko": row[15],
-                    "kegg_pathway": row[16],
-                    "kegg_module": row[17],
-                    "kegg_reaction": row[18],
-                    "kegg_rclass": row[19],
-                    "brite": row[20],
-                    "kegg_tc": row[21],
-                    "cazy": row[22],
-                    "bigg_reaction": row[23],
-                    "pfams": row[24],
-                    "sequence": row[25]
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "fungi_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "orf_prediction_source": row[3],
+                "start": int(row[4]),
+                "end": int(row[5]),
+                "strand": 0 if row[6] == '+' else 1,
+                "phase": int(row[7]),
+                "product": row[8],
+                "function_prediction_source": row[9],
+                "cog_category": list(row[10]) if row[10] != "-" else [],
+                "description": row[11],
+                "preferred_name": row[12],
+                "gos": row[13],
+                "ec": row[14],
+                "kegg_ko": row[15],
+                "kegg_pathway": row[16],
+                "kegg_module": row[17],
+                "kegg_reaction": row[18],
+                "kegg_rclass": row[19],
+                "brite": row[20],
+                "kegg_tc": row[21],
+                "cazy": row[22],
+                "bigg_reaction": row[23],
+                "pfams": row[24],
+                "sequence": row[25]
+            }
+            
+            result.append(item)
         
         return result
     
@@ -284,13 +617,15 @@ def read_fungi_protein_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_fungi_arg_file(tsv_file_path):
+def read_fungi_arg_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with ARG data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     list: JSON-formatted data as a Python list
@@ -299,102 +634,106 @@ def read_fungi_arg_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Parse drug class as a list if it's not empty
-                drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
-                
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "fungi_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "product": row[3],
-                    "arg_database": row[4],
-                    "cutoff": row[5],
-                    "hsp_identifier": row[6],
-                    "best_hit_aro": row[7],
-                    "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
-                    "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
-                    "drug_class": drug_class,
-                    "resistance_mechanism": row[11],
-                    "amr_gene_family": row[12],
-                    "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
-                    "sequence": row[14],
-                    "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
-                    "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Parse drug class as a list if it's not empty
+            drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
+            
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "fungi_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "product": row[3],
+                "arg_database": row[4],
+                "cutoff": row[5],
+                "hsp_identifier": row[6],
+                "best_hit_aro": row[7],
+                "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
+                "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
+                "drug_class": drug_class,
+                "resistance_mechanism": row[11],
+                "amr_gene_family": row[12],
+                "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
+                "sequence": row[14],
+                "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
+                "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
+            }
+            
+            result.append(item)
         return result
     
     except Exception as e:
         print(f"Error during conversion: {e}")
         return []
     
-def read_fungi_tmh_file(tsv_file_path):
+def read_fungi_tmh_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with TMHMM data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First protein to return (0-based)
+    end_row (int, optional): Last protein to return (inclusive), None returns all
     
     Returns:
     list: JSON-formatted data as a Python list
     """
     
     try:
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Skip the header rows (there are two header rows in this format)
-            next(reader)
-            # next(reader)
-            
-            # Group rows by protein_id
-            protein_data = defaultdict(list)
-            for row in reader:
-                # Extract the relevant fields
-                archaea_id = row[0]
-                contig_id = row[1]
-                protein_id = row[2]
-                length = int(row[3])
-                predicted_tmh_count = int(row[4])
-                source = row[5]
-                position = row[6]
-                start = int(row[7])
-                end = int(row[8])
-                expected_aas_in_tmh = float(row[9])
-                expected_first_60_aas = float(row[10])
-                total_prob_n_in = float(row[11])
-                
-                # Store the data
-                protein_data[(archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
-                             expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)].append(
-                    {
-                        "position": position,
-                        "start": start,
-                        "end": end
-                    }
-                )
+        # Read only the helix lines of the requested proteins when the protein sidecar exists
+        skipped_proteins, rows = iter_tmh_rows(tsv_file_path, start_row, end_row)
+        first_line = None
         
+        # Group rows by protein_id
+        protein_data = defaultdict(list)
+        for idx, row in rows:
+            # Extract the relevant fields
+            archaea_id = row[0]
+            contig_id = row[1]
+            protein_id = row[2]
+            length = int(row[3])
+            predicted_tmh_count = int(row[4])
+            source = row[5]
+            position = row[6]
+            start = int(row[7])
+            end = int(row[8])
+            expected_aas_in_tmh = float(row[9])
+            expected_first_60_aas = float(row[10])
+            total_prob_n_in = float(row[11])
+            
+            protein_key = (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source,
+                           expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)
+
+            # Stop once the requested proteins are complete and the next protein starts
+            if end_row is not None and protein_key not in protein_data \
+                    and skipped_proteins + len(protein_data) > end_row:
+                break
+            if first_line is None:
+                first_line = idx
+            
+            # Store the data
+            protein_data[protein_key].append(
+                {
+                    "position": position,
+                    "start": start,
+                    "end": end
+                }
+            )
+    
         # Create the final JSON structure
         result = []
-        helix_id = 1
+        # Helix ids number the data lines of the file
+        helix_id = first_line or 1
         
-        for idx, (protein_key, helices) in enumerate(protein_data.items(), 1):
+        for idx, (protein_key, helices) in enumerate(protein_data.items(), skipped_proteins + 1):
+            # Proteins before the requested range still advance the helix numbering
+            if idx <= start_row:
+                helix_id += len(helices)
+                continue
+
             (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
              expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in) = protein_key
             
@@ -433,13 +772,15 @@ def read_fungi_tmh_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_viruses_protein_file(tsv_file_path):
+def read_viruses_protein_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str): Path to save the output JSON file
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     bool: True if conversion is successful, False otherwise
@@ -450,48 +791,40 @@ def read_viruses_protein_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "viruses_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "orf_prediction_source": row[3],
-                    "start": int(row[4]),
-                    "end": int(row[5]),
-                    "strand": 0 if row[6] == '+' else 1,
-                    "phase": int(row[7]),
-                    "product": row[8],
-                    "function_prediction_source": row[9],
-                    "cog_category": list(row[10]) if row[10] != "-" else [],
-                    "description": row[11],
-                    "preferred_name": row[12],
-                    "gos": row[13],
-                    "ec": row[14],
-                    "kegg_ko": row[15],
-                    "kegg_pathway": row[16],
-                    "kegg_module": row[17],
-                    "kegg_reaction": row[18],
-                    "kegg_rclass": row[19],
-                    "brite": row[20],
-                    "kegg_tc": row[21],
-                    "cazy": row[22],
-                    "bigg_reaction": row[23],
-                    "pfams": row[24],
-                    "sequence": row[25]
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "viruses_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "orf_prediction_source": row[3],
+                "start": int(row[4]),
+                "end": int(row[5]),
+                "strand": 0 if row[6] == '+' else 1,
+                "phase": int(row[7]),
+                "product": row[8],
+                "function_prediction_source": row[9],
+                "cog_category": list(row[10]) if row[10] != "-" else [],
+                "description": row[11],
+                "preferred_name": row[12],
+                "gos": row[13],
+                "ec": row[14],
+                "kegg_ko": row[15],
+                "kegg_pathway": row[16],
+                "kegg_module": row[17],
+                "kegg_reaction": row[18],
+                "kegg_rclass": row[19],
+                "brite": row[20],
+                "kegg_tc": row[21],
+                "cazy": row[22],
+                "bigg_reaction": row[23],
+                "pfams": row[24],
+                "sequence": row[25]
+            }
+            
+            result.append(item)
         
         return result
     
@@ -499,13 +832,15 @@ def read_viruses_protein_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_viruses_arg_file(tsv_file_path):
+def read_viruses_arg_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with ARG data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     list: JSON-formatted data as a Python list
@@ -514,102 +849,106 @@ def read_viruses_arg_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Parse drug class as a list if it's not empty
-                drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
-                
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "viruses_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "product": row[3],
-                    "arg_database": row[4],
-                    "cutoff": row[5],
-                    "hsp_identifier": row[6],
-                    "best_hit_aro": row[7],
-                    "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
-                    "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
-                    "drug_class": drug_class,
-                    "resistance_mechanism": row[11],
-                    "amr_gene_family": row[12],
-                    "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
-                    "sequence": row[14],
-                    "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
-                    "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Parse drug class as a list if it's not empty
+            drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
+            
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "viruses_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "product": row[3],
+                "arg_database": row[4],
+                "cutoff": row[5],
+                "hsp_identifier": row[6],
+                "best_hit_aro": row[7],
+                "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
+                "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
+                "drug_class": drug_class,
+                "resistance_mechanism": row[11],
+                "amr_gene_family": row[12],
+                "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
+                "sequence": row[14],
+                "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
+                "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
+            }
+            
+            result.append(item)
         return result
     
     except Exception as e:
         print(f"Error during conversion: {e}")
         return []
     
-def read_viruses_tmh_file(tsv_file_path):
+def read_viruses_tmh_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with TMHMM data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First protein to return (0-based)
+    end_row (int, optional): Last protein to return (inclusive), None returns all
     
     Returns:
     list: JSON-formatted data as a Python list
     """
     
     try:
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Skip the header rows (there are two header rows in this format)
-            next(reader)
-            # next(reader)
-            
-            # Group rows by protein_id
-            protein_data = defaultdict(list)
-            for row in reader:
-                # Extract the relevant fields
-                archaea_id = row[0]
-                contig_id = row[1]
-                protein_id = row[2]
-                length = int(row[3])
-                predicted_tmh_count = int(row[4])
-                source = row[5]
-                position = row[6]
-                start = int(row[7])
-                end = int(row[8])
-                expected_aas_in_tmh = float(row[9])
-                expected_first_60_aas = float(row[10])
-                total_prob_n_in = float(row[11])
-                
-                # Store the data
-                protein_data[(archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
-                             expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)].append(
-                    {
-                        "position": position,
-                        "start": start,
-                        "end": end
-                    }
-                )
+        # Read only the helix lines of the requested proteins when the protein sidecar exists
+        skipped_proteins, rows = iter_tmh_rows(tsv_file_path, start_row, end_row)
+        first_line = None
         
+        # Group rows by protein_id
+        protein_data = defaultdict(list)
+        for idx, row in rows:
+            # Extract the relevant fields
+            archaea_id = row[0]
+            contig_id = row[1]
+            protein_id = row[2]
+            length = int(row[3])
+            predicted_tmh_count = int(row[4])
+            source = row[5]
+            position = row[6]
+            start = int(row[7])
+            end = int(row[8])
+            expected_aas_in_tmh = float(row[9])
+            expected_first_60_aas = float(row[10])
+            total_prob_n_in = float(row[11])
+            
+            protein_key = (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source,
+                           expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)
+
+            # Stop once the requested proteins are complete and the next protein starts
+            if end_row is not None and protein_key not in protein_data \
+                    and skipped_proteins + len(protein_data) > end_row:
+                break
+            if first_line is None:
+                first_line = idx
+            
+            # Store the data
+            protein_data[protein_key].append(
+                {
+                    "position": position,
+                    "start": start,
+                    "end": end
+                }
+            )
+    
         # Create the final JSON structure
         result = []
-        helix_id = 1
+        # Helix ids number the data lines of the file
+        helix_id = first_line or 1
         
-        for idx, (protein_key, helices) in enumerate(protein_data.items(), 1):
+        for idx, (protein_key, helices) in enumerate(protein_data.items(), skipped_proteins + 1):
+            # Proteins before the requested range still advance the helix numbering
+            if idx <= start_row:
+                helix_id += len(helices)
+                continue
+
             (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
              expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in) = protein_key
             
@@ -648,13 +987,15 @@ def read_viruses_tmh_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_bacteria_protein_file(tsv_file_path):
+def read_bacteria_protein_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str): Path to save the output JSON file
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     bool: True if conversion is successful, False otherwise
@@ -665,48 +1006,40 @@ def read_bacteria_protein_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "bacteria_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "orf_prediction_source": row[3],
-                    "start": int(row[4]),
-                    "end": int(row[5]),
-                    "strand": 0 if row[6] == '+' else 1,
-                    "phase": int(row[7]),
-                    "product": row[8],
-                    "function_prediction_source": row[9],
-                    "cog_category": list(row[10]) if row[10] != "-" else [],
-                    "description": row[11],
-                    "preferred_name": row[12],
-                    "gos": row[13],
-                    "ec": row[14],
-                    "kegg_ko": row[15],
-                    "kegg_pathway": row[16],
-                    "kegg_module": row[17],
-                    "kegg_reaction": row[18],
-                    "kegg_rclass": row[19],
-                    "brite": row[20],
-                    "kegg_tc": row[21],
-                    "cazy": row[22],
-                    "bigg_reaction": row[23],
-                    "pfams": row[24],
-                    "sequence": row[25]
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "bacteria_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "orf_prediction_source": row[3],
+                "start": int(row[4]),
+                "end": int(row[5]),
+                "strand": 0 if row[6] == '+' else 1,
+                "phase": int(row[7]),
+                "product": row[8],
+                "function_prediction_source": row[9],
+                "cog_category": list(row[10]) if row[10] != "-" else [],
+                "description": row[11],
+                "preferred_name": row[12],
+                "gos": row[13],
+                "ec": row[14],
+                "kegg_ko": row[15],
+                "kegg_pathway": row[16],
+                "kegg_module": row[17],
+                "kegg_reaction": row[18],
+                "kegg_rclass": row[19],
+                "brite": row[20],
+                "kegg_tc": row[21],
+                "cazy": row[22],
+                "bigg_reaction": row[23],
+                "pfams": row[24],
+                "sequence": row[25]
+            }
+            
+            result.append(item)
         
         return result
     
@@ -714,13 +1047,15 @@ def read_bacteria_protein_file(tsv_file_path):
         print(f"Error during conversion: {e}")
         return []
     
-def read_bacteria_arg_file(tsv_file_path):
+def read_bacteria_arg_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with ARG data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First data row to read (0-based)
+    end_row (int, optional): Last data row to read (inclusive), None reads to the end
     
     Returns:
     list: JSON-formatted data as a Python list
@@ -729,102 +1064,106 @@ def read_bacteria_arg_file(tsv_file_path):
         # Initialize the result list
         result = []
         
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Get the header row
-            headers = next(reader)
-            
-            # Process each row
-            for idx, row in enumerate(reader, 1):
-                # Parse drug class as a list if it's not empty
-                drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
-                
-                # Create a dictionary for the current row
-                item = {
-                    "id": idx,
-                    "bacteria_id": row[0],
-                    "contig_id": row[1],
-                    "protein_id": row[2],
-                    "product": row[3],
-                    "arg_database": row[4],
-                    "cutoff": row[5],
-                    "hsp_identifier": row[6],
-                    "best_hit_aro": row[7],
-                    "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
-                    "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
-                    "drug_class": drug_class,
-                    "resistance_mechanism": row[11],
-                    "amr_gene_family": row[12],
-                    "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
-                    "sequence": row[14],
-                    "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
-                    "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
-                }
-                
-                result.append(item)
+        # Read only the requested rows of the TSV file
+        for idx, row in iter_tsv_rows(tsv_file_path, start_row, end_row):
+            # Parse drug class as a list if it's not empty
+            drug_class = row[10].split('; ') if row[10] and row[10] != "nan" else []
+            
+            # Create a dictionary for the current row
+            item = {
+                "id": idx,
+                "bacteria_id": row[0],
+                "contig_id": row[1],
+                "protein_id": row[2],
+                "product": row[3],
+                "arg_database": row[4],
+                "cutoff": row[5],
+                "hsp_identifier": row[6],
+                "best_hit_aro": row[7],
+                "best_identities": float(row[8]) if row[8] and row[8] != "nan" else "nan",
+                "aro": int(row[9]) if row[9] and row[9] != "nan" else "nan",
+                "drug_class": drug_class,
+                "resistance_mechanism": row[11],
+                "amr_gene_family": row[12],
+                "antibiotic": row[13] if row[13] and row[13] != "" else "nan",
+                "sequence": row[14],
+                "snps_in_best_hit_aro": row[15] if row[15] and row[15] != "" else "nan",
+                "other_snps": row[16] if len(row) > 16 and row[16] and row[16] != "" else "nan"
+            }
+            
+            result.append(item)
         return result
     
     except Exception as e:
         print(f"Error during conversion: {e}")
         return []
     
-def read_bacteria_tmh_file(tsv_file_path):
+def read_bacteria_tmh_file(tsv_file_path, start_row=0, end_row=None):
     """
     Convert a TSV file with TMHMM data to JSON format with specific structure.
     
     Parameters:
     tsv_file_path (str): Path to the input TSV file
     json_file_path (str, optional): Path to save the output JSON file, if None just returns the data
+    start_row (int, optional): First protein to return (0-based)
+    end_row (int, optional): Last protein to return (inclusive), None returns all
     
     Returns:
     list: JSON-formatted data as a Python list
     """
     
     try:
-        # Read the TSV file
-        with open(tsv_file_path, 'r') as tsv_file:
-            # Create a CSV reader with tab as delimiter
-            reader = csv.reader(tsv_file, delimiter='\t')
-            
-            # Skip the header rows (there are two header rows in this format)
-            next(reader)
-            # next(reader)
-            
-            # Group rows by protein_id
-            protein_data = defaultdict(list)
-            for row in reader:
-                # Extract the relevant fields
-                archaea_id = row[0]
-                contig_id = row[1]
-                protein_id = row[2]
-                length = int(row[3])
-                predicted_tmh_count = int(row[4])
-                source = row[5]
-                position = row[6]
-                start = int(row[7])
-                end = int(row[8])
-                expected_aas_in_tmh = float(row[9])
-                expected_first_60_aas = float(row[10])
-                total_prob_n_in = float(row[11])
-                
-                # Store the data
-                protein_data[(archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
-                             expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)].append(
-                    {
-                        "position": position,
-                        "start": start,
-                        "end": end
-                    }
-                )
+        # Read only the helix lines of the requested proteins when the protein sidecar exists
+        skipped_proteins, rows = iter_tmh_rows(tsv_file_path, start_row, end_row)
+        first_line = None
         
+        # Group rows by protein_id
+        protein_data = defaultdict(list)
+        for idx, row in rows:
+            # Extract the relevant fields
+            archaea_id = row[0]
+            contig_id = row[1]
+            protein_id = row[2]
+            length = int(row[3])
+            predicted_tmh_count = int(row[4])
+            source = row[5]
+            position = row[6]
+            start = int(row[7])
+            end = int(row[8])
+            expected_aas_in_tmh = float(row[9])
+            expected_first_60_aas = float(row[10])
+            total_prob_n_in = float(row[11])
+            
+            protein_key = (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source,
+                           expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in)
+
+            # Stop once the requested proteins are complete and the next protein starts
+            if end_row is not None and protein_key not in protein_data \
+                    and skipped_proteins + len(protein_data) > end_row:
+                break
+            if first_line is None:
+                first_line = idx
+            
+            # Store the data
+            protein_data[protein_key].append(
+                {
+                    "position": position,
+                    "start": start,
+                    "end": end
+                }
+            )
+    
         # Create the final JSON structure
         result = []
-        helix_id = 1
+        # Helix ids number the data lines of the file
+        helix_id = first_line or 1
         
-        for idx, (protein_key, helices) in enumerate(protein_data.items(), 1):
+        for idx, (protein_key, helices) in enumerate(protein_data.items(), skipped_proteins + 1):
+            # Proteins before the requested range still advance the helix numbering
+            if idx <= start_row:
+                helix_id += len(helices)
+                continue
+
             (archaea_id, contig_id, protein_id, length, predicted_tmh_count, source, 
              expected_aas_in_tmh, expected_first_60_aas, total_prob_n_in) = protein_key
             
@@ -949,4 +1288,128 @@ def parse_tmhmm_to_json(tmhmm_file):
         protein_data['source'] = 'TMHMM2.0'
         results.append(protein_data)
     
-    return results
\ No newline at end of file
+    return results
+
+
+def get_columnar_store_path(tsv_file_path):
+    """
+    Path of the consolidated columnar store that covers a per-genome TSV,
+    e.g. .../Archaea/MAG/proteins/X.tsv -> .../Archaea/MAG/proteins.parquet
+    """
+    return os.path.dirname(tsv_file_path) + COLUMNAR_STORE_SUFFIX
+
+
+# store path -> (mtime, ParquetFile, genomes, id_field, group_starts); one open handle per store
+_columnar_stores = {}
+_columnar_stores_lock = threading.Lock()
+
+
+def _close_columnar_store(store_path):
+    with _columnar_stores_lock:
+        entry = _columnar_stores.pop(store_path, None)
+    if entry is not None:
+        entry[1].close()
+
+
+def _open_columnar_store(store_path, mtime):
+    """
+    Open handle and genome row index of a columnar store. A store replaced by a newer
+    build is reopened and the handle of the old file closed, so its disk space is freed.
+    """
+    import pyarrow.parquet as pq
+
+    with _columnar_stores_lock:
+        entry = _columnar_stores.get(store_path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1:]
+
+        if entry is not None:
+            del _columnar_stores[store_path]
+            entry[1].close()
+
+        parquet_file = pq.ParquetFile(store_path)
+        metadata = parquet_file.metadata.metadata or {}
+        if b'genome_rows' not in metadata:
+            parquet_file.close()
+            # Stores built before fixed-size row groups locate genomes differently
+            raise OSError(f'{store_path} has no genome row index')
+        genomes = json.loads(metadata[b'genome_rows'])
+        id_field = metadata[b'id_field'].decode()
+
+        # First row of every row group, plus the total row count
+        group_starts = [0]
+        for idx in range(parquet_file.metadata.num_row_groups):
+            group_starts.append(group_starts[-1] + parquet_file.metadata.row_group(idx).num_rows)
+
+        _columnar_stores[store_path] = (mtime, parquet_file, genomes, id_field, group_starts)
+        return parquet_file, genomes, id_field, group_starts
+
+
+def read_columnar_rows(tsv_file_path, genome_id, start_row=0, end_row=None, columns=None):
+    """
+    Read rows of one genome from the consolidated columnar store built by build_ColumnarStore.
+
+    Parameters:
+    tsv_file_path (str): Path of the per-genome TSV the rows were compacted from
+    genome_id (str): Genome whose rows are requested
+    start_row (int, optional): First row of the genome to return (0-based)
+    end_row (int, optional): Last row to return (inclusive), None returns all
+    columns (list, optional): Fields to return, None returns every field
+
+    Returns:
+    list: Rows in the same shape as the read_*_file readers, or None when the store is
+    missing, older than the TSV file or does not contain the genome
+    """
+    store_path = get_columnar_store_path(tsv_file_path)
+    try:
+        store_mtime = os.path.getmtime(store_path)
+    except OSError:
+        _close_columnar_store(store_path)
+        return None
+
+    try:
+        if store_mtime < os.path.getmtime(tsv_file_path):
+            return None
+        parquet_file, genomes, id_field, group_starts = _open_columnar_store(store_path, store_mtime)
+    except (OSError, ImportError):
+        return None
+
+    if genome_id not in genomes:
+        return None
+
+    genome_start, row_count = genomes[genome_id]
+    stop_row = row_count if end_row is None else min(end_row + 1, row_count)
+    if start_row >= stop_row:
+        return []
+
+    read_columns = None
+    if columns:
+        read_columns = [
+            'genome_id' if column == id_field else column
+            for column in columns if column != 'id' and column in parquet_file.schema_arrow.names + [id_field]
+        ]
+
+    # Decode only the row groups that hold the requested rows
+    first_row, last_row = genome_start + start_row, genome_start + stop_row - 1
+    first_group = bisect_right(group_starts, first_row) - 1
+    last_group = bisect_right(group_starts, last_row) - 1
+    try:
+        table = parquet_file.read_row_groups(range(first_group, last_group + 1), columns=read_columns)
+    except (OSError, ValueError):
+        # The handle was closed by another thread that saw the store replaced
+        return None
+    rows = table.slice(first_row - group_starts[first_group], stop_row - start_row).to_pylist()
+
+    result = []
+    for idx, row in enumerate(rows, start_row + 1):
+        item = {"id": idx}
+        for key, value in row.items():
+            if key == 'genome_id':
+                key = id_field
+            # ARG files keep "nan" for missing numeric values
+            elif value is None and key in ('best_identities', 'aro'):
+                value = "nan"
+            item[key] = value
+        result.append(item)
+
+    return result
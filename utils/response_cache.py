@@ -0,0 +1,60 @@
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+TABLE_CACHE_ALIAS = 'table_responses'
+GLOBAL_DATASET = '__all__'
+
+
+def get_table_cache():
+    return caches[TABLE_CACHE_ALIAS]
+
+
+def canonical_body(data):
+    """
+    Serialize a request body so that key order and whitespace do not change the cache key.
+    """
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def get_dataset_version(dataset):
+    return get_table_cache().get_or_set(f'table_version:{dataset}', uuid.uuid4().hex, timeout=None)
+
+
+def bump_dataset_version(dataset=GLOBAL_DATASET):
+    """
+    Invalidate every cached response of a dataset (or of all datasets) by moving to a new version.
+
+    The version is a random token rather than a counter: cache incr is a read followed by
+    a write, so concurrent bumps from several processes could collapse into one. Any
+    written token differs from the versions already used in cache keys.
+    """
+    get_table_cache().set(f'table_version:{dataset}', uuid.uuid4().hex, timeout=None)
+
+
+class TableCacheEntry:
+    """
+    Cache slot of one table request: the key derived from the endpoint, the dataset
+    versions and the canonical body, its ETag and the cached payload (None on a miss).
+    """
+
+    def __init__(self, namespace, dataset, body):
+        versions = f'{get_dataset_version(GLOBAL_DATASET)}.{get_dataset_version(dataset)}'
+        digest = hashlib.md5(f'{namespace}|{versions}|{canonical_body(body)}'.encode()).hexdigest()
+
+        self.key = f'table:{namespace}:{digest}'
+        self.etag = f'"{digest}"'
+        self.payload = get_table_cache().get(self.key)
+
+    def is_not_modified(self, request):
+        if_none_match = request.headers.get('If-None-Match', '')
+        return self.payload is not None and (
+            if_none_match.strip() == '*' or self.etag in [tag.strip() for tag in if_none_match.split(',')]
+        )
+
+    def store(self, payload):
+        self.payload = payload
+        get_table_cache().set(self.key, payload, timeout=settings.TABLE_RESPONSE_CACHE_TIMEOUT)
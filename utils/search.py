@@ -0,0 +1,98 @@
+from functools import reduce
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Greatest
+from django.db.models.lookups import IContains
+
+TRIGRAM_OPCLASS = 'gin_trgm_ops'
+SEARCH_RANK_FIELD = 'search_rank'
+
+TEXT_FIELDS = (models.CharField, models.TextField)
+
+
+@models.Field.register_lookup
+class ILikeContains(IContains):
+    """
+    Case-insensitive substring match compiled to ILIKE on PostgreSQL.
+
+    icontains compiles to UPPER(col::text) LIKE UPPER(%s), which an index on the bare
+    column cannot serve; col ILIKE %s is answered by its GIN trigram index. Non-text
+    columns are cast to text as icontains does. Other databases fall back to icontains.
+    """
+    lookup_name = 'ilike_contains'
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        if not isinstance(self.lhs.output_field, TEXT_FIELDS):
+            lhs_sql = f'{lhs_sql}::text'
+        return f'{lhs_sql} ILIKE {rhs_sql}', [*lhs_params, *rhs_params]
+
+
+def get_trigram_fields(model):
+    """
+    Fields of the model covered by a GIN trigram index declared in Meta.indexes.
+    """
+    fields = set()
+    for index in model._meta.indexes:
+        if TRIGRAM_OPCLASS in getattr(index, 'opclasses', ()):
+            fields.update(index.fields)
+    return fields
+
+
+def get_model_field(model, field_name):
+    try:
+        return model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+
+
+def get_field_search_q(model, field_name, value, text_lookup='startswith'):
+    """
+    Build the search condition for one field: array fields use containment (GIN), other
+    fields keep text_lookup, whose LIKE the GIN trigram indexes of text columns serve.
+    """
+    value = value.strip()
+    field = get_model_field(model, field_name)
+
+    if isinstance(field, ArrayField):
+        return Q(**{f'{field_name}__contains': [value]})
+
+    return Q(**{f'{field_name}__{text_lookup}': value})
+
+
+def get_ranked_search_fields(model, search_fields):
+    """
+    Text fields of search_fields used by the ranked multi-field search, restricted to the
+    trigram indexed ones when the model declares any.
+    """
+    text_fields = [
+        field_name for field_name in search_fields or []
+        if isinstance(get_model_field(model, field_name), TEXT_FIELDS)
+    ]
+    trigram_fields = get_trigram_fields(model)
+    indexed_fields = [field_name for field_name in text_fields if field_name in trigram_fields]
+    return indexed_fields or text_fields
+
+
+def apply_ranked_search(queryset, fields, value):
+    """
+    Keep rows where any of the fields contains the value and annotate them with
+    search_rank, the best trigram similarity between the value and those fields.
+    """
+    value = value.strip()
+    if not fields:
+        return queryset.none()
+
+    similarities = [TrigramSimilarity(field_name, value) for field_name in fields]
+    rank = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+    match = reduce(lambda q, field_name: q | Q(**{f'{field_name}__ilike_contains': value}), fields, Q())
+
+    return queryset.filter(match).annotate(**{SEARCH_RANK_FIELD: rank})
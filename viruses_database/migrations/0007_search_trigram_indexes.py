@@ -0,0 +1,76 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("viruses_database", "0006_remove_magvirusescrisprcas_consensus_prediction_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="mv_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="mv_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organism_name"], name="umv_organism_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["species"], name="umv_species_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="mv_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="mv_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="mv_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product"], name="umv_product_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"], name="umv_description_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferred_name"], name="umv_preferred_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,182 @@
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("viruses_database", "0007_search_trigram_indexes"),
+    ]
+
+    operations = [
+        # GiST operator classes for the plain genome id and contig_id columns of the indexes
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="magvirusesprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusestrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusescrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusescrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusesanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusesvirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusesantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magvirusestransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusesprotein",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusestrna",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusescrisprcas",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusescrispr",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusesanticrisprannotation",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusesvirulencefactor",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusesantibioticresistance",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="unmagvirusestransmembranehelices",
+            name="location",
+            field=django.contrib.postgres.fields.ranges.BigIntegerRangeField(blank=True, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusestrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusescrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesvirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusestransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="mv_tmh_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_protein_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusestrna",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_trna_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusescrisprcas",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_cas_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesanticrisprannotation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_acr_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesvirulencefactor",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_vf_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesantibioticresistance",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_arg_location_gist_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusestransmembranehelices",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["viruses_id", "contig_id", "location"], name="umv_tmh_location_gist_idx"
+            ),
+        ),
+    ]
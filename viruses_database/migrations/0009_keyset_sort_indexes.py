@@ -0,0 +1,62 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("viruses_database", "0008_genome_location_ranges"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=models.Index(fields=["organism_name", "id"], name="mv_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=models.Index(fields=["species", "id"], name="mv_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=models.Index(fields=["total_sequence_length", "id"], name="mv_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magviruses",
+            index=models.Index(fields=["gc_content", "id"], name="mv_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=models.Index(fields=["viruses_id", "id"], name="mv_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="magvirusesprotein",
+            index=models.Index(fields=["protein_id", "id"], name="mv_protein_protein_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=models.Index(fields=["organism_name", "id"], name="umv_genome_organism_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=models.Index(fields=["species", "id"], name="umv_genome_species_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=models.Index(fields=["total_sequence_length", "id"], name="umv_genome_length_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagviruses",
+            index=models.Index(fields=["gc_content", "id"], name="umv_genome_gc_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=models.Index(fields=["viruses_id", "id"], name="umv_protein_genome_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusesprotein",
+            index=models.Index(fields=["protein_id", "id"], name="umv_protein_protein_keyset_idx"),
+        ),
+    ]
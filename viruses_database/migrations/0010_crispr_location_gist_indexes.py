@@ -0,0 +1,23 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("viruses_database", "0009_keyset_sort_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="magvirusescrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="mv_crispr_location_gist_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="unmagvirusescrispr",
+            index=django.contrib.postgres.indexes.GistIndex(fields=["cas", "location"], name="umv_crispr_location_gist_idx"),
+        ),
+    ]
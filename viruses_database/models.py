@@ -1,7 +1,7 @@
 from django.db import models
 
-from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.fields import ArrayField, BigIntegerRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
 
 
 # MAG Viruses Models.
@@ -31,6 +31,12 @@ class MAGViruses(models.Model):
         verbose_name_plural = "MAG Viruses Genomes"
         indexes = [
             GinIndex(fields=['viruses_id'], name='mv_viruses_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='mv_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='mv_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='mv_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='mv_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='mv_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='mv_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -70,6 +76,7 @@ class MAGVirusesProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -104,6 +111,12 @@ class MAGVirusesProtein(models.Model):
         verbose_name_plural = "MAG Viruses Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='mv_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='mv_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='mv_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='mv_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_protein_location_gist_idx'),
+            models.Index(fields=['viruses_id', 'id'], name='mv_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='mv_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -122,6 +135,7 @@ class MAGVirusesTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -130,6 +144,9 @@ class MAGVirusesTRNA(models.Model):
     class Meta:
         verbose_name = "MAG Viruses tRNA Annotation"
         verbose_name_plural = "MAG Viruses tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -141,6 +158,7 @@ class MAGVirusesCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -154,6 +172,7 @@ class MAGVirusesCRISPRCas(models.Model):
         verbose_name_plural = "MAG Viruses CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='mv_cas_subtype_gin_idx'),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -165,6 +184,7 @@ class MAGVirusesCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -172,6 +192,10 @@ class MAGVirusesCRISPR(models.Model):
     class Meta:
         verbose_name = "MAG Viruses CRISPR Annotation"
         verbose_name_plural = "MAG Viruses CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='mv_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -189,6 +213,7 @@ class MAGVirusesAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -205,6 +230,9 @@ class MAGVirusesAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "MAG Viruses Anti-CRISPR Annotation"
         verbose_name_plural = "MAG Viruses Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.viruses_id})"
@@ -214,6 +242,7 @@ class MAGVirusesVirulenceFactor(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -240,6 +269,9 @@ class MAGVirusesVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "MAG Viruses Virulence Factor"
         verbose_name_plural = "MAG Viruses Virulence Factors"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -249,6 +281,7 @@ class MAGVirusesAntibioticResistance(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -279,6 +312,7 @@ class MAGVirusesAntibioticResistance(models.Model):
         verbose_name_plural = "MAG Viruses Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='mv_arg_type_gin_idx'),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -289,6 +323,7 @@ class MAGVirusesTransmembraneHelices(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -301,6 +336,9 @@ class MAGVirusesTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "MAG Viruses Transmembrane Helix"
         verbose_name_plural = "MAG Viruses Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='mv_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
@@ -347,6 +385,12 @@ class UnMAGViruses(models.Model):
         verbose_name_plural = "UnMAG Viruses Genomes"
         indexes = [
             GinIndex(fields=['viruses_id'], name='umv_viruses_id_gin_idx'),
+            GinIndex(fields=['organism_name'], name='umv_organism_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['species'], name='umv_species_trgm_idx', opclasses=['gin_trgm_ops']),
+            models.Index(fields=['organism_name', 'id'], name='umv_genome_organism_keyset_idx'),
+            models.Index(fields=['species', 'id'], name='umv_genome_species_keyset_idx'),
+            models.Index(fields=['total_sequence_length', 'id'], name='umv_genome_length_keyset_idx'),
+            models.Index(fields=['gc_content', 'id'], name='umv_genome_gc_keyset_idx'),
         ]
 
     def __str__(self):
@@ -386,6 +430,7 @@ class UnMAGVirusesProtein(models.Model):
     orf_prediction_source = models.CharField(max_length=255, blank=True)
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     phase = models.PositiveIntegerField(null=True, blank=True)
 
@@ -420,6 +465,12 @@ class UnMAGVirusesProtein(models.Model):
         verbose_name_plural = "UnMAG Viruses Protein Annotations"
         indexes = [
             GinIndex(fields=['cog_category'], name='umv_cog_category_gin_idx'),
+            GinIndex(fields=['product'], name='umv_product_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='umv_description_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['preferred_name'], name='umv_preferred_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_protein_location_gist_idx'),
+            models.Index(fields=['viruses_id', 'id'], name='umv_protein_genome_keyset_idx'),
+            models.Index(fields=['protein_id', 'id'], name='umv_protein_protein_keyset_idx'),
         ]
 
     def __str__(self):
@@ -438,6 +489,7 @@ class UnMAGVirusesTRNA(models.Model):
 
     start = models.PositiveIntegerField(null=True, blank=True)
     end = models.PositiveIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
     length = models.PositiveIntegerField(blank=True, null=True)
 
@@ -446,6 +498,9 @@ class UnMAGVirusesTRNA(models.Model):
     class Meta:
         verbose_name = "UnMAG Viruses tRNA Annotation"
         verbose_name_plural = "UnMAG Viruses tRNA Annotations"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_trna_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.trna_id} ({self.trna_type})"
@@ -457,6 +512,7 @@ class UnMAGVirusesCRISPRCas(models.Model):
     cas_id = models.CharField(max_length=100, blank=True)
     cas_start = models.BigIntegerField(null=True, blank=True)
     cas_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     cas_subtype = ArrayField(
         base_field=models.CharField(max_length=50),
         default=list,
@@ -470,6 +526,7 @@ class UnMAGVirusesCRISPRCas(models.Model):
         verbose_name_plural = "UnMAG Viruses CRISPRC CAS Annotations"
         indexes = [
             GinIndex(fields=['cas_subtype'], name='umv_cas_subtype_gin_idx'),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_cas_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -481,6 +538,7 @@ class UnMAGVirusesCRISPR(models.Model):
     crispr_id = models.CharField(max_length=100, db_index=True, blank=True)
     crispr_start = models.BigIntegerField(null=True, blank=True)
     crispr_end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     crispr_subtype = models.CharField(max_length=255, blank=True)
     repeat_sequence = models.TextField(blank=True)
     consensus_prediction = models.CharField(max_length=255, blank=True)
@@ -488,6 +546,10 @@ class UnMAGVirusesCRISPR(models.Model):
     class Meta:
         verbose_name = "UnMAG Viruses CRISPR Annotation"
         verbose_name_plural = "UnMAG Viruses CRISPR Annotations"
+        indexes = [
+            # 重叠查询经 cas 外键限定基因组与 contig 后按区间过滤
+            GistIndex(fields=['cas', 'location'], name='umv_crispr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.crispr_id} ({self.crispr_subtype})"
@@ -505,6 +567,7 @@ class UnMAGVirusesAntiCRISPRAnnotation(models.Model):
 
     start = models.BigIntegerField(null=True, blank=True)
     end = models.BigIntegerField(null=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     strand = models.IntegerField(default=0, choices=STRAND)
 
     classification = models.CharField(max_length=255, blank=True)
@@ -521,6 +584,9 @@ class UnMAGVirusesAntiCRISPRAnnotation(models.Model):
     class Meta:
         verbose_name = "UnMAG Viruses Anti-CRISPR Annotation"
         verbose_name_plural = "UnMAG Viruses Anti-CRISPR Annotations"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_acr_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} ({self.viruses_id})"
@@ -530,6 +596,7 @@ class UnMAGVirusesVirulenceFactor(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     vf_database = models.CharField(max_length=255, blank=True)
     vfseq_id = models.CharField(max_length=255, blank=True)
@@ -556,6 +623,9 @@ class UnMAGVirusesVirulenceFactor(models.Model):
     class Meta:
         verbose_name = "UnMAG Viruses Virulence Factor"
         verbose_name_plural = "UnMAG Viruses Virulence Factors"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_vf_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id} - {self.vf_name or 'VF'}"
@@ -565,6 +635,7 @@ class UnMAGVirusesAntibioticResistance(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, db_index=True, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
     product = models.TextField(blank=True)
 
     arg_database = models.CharField(max_length=255, blank=True)
@@ -595,6 +666,7 @@ class UnMAGVirusesAntibioticResistance(models.Model):
         verbose_name_plural = "UnMAG Viruses Antibiotic Resistance Genes"
         indexes = [
             GinIndex(fields=['drug_class'], name='umv_arg_type_gin_idx'),
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_arg_location_gist_idx'),
         ]
 
     def __str__(self):
@@ -605,6 +677,7 @@ class UnMAGVirusesTransmembraneHelices(models.Model):
     viruses_id = models.CharField(max_length=100, db_index=True, blank=True)
     contig_id = models.CharField(max_length=100, blank=True)
     protein_id = models.CharField(max_length=100, blank=True)
+    location = BigIntegerRangeField(null=True, blank=True)
 
     length = models.PositiveIntegerField(null=True, blank=True)
     predicted_tmh_count = models.PositiveIntegerField(null=True, blank=True)
@@ -617,6 +690,9 @@ class UnMAGVirusesTransmembraneHelices(models.Model):
     class Meta:
         verbose_name = "UnMAG Viruses Transmembrane Helix"
         verbose_name_plural = "UnMAG Viruses Transmembrane Helices"
+        indexes = [
+            GistIndex(fields=['viruses_id', 'contig_id', 'location'], name='umv_tmh_location_gist_idx'),
+        ]
 
     def __str__(self):
         return f"{self.protein_id}"
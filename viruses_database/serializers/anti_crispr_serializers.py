@@ -6,10 +6,10 @@ from viruses_database.models import MAGVirusesAntiCRISPRAnnotation, UnMAGViruses
 class MAGVirusesAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesAntiCRISPRAnnotationSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesAntiCRISPRAnnotation
-        fields = '__all__'
+        exclude = ('location',)
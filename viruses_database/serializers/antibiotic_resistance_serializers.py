@@ -6,10 +6,10 @@ from viruses_database.models import MAGVirusesAntibioticResistance, UnMAGViruses
 class MAGVirusesAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesAntibioticResistanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesAntibioticResistance
-        fields = '__all__'
+        exclude = ('location',)
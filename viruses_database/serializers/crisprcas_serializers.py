@@ -6,7 +6,7 @@ from viruses_database.models import MAGVirusesCRISPRCas, MAGVirusesCRISPR, UnMAG
 class MAGVirusesCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class MAGVirusesCRISPRSerializer(serializers.ModelSerializer):
@@ -14,13 +14,13 @@ class MAGVirusesCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGVirusesCRISPR
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesCRISPRCasSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesCRISPRCas
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesCRISPRSerializer(serializers.ModelSerializer):
@@ -28,4 +28,4 @@ class UnMAGVirusesCRISPRSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGVirusesCRISPR
-        fields = '__all__'
+        exclude = ('location',)
@@ -1,7 +1,8 @@
 from rest_framework import serializers
-import pandas as pd
 import os
 
+from utils.annotation_summary import AnnotationSummaryMixin
+from utils.read_files import count_tsv_proteins, count_tsv_rows
 from viruses_database.models import MAGViruses, UnMAGViruses, UnMAGVirusesProtein, UnMAGVirusesAntibioticResistance, \
     UnMAGVirusesTRNA, UnMAGVirusesCRISPR, UnMAGVirusesAntiCRISPRAnnotation, \
     UnMAGVirusesVirulenceFactor, UnMAGVirusesTransmembraneHelices, \
@@ -16,7 +17,7 @@ class MAGVirusesSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class MAGVirusesDetailSerializer(serializers.ModelSerializer):
+class MAGVirusesDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -25,41 +26,41 @@ class MAGVirusesDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Viruses'
+    summary_mag_status = 'MAG'
+
     class Meta:
         model = MAGViruses
         fields = '__all__'
 
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Viruses/MAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGVirusesProtein.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return MAGVirusesTRNA.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return MAGVirusesCRISPR.objects.filter(cas__viruses_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return MAGVirusesAntiCRISPRAnnotation.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return MAGVirusesVirulenceFactor.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         return None
         # return MAGVirusesAntibioticResistance.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Viruses/MAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
         # return MAGVirusesTransmembraneHelices.objects.filter(viruses_id=obj.unique_id).count()
 
 
@@ -69,7 +70,7 @@ class UnMAGVirusesSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class UnMAGVirusesDetailSerializer(serializers.ModelSerializer):
+class UnMAGVirusesDetailSerializer(AnnotationSummaryMixin, serializers.ModelSerializer):
     protein_count = serializers.SerializerMethodField()
     trna_count = serializers.SerializerMethodField()
     crispr_count = serializers.SerializerMethodField()
@@ -78,30 +79,32 @@ class UnMAGVirusesDetailSerializer(serializers.ModelSerializer):
     arg_count = serializers.SerializerMethodField()
     tmh_count = serializers.SerializerMethodField()
 
+    summary_microbe = 'Viruses'
+    summary_mag_status = 'unMAG'
+
     class Meta:
         model = UnMAGViruses
         fields = '__all__'
 
     # def get_protein_count(self, obj):
     #     return UnMAGVirusesProtein.objects.filter(viruses_id=obj.unique_id).count()
-    def get_protein_count(self, obj):
+    def compute_protein_count(self, obj):
         profile_file = f'/delta_microbia/new_data/Viruses/unMAG/proteins/{obj.unique_id}.tsv'
         if not os.path.exists(profile_file):
             return 0
-        df = pd.read_csv(profile_file, sep='\t')
-        return len(df)
+        return count_tsv_rows(profile_file)
         # return MAGVirusesProtein.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_trna_count(self, obj):
+    def compute_trna_count(self, obj):
         return UnMAGVirusesTRNA.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_crispr_count(self, obj):
+    def compute_crispr_count(self, obj):
         return UnMAGVirusesCRISPR.objects.filter(cas__viruses_id=obj.unique_id).count()
 
-    def get_anti_crispr_count(self, obj):
+    def compute_anti_crispr_count(self, obj):
         return UnMAGVirusesAntiCRISPRAnnotation.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_virulence_factor_count(self, obj):
+    def compute_virulence_factor_count(self, obj):
         return UnMAGVirusesVirulenceFactor.objects.filter(viruses_id=obj.unique_id).count()
 
     # def get_arg_count(self, obj):
@@ -110,14 +113,12 @@ class UnMAGVirusesDetailSerializer(serializers.ModelSerializer):
     # def get_tmh_count(self, obj):
     #     return UnMAGVirusesTransmembraneHelices.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_arg_count(self, obj):
+    def compute_arg_count(self, obj):
         return None
         # return MAGVirusesAntibioticResistance.objects.filter(viruses_id=obj.unique_id).count()
 
-    def get_tmh_count(self, obj):
+    def compute_tmh_count(self, obj):
         tmh_file = f'/delta_microbia/new_data/Viruses/unMAG/tmhs/{obj.unique_id}.tsv'
         if not os.path.exists(tmh_file):
             return 0
-        df = pd.read_csv(tmh_file, sep='\t')
-        unique_protein_ids = df['Protein_ID'].unique()
-        return len(unique_protein_ids)
+        return count_tsv_proteins(tmh_file)
@@ -6,10 +6,10 @@ from viruses_database.models import MAGVirusesProtein, UnMAGVirusesProtein
 class MAGVirusesProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesProtein
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesProteinSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesProtein
-        fields = '__all__'
+        exclude = ('location',)
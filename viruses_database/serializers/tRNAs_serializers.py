@@ -6,10 +6,10 @@ from viruses_database.models import MAGVirusesTRNA, UnMAGVirusesTRNA
 class MAGVirusesTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesTRNA
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesTRNASerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesTRNA
-        fields = '__all__'
+        exclude = ('location',)
@@ -15,7 +15,7 @@ class MAGVirusesTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MAGVirusesTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesHelicesSerializer(serializers.ModelSerializer):
@@ -29,4 +29,4 @@ class UnMAGVirusesTransmembraneHelicesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UnMAGVirusesTransmembraneHelices
-        fields = '__all__'
+        exclude = ('location',)
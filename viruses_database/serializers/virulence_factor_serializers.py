@@ -6,10 +6,10 @@ from viruses_database.models import MAGVirusesVirulenceFactor, UnMAGVirusesVirul
 class MAGVirusesVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = MAGVirusesVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
 
 
 class UnMAGVirusesVirulenceFactorSerializer(serializers.ModelSerializer):
     class Meta:
         model = UnMAGVirusesVirulenceFactor
-        fields = '__all__'
+        exclude = ('location',)
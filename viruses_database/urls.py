@@ -13,7 +13,9 @@ urlpatterns = [
     path('genome_batch_download', genomes_views.VirusesGenomesBatchDownloadView.as_view()),
     path('genome_batch_download_unmag', genomes_views.UnMAGVirusesGenomesBatchDownloadView.as_view()),
     path('proteins', proteins_views.VirusesProteinsView.as_view()),
+    path('proteins_fields', proteins_views.VirusesProteinsFieldsView.as_view()),
     path('proteins_unmag', proteins_views.UnMAGVirusesProteinsView.as_view()),
+    path('proteins_fields_unmag', proteins_views.UnMAGVirusesProteinsFieldsView.as_view()),
     path('proteins_filter_options', proteins_views.VirusesProteinsFilterOptionsView.as_view()),
     path('proteins_filter_options_unmag', proteins_views.UnMAGVirusesProteinsFilterOptionsView.as_view()),
     path('protein_single_download', proteins_views.VirusesProteinsSingleDownloadView.as_view()),
@@ -21,7 +23,9 @@ urlpatterns = [
     path('protein_batch_download', proteins_views.VirusesProteinsBatchDownloadView.as_view()),
     path('protein_batch_download_unmag', proteins_views.UnMAGVirusesProteinsBatchDownloadView.as_view()),
     path('tRNAs', tRNAs_views.VirusesTRNAsView.as_view()),
+    path('tRNAs_fields', tRNAs_views.VirusesTRNAsFieldsView.as_view()),
     path('tRNAs_unmag', tRNAs_views.UnMAGVirusesTRNAsView.as_view()),
+    path('tRNAs_fields_unmag', tRNAs_views.UnMAGVirusesTRNAsFieldsView.as_view()),
     path('tRNAs_filter_options', tRNAs_views.VirusesTRNAFilterOptionsView.as_view()),
     path('tRNAs_filter_options_unmag', tRNAs_views.UnMAGVirusesTRNAFilterOptionsView.as_view()),
     path('tRNA_single_download', tRNAs_views.VirusesTRNASingleDownloadView.as_view()),
@@ -40,7 +44,10 @@ urlpatterns = [
     path('CRISPR_Cas_system_batch_download_unmag',
          crisprcas_views.UnMAGVirusesCRISPRCasSystemsBatchDownloadView.as_view()),
     path('anti_crispr_annotations', anti_cripsr_views.VirusesAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields', anti_cripsr_views.VirusesAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_unmag', anti_cripsr_views.UnMAGVirusesAntiCRISPRAnnotationsView.as_view()),
+    path('anti_crispr_annotations_fields_unmag',
+         anti_cripsr_views.UnMAGVirusesAntiCRISPRAnnotationsFieldsView.as_view()),
     path('anti_crispr_annotations_filter_options',
          anti_cripsr_views.VirusesAntiCRISPRAnnotationsFilterOptionsView.as_view()),
     path('anti_crispr_annotations_filter_options_unmag',
@@ -65,7 +72,10 @@ urlpatterns = [
     path('virulence_factor_batch_download_unmag',
          virulence_factor_views.UnMAGVirusesVirulenceFactorsBatchDownloadView.as_view()),
     path('antibiotic_resistances', antibiotic_resistance_views.VirusesAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields', antibiotic_resistance_views.VirusesAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_unmag', antibiotic_resistance_views.UnMAGVirusesAntibioticResistancesView.as_view()),
+    path('antibiotic_resistances_fields_unmag',
+         antibiotic_resistance_views.UnMAGVirusesAntibioticResistancesFieldsView.as_view()),
     path('antibiotic_resistances_filter_options',
          antibiotic_resistance_views.VirusesAntibioticResistancesFilterOptionsView.as_view()),
     path('antibiotic_resistances_filter_options_unmag',
@@ -111,6 +121,12 @@ urlpatterns = [
     path('genome_detail_transmembrane_helices_unmag',
          genomes_views.UnMAGVirusesGenomeTransmembraneHelicesView.as_view()
          ),
+    path('genome_bundle', genomes_views.VirusesGenomeBundleView.as_view()),
+    path('genome_bundle_unmag', genomes_views.UnMAGVirusesGenomeBundleView.as_view()),
     path('genome_fasta', genomes_views.VirusesGenomeFASTAView.as_view()),
     path('genome_fasta_unmag', genomes_views.UnMAGVirusesGenomeFASTAView.as_view()),
+    path('genome_tracks', genomes_views.VirusesGenomeTrackView.as_view()),
+    path('genome_tracks_unmag', genomes_views.UnMAGVirusesGenomeTrackView.as_view()),
+    path('genome_overlaps', genomes_views.VirusesGenomeOverlapView.as_view()),
+    path('genome_overlaps_unmag', genomes_views.UnMAGVirusesGenomeOverlapView.as_view()),
 ]
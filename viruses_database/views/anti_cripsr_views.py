@@ -10,13 +10,14 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from viruses_database.models import MAGVirusesAntiCRISPRAnnotation, UnMAGVirusesAntiCRISPRAnnotation
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from viruses_database.serializers.anti_crispr_serializers import MAGVirusesAntiCRISPRAnnotationSerializer, \
     UnMAGVirusesAntiCRISPRAnnotationSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -54,14 +55,22 @@ class VirusesAntiCRISPRAnnotationsView(GenericTableQueryView):
     queryset = MAGVirusesAntiCRISPRAnnotation.objects.all()
     serializer_class = MAGVirusesAntiCRISPRAnnotationSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('classification',)
+    deferred_fields = (
+        'mge_metadata', 'self_target_within_5kb', 'self_target_outside_5kb', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'position', 'contig_id', 'protein_id', 'start', 'end', 'strand', 'classification', 'aa_length'
     ]
 
 
+class VirusesAntiCRISPRAnnotationsFieldsView(GenericTableFieldsView):
+    table_view_class = VirusesAntiCRISPRAnnotationsView
+
+
 class VirusesAntiCRISPRAnnotationsFilterOptionsView(APIView):
     def get(self, request):
-        classification_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesAntiCRISPRClassifications').value
+        classification_values = get_filter_option('MAGVirusesAntiCRISPRClassifications')
 
         return Response({
             'classification': classification_values
@@ -99,18 +108,11 @@ class VirusesAntiCRISPRAnnotationsBatchDownloadView(GenericBatchDownloadView):
     model = MAGVirusesAntiCRISPRAnnotation
     entity_name = 'Anti-CRISPR'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for anti_crispr_annotation in queryset:
-            writer.writerow(to_csv_row(anti_crispr_annotation))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, anti_crispr_annotation):
+        return to_csv_row(anti_crispr_annotation)
 
 
 # UnMAG Anti CRISPR Annotation Views
@@ -120,14 +122,22 @@ class UnMAGVirusesAntiCRISPRAnnotationsView(GenericTableQueryView):
     queryset = UnMAGVirusesAntiCRISPRAnnotation.objects.all()
     serializer_class = UnMAGVirusesAntiCRISPRAnnotationSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('classification',)
+    deferred_fields = (
+        'mge_metadata', 'self_target_within_5kb', 'self_target_outside_5kb', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'position', 'contig_id', 'protein_id', 'start', 'end', 'strand', 'classification', 'aa_length'
     ]
 
 
+class UnMAGVirusesAntiCRISPRAnnotationsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGVirusesAntiCRISPRAnnotationsView
+
+
 class UnMAGVirusesAntiCRISPRAnnotationsFilterOptionsView(APIView):
     def get(self, request):
-        classification_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesAntiCRISPRClassifications').value
+        classification_values = get_filter_option('UnMAGVirusesAntiCRISPRClassifications')
 
         return Response({
             'classification': classification_values
@@ -165,15 +175,8 @@ class UnMAGVirusesAntiCRISPRAnnotationsBatchDownloadView(GenericBatchDownloadVie
     model = UnMAGVirusesAntiCRISPRAnnotation
     entity_name = 'Anti-CRISPR'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for anti_crispr_annotation in queryset:
-            writer.writerow(to_csv_row(anti_crispr_annotation))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, anti_crispr_annotation):
+        return to_csv_row(anti_crispr_annotation)
@@ -10,13 +10,14 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from viruses_database.models import MAGVirusesAntibioticResistance, UnMAGVirusesAntibioticResistance
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from viruses_database.serializers.antibiotic_resistance_serializers import MAGVirusesAntibioticResistanceSerializer, \
     UnMAGVirusesAntibioticResistanceSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -71,6 +72,10 @@ class VirusesAntibioticResistancesView(GenericTableQueryView):
     queryset = MAGVirusesAntibioticResistance.objects.all()
     serializer_class = MAGVirusesAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -79,10 +84,14 @@ class VirusesAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class VirusesAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = VirusesAntibioticResistancesView
+
+
 class VirusesAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('MAGVirusesAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('MAGVirusesAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -121,18 +130,11 @@ class VirusesAntibioticResistancesBatchDownloadView(GenericBatchDownloadView):
     model = MAGVirusesAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -145,6 +147,10 @@ class UnMAGVirusesAntibioticResistancesView(GenericTableQueryView):
     queryset = UnMAGVirusesAntibioticResistance.objects.all()
     serializer_class = UnMAGVirusesAntibioticResistanceSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('cutoff', 'drug_class')
+    deferred_fields = (
+        'snps_in_best_hit_aro', 'other_snps', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'arg_database', 'cutoff', 'drug_class'
     ]
@@ -153,10 +159,14 @@ class UnMAGVirusesAntibioticResistancesView(GenericTableQueryView):
         return get_antibiotic_resistance_filter_q(filters)
 
 
+class UnMAGVirusesAntibioticResistancesFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGVirusesAntibioticResistancesView
+
+
 class UnMAGVirusesAntibioticResistancesFilterOptionsView(APIView):
     def get(self, request):
-        cutoff_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesAntibioticResistanceCutoff').value
-        drug_class_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesAntibioticResistanceDrugClass').value
+        cutoff_values = get_filter_option('UnMAGVirusesAntibioticResistanceCutoff')
+        drug_class_values = get_filter_option('UnMAGVirusesAntibioticResistanceDrugClass')
 
         return Response({
             'cutoff': cutoff_values,
@@ -195,18 +205,11 @@ class UnMAGVirusesAntibioticResistancesBatchDownloadView(GenericBatchDownloadVie
     model = UnMAGVirusesAntibioticResistance
     entity_name = 'antibiotic_resistance'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for antibiotic_resistance in queryset:
-            writer.writerow(to_csv_row(antibiotic_resistance))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, antibiotic_resistance):
+        return to_csv_row(antibiotic_resistance)
 
     def get_filter_q(self, payload):
         return get_antibiotic_resistance_filter_q(payload)
@@ -3,17 +3,17 @@ from rest_framework.views import APIView
 from rest_framework import status
 
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse, FileResponse
+from django.http import HttpResponse
 from django.db.models import Q
 
 from io import StringIO
 import csv
 import os
-import gzip
-from Bio import SeqIO
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView, \
+    GenericGenomeBundleView, GenericGenomeFASTAView, GenericGenomeTrackView, \
+    GenericGenomeOverlapView
 from viruses_database.models import MAGViruses, UnMAGViruses, MAGVirusesProtein, UnMAGVirusesProtein, \
     MAGVirusesTRNA, UnMAGVirusesTRNA, MAGVirusesCRISPR, UnMAGVirusesCRISPR, \
     MAGVirusesAntiCRISPRAnnotation, UnMAGVirusesAntiCRISPRAnnotation, \
@@ -35,12 +35,14 @@ from viruses_database.serializers.transmembrane_helices_serializers import MAGVi
     UnMAGVirusesTransmembraneHelicesSerializer
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer, GenomeDetailSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 from utils.read_files import *
+from utils.file_cache import parsed_file_cache
 
 from MicrobialScope_api.constant import MEDIA_DATA_DIR
+from utils.file_serving import GENOME_FILE_TYPES
 
 
 def get_csv_header():
@@ -73,7 +75,7 @@ def get_genome_search_q(search_content):
     if search_content['field'] == 'viruses_id':
         return Q(**{f"{search_content['field']}__contains": [search_content['value'].strip()]})
 
-    return Q(**{f"{search_content['field']}__icontains": search_content['value']})
+    return Q(**{f"{search_content['field']}__ilike_contains": search_content['value']})
 
 
 # MAG Genome Views
@@ -82,7 +84,11 @@ class VirusesGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGViruses.objects.all()
     serializer_class = MAGVirusesSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'viruses_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'viruses_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -131,7 +137,7 @@ class VirusesGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_viruses_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_viruses_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -220,7 +226,7 @@ class VirusesGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_viruses_arg_file(arg_file)
+                args = parsed_file_cache.get(read_viruses_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -254,46 +260,20 @@ class VirusesGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_viruses_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_viruses_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class VirusesGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Viruses',
-                'MAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class VirusesGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'MAG'
 
 
 class VirusesGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesAssemblyLevel').value
+        assembly_level_values = get_filter_option('MAGVirusesAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -323,38 +303,8 @@ class VirusesGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'MAG', 'fna', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'MAG', 'gbk', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
-
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'MAG', 'gff', file_name)
-
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
-
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Viruses', 'MAG')
 
         return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
@@ -363,18 +313,11 @@ class VirusesGenomesBatchDownloadView(GenericBatchDownloadView):
     model = MAGViruses
     entity_name = 'genome'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
 
 # unMAG Genome Views
@@ -383,7 +326,11 @@ class UnMAGVirusesGenomesView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGViruses.objects.all()
     serializer_class = UnMAGVirusesSerializer
+    fast_list = True
+    fast_list_extra_fields = ('unique_id', 'viruses_id')
+    keyset_sort_fields = ('organism_name', 'species', 'total_sequence_length', 'gc_content')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('assembly_level',)
     search_fields = [
         'unique_id', 'viruses_id', 'organism_name', 'taxonomic_id', 'species', 'total_sequence_length', 'gc_content',
         'assembly_level', 'total_chromosomes', 'contig_n50', 'scaffold_n50'
@@ -431,7 +378,7 @@ class UnVirusesGenomeProteinsView(APIView):
             if not os.path.exists(protein_file):
                 proteins = []
             else:
-                proteins = read_viruses_protein_file(protein_file)
+                proteins = parsed_file_cache.get(read_viruses_protein_file, protein_file)
             return Response(proteins, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -520,7 +467,7 @@ class UnMAGVirusesGenomeAntibioticResistanceGenesView(APIView):
             if not os.path.exists(arg_file):
                 args = []
             else:
-                args = read_viruses_arg_file(arg_file)
+                args = parsed_file_cache.get(read_viruses_arg_file, arg_file)
             return Response(args, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
@@ -554,46 +501,20 @@ class UnMAGVirusesGenomeTransmembraneHelicesView(APIView):
             if not os.path.exists(tmh_file):
                 tmhs = []
             else:
-                tmhs = read_viruses_tmh_file(tmh_file)
+                tmhs = parsed_file_cache.get(read_viruses_tmh_file, tmh_file)
             return Response(tmhs, status=status.HTTP_200_OK)
 
         return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
 
 
-class UnMAGVirusesGenomeFASTAView(APIView):
-    def get(self, request):
-        serializer = GenomeDetailSerializer(data=request.query_params)
-
-        if serializer.is_valid():
-            genome_id = serializer.validated_data['genomeId']
-            fasta_path = os.path.join(
-                MEDIA_DATA_DIR,
-                'Viruses',
-                'unMAG',
-                'fna',
-                f'{genome_id}.fna.gz'
-            )
-            results = []
-
-            try:
-                with gzip.open(fasta_path, 'rt') as handle:
-                    for record in SeqIO.parse(handle, 'fasta'):
-                        results.append({
-                            'contig': record.id,
-                            'sequence': str(record.seq),
-                            'length': len(record.seq)
-                        })
-
-                return Response(results, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response('Error Occur!', status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response('Bad Request!', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGVirusesGenomeFASTAView(GenericGenomeFASTAView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'unMAG'
 
 
 class UnMAGVirusesGenomesFilterOptionsView(APIView):
     def get(self, request):
-        assembly_level_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesAssemblyLevel').value
+        assembly_level_values = get_filter_option('UnMAGVirusesAssemblyLevel')
 
         return Response({
             'assembly_level': assembly_level_values
@@ -623,55 +544,64 @@ class UnMAGVirusesGenomesSingleDownloadView(GenericSingleDownloadView):
                 }
             )
 
-        elif file_type == 'fasta':
-            file_name = f'{genome.unique_id}.fna.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'unMAG', 'fna', file_name)
+        elif file_type in GENOME_FILE_TYPES:
+            return self.get_genome_file_response(genome.unique_id, file_type, 'Viruses', 'unMAG')
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        elif file_type == 'gbk':
-            file_name = f'{genome.unique_id}.gbk.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'unMAG', 'gbk', file_name)
+class UnMAGVirusesGenomesBatchDownloadView(GenericBatchDownloadView):
+    model = UnMAGViruses
+    entity_name = 'genome'
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+    def get_csv_header(self):
+        return get_csv_header()
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
+    def to_csv_row(self, genome):
+        return to_csv_row(genome)
 
-        elif file_type == 'gff3':
-            file_name = f'{genome.unique_id}.gff.gz'
-            file_path = os.path.join(MEDIA_DATA_DIR, 'Viruses', 'unMAG', 'gff', file_name)
 
-            if not os.path.exists(file_path):
-                return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+class VirusesGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': VirusesGenomeDetailView,
+        'proteins': VirusesGenomeProteinsView,
+        'tRNAs': VirusesGenomeTRNAsView,
+        'crispr': VirusesGenomeCRISPRCasView,
+        'anti_crispr': VirusesGenomeAntiCRISPRView,
+        'virulence_factors': VirusesGenomeVirulenceFactorsView,
+        'antibiotic_resistance': VirusesGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': VirusesGenomeTransmembraneHelicesView,
+    }
 
-            response = FileResponse(open(file_path, 'rb'), as_attachment=True,
-                                    filename=file_name)
-            return response
 
-        return Response('Invalid Data Type', status=status.HTTP_400_BAD_REQUEST)
+class UnMAGVirusesGenomeBundleView(GenericGenomeBundleView):
+    panel_views = {
+        'detail': UnVirusesGenomeDetailView,
+        'proteins': UnVirusesGenomeProteinsView,
+        'tRNAs': UnMAGVirusesGenomeTRNAsView,
+        'crispr': UnMAGVirusesGenomeCRISPRCasView,
+        'anti_crispr': UnMAGVirusesGenomeAntiCRISPRView,
+        'virulence_factors': UnMAGVirusesGenomeVirulenceFactorsView,
+        'antibiotic_resistance': UnMAGVirusesGenomeAntibioticResistanceGenesView,
+        'transmembrane_helices': UnMAGVirusesGenomeTransmembraneHelicesView,
+    }
 
 
-class UnMAGVirusesGenomesBatchDownloadView(GenericBatchDownloadView):
-    model = UnMAGViruses
-    entity_name = 'genome'
+class VirusesGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'MAG'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
 
-        writer.writerow(get_csv_header())
+class UnMAGVirusesGenomeTrackView(GenericGenomeTrackView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'unMAG'
 
-        for genome in queryset:
-            writer.writerow(to_csv_row(genome))
 
-        buffer.seek(0)
+class VirusesGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'MAG'
+
 
-        return buffer
+class UnMAGVirusesGenomeOverlapView(GenericGenomeOverlapView):
+    microbe_dir = 'Viruses'
+    mag_dir = 'unMAG'
@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 from datetime import datetime
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from viruses_database.models import MAGVirusesProtein, UnMAGVirusesProtein
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from viruses_database.serializers.proteins_serializers import MAGVirusesProteinSerializer, UnMAGVirusesProteinSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -79,7 +80,14 @@ class VirusesProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = MAGVirusesProtein.objects.all()
     serializer_class = MAGVirusesProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('viruses_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -91,11 +99,15 @@ class VirusesProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class VirusesProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = VirusesProteinsView
+
+
 class VirusesProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesProteinStrand').value
+        strand_values = get_filter_option('MAGVirusesProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesProteinCOGCategory').value
+        cog_category_values = get_filter_option('MAGVirusesProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -133,18 +145,11 @@ class VirusesProteinsBatchDownloadView(GenericBatchDownloadView):
     model = MAGVirusesProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
@@ -156,7 +161,14 @@ class UnMAGVirusesProteinsView(GenericTableQueryView):
     pagination_class = CustomPostPagination
     queryset = UnMAGVirusesProtein.objects.all()
     serializer_class = UnMAGVirusesProteinSerializer
+    fast_list = True
+    keyset_sort_fields = ('viruses_id', 'protein_id')
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('strand', 'cog_category')
+    deferred_fields = (
+        'gos', 'kegg_ko', 'kegg_pathway', 'kegg_module', 'kegg_reaction', 'kegg_rclass', 'brite', 'kegg_tc',
+        'cazy', 'bigg_reaction', 'pfams', 'sequence'
+    )
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'orf_prediction_source', 'start', 'end', 'strand', 'phase', 'product',
         'function_prediction_source', 'cog_category', 'description', 'preferred_name', 'gos', 'ec', 'kegg_ko',
@@ -168,11 +180,15 @@ class UnMAGVirusesProteinsView(GenericTableQueryView):
         return get_protein_filter_q(filters)
 
 
+class UnMAGVirusesProteinsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGVirusesProteinsView
+
+
 class UnMAGVirusesProteinsFilterOptionsView(APIView):
     def get(self, request):
-        strand_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesProteinStrand').value
+        strand_values = get_filter_option('UnMAGVirusesProteinStrand')
 
-        cog_category_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesProteinCOGCategory').value
+        cog_category_values = get_filter_option('UnMAGVirusesProteinCOGCategory')
 
         return Response({
             'strand': strand_values,
@@ -210,18 +226,11 @@ class UnMAGVirusesProteinsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGVirusesProtein
     entity_name = 'protein'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for protein in queryset:
-            writer.writerow(to_csv_row(protein))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, protein):
+        return to_csv_row(protein)
 
     def get_filter_q(self, payload):
         return get_protein_filter_q(payload)
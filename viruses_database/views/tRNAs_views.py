@@ -10,12 +10,13 @@ from io import StringIO
 import csv
 import re
 
-from archaea_database.views.base import GenericTableQueryView, GenericSingleDownloadView, GenericBatchDownloadView
+from archaea_database.views.base import GenericTableQueryView, GenericTableFieldsView, GenericSingleDownloadView, \
+    GenericBatchDownloadView
 from viruses_database.models import MAGVirusesTRNA, UnMAGVirusesTRNA
 from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from viruses_database.serializers.tRNAs_serializers import MAGVirusesTRNASerializer, UnMAGVirusesTRNASerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -63,6 +64,8 @@ class VirusesTRNAsView(GenericTableQueryView):
     queryset = MAGVirusesTRNA.objects.all()
     serializer_class = MAGVirusesTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'viruses_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -71,9 +74,13 @@ class VirusesTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class VirusesTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = VirusesTRNAsView
+
+
 class VirusesTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesTRNATypes').value
+        trna_types = get_filter_option('MAGVirusesTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -110,18 +117,11 @@ class VirusesTRNABatchDownloadView(GenericBatchDownloadView):
     model = MAGVirusesTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -134,6 +134,8 @@ class UnMAGVirusesTRNAsView(GenericTableQueryView):
     queryset = UnMAGVirusesTRNA.objects.all()
     serializer_class = UnMAGVirusesTRNASerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('trna_type',)
+    deferred_fields = ('sequence',)
     search_fields = [
         'viruses_id', 'contig_id', 'trna_id', 'trna_type', 'start', 'end', 'strand', 'length'
     ]
@@ -142,9 +144,13 @@ class UnMAGVirusesTRNAsView(GenericTableQueryView):
         return get_trna_filter_q(filters)
 
 
+class UnMAGVirusesTRNAsFieldsView(GenericTableFieldsView):
+    table_view_class = UnMAGVirusesTRNAsView
+
+
 class UnMAGVirusesTRNAFilterOptionsView(APIView):
     def get(self, request):
-        trna_types = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesTRNATypes').value
+        trna_types = get_filter_option('UnMAGVirusesTRNATypes')
 
         return Response({
             'trna_type': trna_types
@@ -181,18 +187,11 @@ class UnMAGVirusesTRNABatchDownloadView(GenericBatchDownloadView):
     model = UnMAGVirusesTRNA
     entity_name = 'tRNA'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for trna in queryset:
-            writer.writerow(to_csv_row(trna))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, trna):
+        return to_csv_row(trna)
 
     def get_filter_q(self, payload):
         return get_trna_filter_q(payload)
@@ -16,7 +16,7 @@ from archaea_database.serializers.base import CommonTableRequestParamsSerializer
 from viruses_database.serializers.virulence_factor_serializers import MAGVirusesVirulenceFactorSerializer, \
     UnMAGVirusesVirulenceFactorSerializer
 
-from microbe_database.models import MicrobeFilterOptionsNew
+from utils.filter_options import get_filter_option
 
 from utils.pagination import CustomPostPagination
 
@@ -58,6 +58,7 @@ class VirusesVirulenceFactorsView(GenericTableQueryView):
     queryset = MAGVirusesVirulenceFactor.objects.all()
     serializer_class = MAGVirusesVirulenceFactorSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('vf_category',)
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'vf_database', 'vf_category'
     ]
@@ -65,7 +66,7 @@ class VirusesVirulenceFactorsView(GenericTableQueryView):
 
 class VirusesVirulenceFactorsFilterOptionsView(APIView):
     def get(self, request):
-        vf_category_values = MicrobeFilterOptionsNew.objects.get(key='MAGVirusesVirulenceFactorVFCategory').value
+        vf_category_values = get_filter_option('MAGVirusesVirulenceFactorVFCategory')
 
         return Response({
             'vf_category': vf_category_values,
@@ -103,18 +104,11 @@ class VirusesVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = MAGVirusesVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
-
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)
 
 
 # UnMAG Virulence Factor Views
@@ -124,6 +118,7 @@ class UnMAGVirusesVirulenceFactorsView(GenericTableQueryView):
     queryset = UnMAGVirusesVirulenceFactor.objects.all()
     serializer_class = UnMAGVirusesVirulenceFactorSerializer
     request_serializer_class = CommonTableRequestParamsSerializer
+    facet_fields = ('vf_category',)
     search_fields = [
         'viruses_id', 'contig_id', 'protein_id', 'vf_database', 'vf_category'
     ]
@@ -131,7 +126,7 @@ class UnMAGVirusesVirulenceFactorsView(GenericTableQueryView):
 
 class UnMAGVirusesVirulenceFactorsFilterOptionsView(APIView):
     def get(self, request):
-        vf_category_values = MicrobeFilterOptionsNew.objects.get(key='UnMAGVirusesVirulenceFactorVFCategory').value
+        vf_category_values = get_filter_option('UnMAGVirusesVirulenceFactorVFCategory')
 
         return Response({
             'vf_category': vf_category_values,
@@ -169,15 +164,8 @@ class UnMAGVirusesVirulenceFactorsBatchDownloadView(GenericBatchDownloadView):
     model = UnMAGVirusesVirulenceFactor
     entity_name = 'virulence_factor'
 
-    def build_csv(self, queryset):
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-
-        writer.writerow(get_csv_header())
-
-        for virulence_factor in queryset:
-            writer.writerow(to_csv_row(virulence_factor))
-
-        buffer.seek(0)
+    def get_csv_header(self):
+        return get_csv_header()
 
-        return buffer
+    def to_csv_row(self, virulence_factor):
+        return to_csv_row(virulence_factor)